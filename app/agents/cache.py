@@ -0,0 +1,298 @@
+"""
+에이전트 공용 캐시 모듈
+
+- LRUCache: 프로세스 내 LRU 캐시 (TTL, 최대 항목 수 기반 eviction)
+- SQLiteCache: 디스크 캐시 (TTL, 최대 항목 수 기반 eviction, 프로세스 재시작 후에도 유지)
+- TieredCache: LRUCache(1차) + SQLiteCache(2차) 2단 캐시
+  async 코드에서는 aget/aset을 사용한다. (2차 SQLite 조회/저장은 thread에서 실행하여 event loop를 막지 않음)
+
+모든 캐시는 hit/miss/eviction 카운터를 `stats()`로 노출한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Protocol
+
+# 캐시 파일 기본 경로: <repo root>/.cache
+CACHE_DIR = Path(
+    os.getenv("APP_CACHE_DIR", Path(__file__).resolve().parents[2] / ".cache")
+)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력값을 정규화(JSON 직렬화, key 정렬)한 뒤 SHA-256 hex digest로 변환합니다."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+
+def _hit_rate(hits: int, misses: int) -> float:
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+class LRUCache:
+    """thread-safe 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024, ttl_s: float | None = None):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._stats["misses"] += 1
+                return None
+
+            created_at, value = item
+            if self.ttl_s is not None and time.time() - created_at > self.ttl_s:
+                del self._items[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._items.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (time.time(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._items),
+                "hit_rate": _hit_rate(self._stats["hits"], self._stats["misses"]),
+            }
+
+
+class SQLiteCache:
+    """
+    SQLite 기반 디스크 캐시
+
+    값은 `serialize`/`deserialize`로 bytes 변환 후 BLOB으로 저장합니다. (기본: JSON)
+    최대 항목 수를 초과하면 마지막 접근 시각이 가장 오래된 항목부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        table: str = "cache",
+        max_entries: int = 100_000,
+        ttl_s: float | None = None,
+        serialize: Callable[[Any], bytes] | None = None,
+        deserialize: Callable[[bytes], Any] | None = None,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table}")
+
+        self.path = Path(path)
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._serialize = serialize or (
+            lambda value: json.dumps(value, ensure_ascii=False).encode("utf-8")
+        )
+        self._deserialize = deserialize or (lambda raw: json.loads(raw))
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table}(accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            raw, created_at = row
+            if self.ttl_s is not None and now - created_at > self.ttl_s:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self._stats["hits"] += 1
+
+        return self._deserialize(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        raw = self._serialize(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} "
+                "(key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, raw, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+            (overflow,),
+        )
+        self._stats["evictions"] += overflow
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 항목을 일괄 삭제하고 삭제 건수를 반환합니다."""
+        if self.ttl_s is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?",
+                (time.time() - self.ttl_s,),
+            )
+            self._conn.commit()
+            self._stats["expired"] += cursor.rowcount
+            return cursor.rowcount
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (size,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self.table}"
+            ).fetchone()
+            return {
+                **self._stats,
+                "size": size,
+                "hit_rate": _hit_rate(self._stats["hits"], self._stats["misses"]),
+            }
+
+
+class TieredCache:
+    """1차(프로세스 내 LRU) + 2차(디스크) 캐시. 2차 hit은 1차로 승격합니다."""
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend | None = None):
+        self.l1 = l1
+        self.l2 = l2
+
+    def get(self, key: str) -> Any | None:
+        value = self.l1.get(key)
+        if value is not None or self.l2 is None:
+            return value
+
+        value = self.l2.get(key)
+        if value is not None:
+            self.l1.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.l1.set(key, value)
+        if self.l2 is not None:
+            self.l2.set(key, value)
+
+    async def aget(self, key: str) -> Any | None:
+        """get의 비동기 버전. 1차 hit은 바로 반환하고, 2차 조회만 thread에서 실행합니다."""
+        value = self.l1.get(key)
+        if value is not None or self.l2 is None:
+            return value
+
+        value = await asyncio.to_thread(self.l2.get, key)
+        if value is not None:
+            self.l1.set(key, value)
+        return value
+
+    async def aset(self, key: str, value: Any) -> None:
+        """set의 비동기 버전. 2차 저장만 thread에서 실행합니다."""
+        self.l1.set(key, value)
+        if self.l2 is not None:
+            await asyncio.to_thread(self.l2.set, key, value)
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        if self.l2 is not None:
+            self.l2.delete(key)
+
+    def clear(self) -> None:
+        self.l1.clear()
+        if self.l2 is not None:
+            self.l2.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        l1_stats = self.l1.stats()
+        l2_stats = self.l2.stats() if self.l2 is not None else None
+        # 전체 miss = 2차 캐시까지 모두 miss된 경우
+        misses = l2_stats["misses"] if l2_stats else l1_stats["misses"]
+        hits = l1_stats["hits"] + (l2_stats["hits"] if l2_stats else 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": _hit_rate(hits, misses),
+            "l1": l1_stats,
+            "l2": l2_stats,
+        }
@@ -0,0 +1,2 @@
+# writer LLM 호출에 붙이는 tag (stream_mode="messages"에서 최종 메시지 토큰만 골라내는 용도)
+WRITER_STREAM_TAG = "composer_writer"
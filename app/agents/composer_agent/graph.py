@@ -1,14 +1,16 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
 # [중요] Judge Agent에 있는 State를 가져와서 씁니다
 from app.agents.judge_agent.state import JudgeAgentState
-from .nodes.writer import writer_node
+from .nodes.writer import awriter_node, writer_node
 
 # ==========================================
 #  그래프 빌드
 # ==========================================
 builder = StateGraph(JudgeAgentState)
-builder.add_node("writer", writer_node)
+# invoke/stream은 동기 함수, ainvoke/astream은 비동기 함수로 실행
+builder.add_node("writer", RunnableLambda(writer_node, afunc=awriter_node))
 builder.add_edge(START, "writer")
 builder.add_edge("writer", END)
 
@@ -1,7 +1,8 @@
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_upstage import ChatUpstage
+from app.agents.composer_agent.constants import WRITER_STREAM_TAG
+from app.agents.llm_registry import get_chat_model
 from app.agents.judge_agent.state import JudgeAgentState
 from app.agents.vet_agent.state import VetAgentState
 
@@ -9,7 +10,7 @@ from app.agents.vet_agent.state import VetAgentState
 # .env 파일 로드 (API Key 때문에 필수)
 load_dotenv()
 
-def writer_node(state: JudgeAgentState):
+def _build_writer_chain(state: JudgeAgentState):
 
     # 1. 데이터 꺼내기
     vet_field_keys = VetAgentState.model_fields.keys()
@@ -17,7 +18,9 @@ def writer_node(state: JudgeAgentState):
     val_result = state.validation_result # 검증 결과 (점수, 이유)
     
     # 2. LLM 설정 (창의적인 글쓰기를 위해 temperature를 약간 높임)
-    llm = ChatUpstage(model="solar-pro2", temperature=0.7)
+    # stream_mode="messages"로 실행하면 토큰 단위로 스트리밍되며, tag로 다른 LLM 호출과 구분
+    # (temperature 등 설정은 llm.yaml의 composer_writer profile)
+    llm = get_chat_model("composer_writer").with_config(tags=[WRITER_STREAM_TAG])
     
     # 3. 프롬프트 작성
     system_prompt = """당신은 다정하고 전문적인 '펫보험 상담사'입니다.
@@ -41,14 +44,27 @@ def writer_node(state: JudgeAgentState):
         """)
     ])
 
-    # 4. 실행
     chain = prompt | llm | StrOutputParser() 
-    
-    final_msg = chain.invoke({
+    inputs = {
         "vet_data": str(vet_data),
         "val_result": str(val_result)
-    })
+    }
+    return chain, inputs
+
+
+def writer_node(state: JudgeAgentState):
+    chain, inputs = _build_writer_chain(state)
+
+    # 4. 실행
+    final_msg = chain.invoke(inputs)
     
     
     # 5. State 업데이트
     return {"final_message": final_msg}
+
+
+async def awriter_node(state: JudgeAgentState):
+    """writer_node의 비동기 버전"""
+    chain, inputs = _build_writer_chain(state)
+    final_msg = await chain.ainvoke(inputs)
+    return {"final_message": final_msg}
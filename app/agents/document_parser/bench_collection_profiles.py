@@ -0,0 +1,178 @@
+"""collection 프로파일(quantization/on-disk/HNSW)별 recall@k, 검색 지연 시간, RAM 추정치를 비교하는 벤치마크.
+
+적재된 약관 collection의 point(vector + payload)를 프로파일별 임시 collection으로 복사한 뒤,
+- 정답: 원본 collection의 exact(brute-force) 검색 top-k
+- recall@k: 프로파일 collection 검색 결과(top-k)가 정답과 겹치는 비율
+- 지연 시간: 프로파일 검색 파라미터(rescore/oversampling/hnsw_ef) 적용 검색의 p50/p95
+- RAM: CollectionProfile.estimate_ram_bytes 추정치 (Qdrant 서버 RSS가 아닌 vector/HNSW 기준 근사)
+
+질의 벡터는 임베딩 API 호출 없이 저장된 vector 2개의 정규화된 중점을 사용한다.
+(저장된 vector 그대로 질의하면 자기 자신이 항상 top-1이 되므로)
+
+사전 조건: Qdrant 실행 + 약관 적재 완료
+
+실행 예시:
+    uv run python -m app.agents.document_parser.bench_collection_profiles
+    uv run python -m app.agents.document_parser.bench_collection_profiles --queries 200 --k 10 --keep
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from typing import List
+
+from qdrant_client import models
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.document_parser.constants import COLLECTION_NAME
+from app.agents.document_parser.nodes.collection_profile import COLLECTION_PROFILES
+from app.agents.document_parser.nodes.vector_store import (
+    create_collection,
+    get_vector_db_client,
+)
+
+SCROLL_BATCH_SIZE = 256
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _load_points(collection_name: str) -> List[models.Record]:
+    client = get_vector_db_client()
+    points: List[models.Record] = []
+    offset = None
+    while True:
+        batch, offset = client.scroll(
+            collection_name=collection_name,
+            limit=SCROLL_BATCH_SIZE,
+            offset=offset,
+            with_vectors=True,
+            with_payload=True,
+        )
+        points.extend(batch)
+        if offset is None:
+            return points
+
+
+def _make_queries(points: List[models.Record], count: int, seed: int) -> List[List[float]]:
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        a, b = rng.sample(points, 2)
+        midpoint = [x + y for x, y in zip(a.vector, b.vector)]
+        norm = math.sqrt(sum(x * x for x in midpoint)) or 1.0
+        queries.append([x / norm for x in midpoint])
+    return queries
+
+
+def _wait_until_indexed(collection_name: str, timeout_s: float = 600) -> None:
+    """최적화(HNSW/quantization 생성)가 끝날 때까지 대기합니다."""
+    client = get_vector_db_client()
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if client.get_collection(collection_name).status == models.CollectionStatus.GREEN:
+            return
+        time.sleep(1)
+    rprint(f"⚠️indexing timeout: {collection_name}")
+
+
+def _copy_collection(points: List[models.Record], collection_name: str, profile: str) -> None:
+    client = get_vector_db_client()
+    if client.collection_exists(collection_name):
+        client.delete_collection(collection_name)
+    create_collection(collection_name, len(points[0].vector), profile=profile)
+    for start in range(0, len(points), SCROLL_BATCH_SIZE):
+        client.upsert(
+            collection_name=collection_name,
+            points=[
+                models.PointStruct(id=point.id, vector=point.vector, payload=point.payload)
+                for point in points[start : start + SCROLL_BATCH_SIZE]
+            ],
+            wait=True,
+        )
+    _wait_until_indexed(collection_name)
+
+
+def _search_ids(collection_name: str, query, k: int, search_params) -> List:
+    response = get_vector_db_client().query_points(
+        collection_name=collection_name,
+        query=query,
+        limit=k,
+        search_params=search_params,
+        with_payload=False,
+    )
+    return [point.id for point in response.points]
+
+
+def run_benchmark(queries_count: int, k: int, keep: bool, seed: int) -> None:
+    client = get_vector_db_client()
+    if not client.collection_exists(COLLECTION_NAME):
+        rprint("❗️collection not found:", COLLECTION_NAME)
+        return
+
+    points = _load_points(COLLECTION_NAME)
+    if len(points) < 2:
+        rprint("❗️not enough points in collection:", COLLECTION_NAME)
+        return
+    vector_size = len(points[0].vector)
+    rprint(f"🚀loaded {len(points)} points (dim={vector_size}) from {COLLECTION_NAME}")
+
+    queries = _make_queries(points, queries_count, seed)
+    exact = models.SearchParams(exact=True)
+    ground_truth = [set(_search_ids(COLLECTION_NAME, query, k, exact)) for query in queries]
+
+    table = Table(
+        title=f"collection profile benchmark (points={len(points)}, queries={len(queries)}, k={k})"
+    )
+    table.add_column("profile")
+    table.add_column(f"recall@{k}", justify="right")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("RAM est. (MB)", justify="right")
+
+    for profile_name, profile in COLLECTION_PROFILES.items():
+        collection_name = f"{COLLECTION_NAME}-bench-{profile_name}"
+        rprint(f"🚀build {collection_name}")
+        _copy_collection(points, collection_name, profile_name)
+
+        search_params = profile.search_params()
+        _search_ids(collection_name, queries[0], k, search_params)  # warmup
+        latencies, recalls = [], []
+        for query, expected in zip(queries, ground_truth):
+            start = time.perf_counter()
+            found = _search_ids(collection_name, query, k, search_params)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(expected & set(found)) / len(expected) if expected else 1.0)
+
+        table.add_row(
+            profile_name,
+            f"{statistics.mean(recalls):.3f}",
+            f"{_percentile(latencies, 0.5):.3f}",
+            f"{_percentile(latencies, 0.95):.3f}",
+            f"{profile.estimate_ram_bytes(len(points), vector_size) / 1024 / 1024:.2f}",
+        )
+        if not keep:
+            client.delete_collection(collection_name)
+
+    rprint(table)
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant collection profiles.")
+    parser.add_argument("--queries", type=int, default=100, help="질의 수")
+    parser.add_argument("--k", type=int, default=3, help="recall 계산에 사용할 top-k")
+    parser.add_argument("--seed", type=int, default=42, help="질의 생성 seed")
+    parser.add_argument(
+        "--keep", action="store_true", help="벤치마크용 collection을 삭제하지 않고 유지"
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(queries_count=args.queries, k=args.k, keep=args.keep, seed=args.seed)
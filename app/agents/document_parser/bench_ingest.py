@@ -0,0 +1,181 @@
+"""적재 경로별 처리량 벤치마크.
+
+in-memory Qdrant collection에 임의의 약관 청크를 적재하며 다음 경로를 비교한다.
+- add_documents: 기존 QdrantVectorStore.add_documents (임베딩 요청 순차 호출 후 upsert)
+- pipeline(c=N): ingest_pipeline.IngestPipeline (batch 임베딩 N개 동시 실행 + 병렬 upsert)
+
+임베딩 API 대신 요청당 --latency-ms만큼 대기하는 가짜 임베딩을 사용하므로 UPSTAGE_API_KEY가 필요 없다.
+--rate-limit-every N이면 N번째 요청마다 429(RateLimitError)를 발생시켜 재시도/대기 동작을 함께 측정한다.
+
+실행 예시:
+    uv run python -m app.agents.document_parser.bench_ingest
+    uv run python -m app.agents.document_parser.bench_ingest --chunks 2000 --latency-ms 800 --concurrency 1,4,8
+"""
+
+import argparse
+import itertools
+import threading
+import time
+from typing import List
+
+import httpx
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_qdrant import QdrantVectorStore
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.document_parser.nodes.ingest_pipeline import IngestPipeline
+
+COLLECTION_NAME = "bench-ingest"
+
+
+class LatencyEmbeddings(DeterministicFakeEmbedding):
+    """embed_documents 1회 = API 요청 1회로 보고 latency_s만큼 대기하는 가짜 임베딩"""
+
+    latency_s: float = 0.5
+    batch_size: int = 10  # UpstageEmbeddings 기본 embed_batch_size
+    rate_limit_every: int = 0
+
+    def model_post_init(self, __context) -> None:
+        self._requests = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _request(self) -> None:
+        with self._lock:
+            request_number = next(self._requests)
+        time.sleep(self.latency_s)
+        if self.rate_limit_every and request_number % self.rate_limit_every == 0:
+            from openai import RateLimitError
+
+            response = httpx.Response(
+                429,
+                headers={"retry-after": "0.2"},
+                request=httpx.Request("POST", "https://api.upstage.ai/v1/embeddings"),
+            )
+            raise RateLimitError("rate limited (bench)", response=response, body=None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start : start + self.batch_size]
+            self._request()
+            vectors.extend(super().embed_documents(batch))
+        return vectors
+
+
+def _create_vector_store(
+    embeddings: LatencyEmbeddings, dim: int
+) -> QdrantVectorStore:
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        COLLECTION_NAME, vectors_config=VectorParams(size=dim, distance=Distance.COSINE)
+    )
+    return QdrantVectorStore(
+        client=client, collection_name=COLLECTION_NAME, embedding=embeddings
+    )
+
+
+def _sample_chunks(count: int) -> List[Document]:
+    return [
+        Document(
+            page_content=f"제{i}조(보상하는 손해) 회사는 반려동물이 질병 또는 상해로 치료를 받은 경우 " * 4,
+            metadata={"doc": {"file_name": "bench.pdf", "page": i // 5 + 1}},
+        )
+        for i in range(count)
+    ]
+
+
+def run_benchmark(
+    chunks_count: int,
+    dim: int,
+    latency_ms: float,
+    batch_size: int,
+    concurrencies: List[int],
+    rate_limit_every: int,
+) -> None:
+    table = Table(
+        title=f"ingest benchmark (chunks={chunks_count}, latency={latency_ms:.0f}ms/request)"
+    )
+    table.add_column("path")
+    table.add_column("elapsed (s)", justify="right")
+    table.add_column("chunks/s", justify="right")
+    table.add_column("time-to-first-upsert (s)", justify="right")
+    table.add_column("points", justify="right")
+
+    chunks = _sample_chunks(chunks_count)
+
+    def new_embeddings(rate_limited: bool) -> LatencyEmbeddings:
+        return LatencyEmbeddings(
+            size=dim,
+            latency_s=latency_ms / 1000,
+            rate_limit_every=rate_limit_every if rate_limited else 0,
+        )
+
+    rprint("🚀add_documents")
+    vector_store = _create_vector_store(new_embeddings(rate_limited=False), dim)
+    upsert_finished_at: List[float] = []
+    upsert = vector_store.client.upsert
+
+    def timed_upsert(*args, **kwargs):
+        result = upsert(*args, **kwargs)
+        upsert_finished_at.append(time.perf_counter())
+        return result
+
+    vector_store.client.upsert = timed_upsert
+    start_time = time.perf_counter()
+    vector_store.add_documents(chunks)  # 64개 단위로 임베딩(순차 요청) 후 upsert
+    elapsed = time.perf_counter() - start_time
+    table.add_row(
+        "add_documents",
+        f"{elapsed:.2f}",
+        f"{chunks_count / elapsed:.1f}",
+        f"{upsert_finished_at[0] - start_time:.2f}",
+        f"{vector_store.client.count(COLLECTION_NAME).count:,}",
+    )
+
+    for concurrency in concurrencies:
+        rprint(f"🚀pipeline(c={concurrency})")
+        vector_store = _create_vector_store(new_embeddings(rate_limited=True), dim)
+        pipeline = IngestPipeline(
+            vector_store, batch_size=batch_size, concurrency=concurrency, max_retries=5
+        )
+        # 가짜 임베딩은 UpstageEmbeddings가 아니므로 batch 1개 = 요청 1개로 직접 맞춤
+        pipeline.embeddings.batch_size = pipeline.batch_size
+        stats = pipeline.run(chunks)
+        table.add_row(
+            f"pipeline(c={concurrency}, batch={pipeline.batch_size})",
+            f"{stats['elapsed_s']:.2f}",
+            f"{stats['chunks_per_s']:.1f}",
+            f"{stats['time_to_first_upsert_s']:.2f}",
+            f"{vector_store.client.count(COLLECTION_NAME).count:,}",
+        )
+
+    rprint(table)
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark chunk ingest paths.")
+    parser.add_argument("--chunks", type=int, default=500, help="적재할 청크 수")
+    parser.add_argument("--dim", type=int, default=256, help="vector 차원 (운영: 4096)")
+    parser.add_argument("--latency-ms", type=float, default=300, help="임베딩 요청당 지연 시간")
+    parser.add_argument("--batch-size", type=int, default=32, help="pipeline 임베딩 요청당 청크 수")
+    parser.add_argument("--concurrency", default="1,4,8", help="pipeline 동시 요청 수 (쉼표 구분)")
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 발생 (0이면 미사용)"
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(
+        chunks_count=args.chunks,
+        dim=args.dim,
+        latency_ms=args.latency_ms,
+        batch_size=args.batch_size,
+        concurrencies=[int(value) for value in args.concurrency.split(",")],
+        rate_limit_every=args.rate_limit_every,
+    )
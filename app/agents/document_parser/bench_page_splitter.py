@@ -0,0 +1,205 @@
+"""페이지 분리(page_splitter) 방식별 처리 시간 벤치마크.
+
+약관 파싱 결과 HTML을 페이지 단위로 나누는 두 방식을 비교한다.
+- legacy: BeautifulSoup(html.parser) 트리 생성 후 root.descendants를 순회하며
+  p/div/span/li마다 get_text/str 호출 (중첩 태그 텍스트 중복 추출)
+- streaming: page_splitter.iter_page_docs (html.parser event handler 1회 순회, 바깥 block 태그만 추출)
+
+입력 HTML
+- 파싱 캐시(.cache/document_parse)에 해당 PDF 결과가 있으면 실제 Upstage Document Parse HTML을 사용한다.
+- 없으면 PDF 텍스트(pypdf)로 Upstage 형식의 HTML(p/table/li + footer 페이지 마커)을 생성한다.
+
+실행 예시:
+    uv run python -m app.agents.document_parser.bench_page_splitter
+    uv run python -m app.agents.document_parser.bench_page_splitter --file-name meritz_1_maum_pet_12_61.pdf --repeat 5
+"""
+
+import argparse
+import html
+import statistics
+import time
+from typing import Callable, List
+
+from bs4 import BeautifulSoup, Tag
+from pypdf import PdfReader
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.document_parser.constants import TERMS_DIR
+from app.agents.document_parser.nodes.document_parser import (
+    load_cached_document,
+    parse_cache_path,
+)
+from app.agents.document_parser.nodes.splitter.page_splitter import (
+    _PAGE_RE,
+    PageDoc,
+    _dedup_keep_order,
+    _norm_text,
+    iter_page_docs,
+)
+
+# 저장소의 약관 PDF 중 가장 큰 파일 (273페이지)
+DEFAULT_FILE_NAME = "meritz_2_petpermint_puppy_family.pdf"
+
+
+def _legacy_table_text(table_tag: Tag) -> str:
+    rows = []
+    for tr in table_tag.find_all("tr", recursive=True):
+        cells = [
+            text
+            for cell in tr.find_all(["td", "th"], recursive=False)
+            if (text := cell.get_text(" ", strip=True))
+        ]
+        if cells:
+            rows.append(" | ".join(cells))
+    return "\n".join(rows)
+
+
+def legacy_page_docs(full_html: str) -> List[PageDoc]:
+    """기존 split_pages_and_add_metadata의 BeautifulSoup descendants 순회 방식"""
+    soup = BeautifulSoup(full_html, "html.parser")
+    root = soup.body if soup.body else soup
+
+    page_docs: List[PageDoc] = []
+    buf_text: List[str] = []
+    buf_html: List[str] = []
+    buf_ids: List[str] = []
+
+    for node in root.descendants:
+        if not isinstance(node, Tag):
+            continue
+        if node.name == "footer":
+            m = _PAGE_RE.match(node.get_text(strip=True))
+            if m:
+                page_docs.append(
+                    PageDoc(
+                        page_number=int(m.group(1)),
+                        text=_norm_text("\n".join(buf_text)),
+                        html="\n".join(buf_html).strip(),
+                        anchor_ids=_dedup_keep_order(buf_ids),
+                    )
+                )
+                buf_text.clear()
+                buf_html.clear()
+                buf_ids.clear()
+            continue
+        if node.name == "table":
+            table_text = _legacy_table_text(node)
+        elif node.name in {"p", "h1", "h2", "h3", "li", "div", "span"}:
+            table_text = node.get_text(" ", strip=True)
+        else:
+            continue
+        if table_text:
+            buf_text.append(table_text)
+        buf_html.append(str(node))
+        if node.get("id"):
+            buf_ids.append(str(node.get("id")))
+
+    if buf_text:
+        page_docs.append(
+            PageDoc(
+                page_number=page_docs[-1].page_number + 1 if page_docs else 1,
+                text=_norm_text("\n".join(buf_text)),
+                html="\n".join(buf_html).strip(),
+                anchor_ids=_dedup_keep_order(buf_ids),
+            )
+        )
+    return page_docs
+
+
+def synthesize_upstage_html(file_name: str) -> str:
+    """PDF 텍스트로 Upstage Document Parse 형식의 HTML을 생성합니다."""
+    element_id = 0
+    parts: List[str] = []
+
+    def element(tag: str, body: str, category: str) -> str:
+        nonlocal element_id
+        element_id += 1
+        return (
+            f"<{tag} id='{element_id}' data-category='{category}' "
+            f"style='font-size:14px'>{body}</{tag}>"
+        )
+
+    for page_number, page in enumerate(PdfReader(str(TERMS_DIR / file_name)).pages, start=1):
+        lines = [html.escape(line.strip()) for line in (page.extract_text() or "").splitlines()]
+        lines = [line for line in lines if line]
+        for start in range(0, len(lines), 4):
+            group = lines[start : start + 4]
+            if start % 40 == 20:
+                rows = "".join(
+                    "<tr>" + "".join(f"<td>{cell}</td>" for cell in line.split(" ", 2)) + "</tr>"
+                    for line in group
+                )
+                parts.append(element("table", rows, "table"))
+            elif start % 40 == 8:
+                items = "".join(f"<li id='{element_id}-{i}'>{line}</li>" for i, line in enumerate(group))
+                parts.append(element("div", f"<ul>{items}</ul>", "list"))
+            else:
+                parts.append(element("p", "<br>".join(group), "paragraph"))
+        parts.append(element("footer", str(page_number), "footer"))
+    return "".join(parts)
+
+
+def _measure(fn: Callable[[str], List[PageDoc]], full_html: str, repeat: int) -> tuple[list[float], List[PageDoc]]:
+    latencies = []
+    page_docs: List[PageDoc] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        page_docs = fn(full_html)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, page_docs
+
+
+def run_benchmark(file_name: str, repeat: int) -> None:
+    cached_document = load_cached_document(parse_cache_path(TERMS_DIR / file_name, "html", False))
+    if cached_document is not None:
+        source = "parse cache"
+        full_html = cached_document.page_content
+    else:
+        source = "synthesized from PDF text"
+        full_html = synthesize_upstage_html(file_name)
+    rprint(f"🚀input: {file_name} ({source}, {len(full_html):,} chars)")
+
+    table = Table(title=f"page splitter benchmark ({file_name}, repeat={repeat})")
+    table.add_column("method")
+    table.add_column("mean (ms)", justify="right")
+    table.add_column("min (ms)", justify="right")
+    table.add_column("pages", justify="right")
+    table.add_column("text chars", justify="right")
+
+    results = {}
+    for method, fn in (
+        ("legacy(bs4 descendants)", legacy_page_docs),
+        ("streaming(html.parser events)", lambda text: list(iter_page_docs(text))),
+    ):
+        latencies, page_docs = _measure(fn, full_html, repeat)
+        results[method] = page_docs
+        table.add_row(
+            method,
+            f"{statistics.mean(latencies):.1f}",
+            f"{min(latencies):.1f}",
+            str(len(page_docs)),
+            f"{sum(len(page_doc.text) for page_doc in page_docs):,}",
+        )
+    rprint(table)
+
+    legacy, streaming = results.values()
+    same_pages = [a.page_number for a in legacy] == [b.page_number for b in streaming]
+    same_text = sum(a.text == b.text for a, b in zip(legacy, streaming))
+    rprint(
+        f"✅page numbers identical: {same_pages}, "
+        f"identical page text: {same_text}/{len(legacy)} "
+        "(차이는 legacy의 중첩 태그 텍스트 중복 추출)"
+    )
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark page splitter.")
+    parser.add_argument("--file-name", default=DEFAULT_FILE_NAME, help="PDF file name with extension")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(file_name=args.file_name, repeat=args.repeat)
@@ -1,6 +1,12 @@
+import os
+
 from app.agents.utils import get_parent_path
 
 COLLECTION_NAME = "pet-insurance-recommender-v1.0"
+# 검색 결과 기반 캐시 전체를 수동으로 무효화할 때 변경
+# (청크 본문 변경은 judge 캐시 key의 본문 hash로 자동 반영되므로 재적재 시 변경할 필요 없음)
+COLLECTION_VERSION = os.getenv("COLLECTION_VERSION", COLLECTION_NAME)
+EMBEDDING_MODEL_NAME = "solar-embedding-1-large"
 
 BASE_DIR = get_parent_path(__file__)  # app/agents/document_parser
 TERMS_DIR = BASE_DIR / "data" / "terms"
@@ -42,6 +42,11 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="해당 옵션이 포함된 경우 Vector DB 적재까지 진행",
     )
+    parser.add_argument(
+        "--force-reparse",
+        action="store_true",
+        help="파싱 결과 캐시(.cache/document_parse)를 무시하고 Upstage Document Parse 다시 실행",
+    )
     parser.add_argument(
         "--basic-term-start",
         type=int,
@@ -73,7 +78,7 @@ if __name__ == "__main__":
     args = create_arg_parser().parse_args()
     file_name: str = args.file_name
 
-    dp_result = document_parser.parse_document(file_name)
+    dp_result = document_parser.parse_document(file_name, force_reparse=args.force_reparse)
 
     pages = page_splitter.split_pages_and_add_metadata(
         dp_result,
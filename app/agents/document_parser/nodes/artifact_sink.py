@@ -0,0 +1,169 @@
+"""
+문서 파이프라인 산출물(페이지 HTML/텍스트, 태깅된 청크) writer
+
+페이지/청크마다 파일을 동기로 쓰면 수천 번의 작은 write/mkdir가 분리/태깅 루프를 막는다.
+ArtifactSink는 다음 방식으로 산출물을 쓴다.
+- 파일 쓰기는 background thread 1개가 queue에서 꺼내 처리하고, 이미 만든 디렉터리는 다시 mkdir하지 않는다.
+- 통합 출력(jsonl/parquet)은 문서별 레코드를 모아 flush 시 파일 1개로 쓴다.
+  예: data/terms/<문서>/<문서>_pages.jsonl, <문서>_chunks.jsonl
+- 페이지/청크별 개별 파일(files)은 선택 사항이다.
+
+DOCUMENT_ARTIFACT_MODE (쉼표 구분, 기본: jsonl)
+- jsonl: 통합 JSONL
+- parquet: 통합 Parquet (`uv add pyarrow` 필요, dict/list 값은 JSON 문자열로 저장)
+- files: 기존 페이지별 .html/.txt, 청크별 .py 파일
+- off: 산출물 저장 안 함
+
+각 단계(페이지 분리, 태깅)는 끝날 때 flush()를 호출하므로, 단계 함수가 반환되면 산출물이 모두 디스크에 있다.
+"""
+
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from rich import print as rprint
+
+ARTIFACT_MODES = ("jsonl", "parquet", "files")
+DEFAULT_ARTIFACT_MODE = "jsonl"
+# queue가 가득 차면 producer가 대기 (메모리 사용량 상한)
+MAX_PENDING_WRITES = 1024
+
+_global_artifact_sink: "ArtifactSink | None" = None
+_artifact_sink_lock = threading.Lock()
+
+
+def get_artifact_modes() -> set[str]:
+    value = os.getenv("DOCUMENT_ARTIFACT_MODE", DEFAULT_ARTIFACT_MODE)
+    modes = {mode.strip() for mode in value.split(",") if mode.strip()} - {"off"}
+    unknown = modes - set(ARTIFACT_MODES)
+    if unknown:
+        raise ValueError(
+            f"unknown artifact mode: {', '.join(sorted(unknown))} "
+            f"(available: {', '.join(ARTIFACT_MODES)}, off)"
+        )
+    return modes
+
+
+def _write_parquet(path: Path, records: List[Dict[str, Any]]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("parquet 산출물을 사용하려면 `uv add pyarrow`를 실행하세요.") from e
+
+    rows = [
+        {
+            key: json.dumps(value, ensure_ascii=False, default=str)
+            if isinstance(value, (dict, list))
+            else value
+            for key, value in record.items()
+        }
+        for record in records
+    ]
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
+class ArtifactSink:
+    """
+    Args:
+        modes: 출력 방식 집합 ("jsonl", "parquet", "files")
+    """
+
+    def __init__(self, modes: set[str]):
+        self.modes = modes
+        self._queue: queue.Queue = queue.Queue(maxsize=MAX_PENDING_WRITES)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._created_dirs: set[Path] = set()
+        self._errors: List[BaseException] = []
+        # 통합 파일 경로(확장자 제외) → 레코드 목록
+        self._records: Dict[Path, List[Dict[str, Any]]] = {}
+        self._records_lock = threading.Lock()
+
+    @property
+    def per_file(self) -> bool:
+        return "files" in self.modes
+
+    @property
+    def consolidated(self) -> bool:
+        return bool(self.modes & {"jsonl", "parquet"})
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-sink", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            path, write = self._queue.get()
+            try:
+                if path.parent not in self._created_dirs:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(path.parent)
+                write(path)
+            except BaseException as e:  # flush()에서 호출한 쪽으로 전달
+                self._errors.append(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, path: Path, write: Callable[[Path], None]) -> None:
+        self._ensure_thread()
+        self._queue.put((path, write))
+
+    def write_text(self, path: Path, content: str) -> None:
+        """path에 content를 background로 씁니다."""
+        self.submit(path, lambda p: p.write_text(content, encoding="utf-8"))
+
+    def add_record(self, stem: Path, record: Dict[str, Any]) -> None:
+        """통합 파일(stem + .jsonl/.parquet)에 쓸 레코드를 추가합니다."""
+        if not self.consolidated:
+            return
+        with self._records_lock:
+            self._records.setdefault(stem, []).append(record)
+
+    def flush(self) -> None:
+        """모은 레코드를 통합 파일로 쓰고, 대기 중인 쓰기가 모두 끝날 때까지 기다립니다."""
+        with self._records_lock:
+            records_by_stem, self._records = self._records, {}
+
+        for stem, records in records_by_stem.items():
+            if "jsonl" in self.modes:
+                lines = "".join(
+                    json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                    for record in records
+                )
+                self.write_text(stem.with_name(f"{stem.name}.jsonl"), lines)
+            if "parquet" in self.modes:
+                self.submit(
+                    stem.with_name(f"{stem.name}.parquet"),
+                    lambda path, records=records: _write_parquet(path, records),
+                )
+
+        if self._thread is not None:
+            self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise errors[0]
+
+
+def get_artifact_sink() -> ArtifactSink:
+    """프로세스 전역에서 공유하는 산출물 writer를 반환합니다."""
+    global _global_artifact_sink
+
+    if _global_artifact_sink is None:
+        with _artifact_sink_lock:
+            if _global_artifact_sink is None:
+                _global_artifact_sink = ArtifactSink(get_artifact_modes())
+                rprint(
+                    "✅initialize artifact sink:",
+                    ",".join(sorted(_global_artifact_sink.modes)) or "off",
+                )
+    return _global_artifact_sink
@@ -0,0 +1,127 @@
+"""
+Qdrant collection 저장/검색 프로파일
+
+solar-embedding-1-large(4096차원, float32)는 vector 1개당 16KB이므로 보험사/약관이 늘어날수록
+메모리 사용량이 빠르게 증가한다. QDRANT_COLLECTION_PROFILE 환경변수로 collection 생성 시
+quantization, on-disk 저장, HNSW 파라미터와 검색 시 rescoring/oversampling을 함께 선택한다.
+
+- default: 원본 vector를 RAM에 저장, quantization 없음 (기존 동작)
+- scalar: int8 scalar quantization(RAM) + 원본 vector on-disk, 상위 후보만 원본으로 rescoring
+- binary: 1bit binary quantization(RAM) + 원본 vector on-disk, 더 큰 oversampling으로 rescoring
+- scalar_low_mem: scalar + HNSW graph on-disk (메모리 최소화, 지연 시간 증가)
+
+프로파일은 collection 생성 시에만 적용되므로 기존 collection을 바꾸려면 COLLECTION_NAME을 올려 재적재한다.
+"""
+
+import os
+from typing import Dict
+
+from pydantic import BaseModel
+from qdrant_client import models
+
+DEFAULT_COLLECTION_PROFILE = "default"
+
+
+class CollectionProfile(BaseModel):
+    vectors_on_disk: bool = False
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_on_disk: bool = False
+    quantization: str | None = None  # None | "scalar" | "binary"
+    # 검색 시 파라미터
+    hnsw_ef: int | None = None  # None이면 서버 기본값
+    rescore: bool = True
+    oversampling: float | None = None
+
+    def vectors_config(self, size: int) -> models.VectorParams:
+        return models.VectorParams(
+            size=size, distance=models.Distance.COSINE, on_disk=self.vectors_on_disk
+        )
+
+    def hnsw_config(self) -> models.HnswConfigDiff:
+        return models.HnswConfigDiff(
+            m=self.hnsw_m, ef_construct=self.hnsw_ef_construct, on_disk=self.hnsw_on_disk
+        )
+
+    def quantization_config(self) -> models.QuantizationConfig | None:
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def search_params(self) -> models.SearchParams | None:
+        if self.quantization is None and self.hnsw_ef is None:
+            return None
+        quantization = (
+            models.QuantizationSearchParams(
+                rescore=self.rescore, oversampling=self.oversampling
+            )
+            if self.quantization
+            else None
+        )
+        return models.SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
+
+    def estimate_ram_bytes(self, points: int, size: int) -> int:
+        """
+        RAM 사용량 추정치 (Qdrant 문서 기준 근사)
+
+        - 원본 vector: points * size * 4 (on-disk이면 page cache로만 사용되므로 제외)
+        - quantized vector: scalar points * size, binary points * size / 8
+        - HNSW graph: points * m * 2 * 4 (level 0 링크 기준, on-disk이면 제외)
+        """
+        ram = 0 if self.vectors_on_disk else points * size * 4
+        if self.quantization == "scalar":
+            ram += points * size
+        elif self.quantization == "binary":
+            ram += points * size // 8
+        if not self.hnsw_on_disk:
+            ram += points * self.hnsw_m * 2 * 4
+        return ram
+
+
+COLLECTION_PROFILES: Dict[str, CollectionProfile] = {
+    "default": CollectionProfile(),
+    "scalar": CollectionProfile(
+        vectors_on_disk=True,
+        quantization="scalar",
+        hnsw_ef=64,
+        oversampling=2.0,
+    ),
+    "binary": CollectionProfile(
+        vectors_on_disk=True,
+        quantization="binary",
+        hnsw_ef=64,
+        oversampling=3.0,
+    ),
+    "scalar_low_mem": CollectionProfile(
+        vectors_on_disk=True,
+        hnsw_m=8,
+        hnsw_ef_construct=64,
+        hnsw_on_disk=True,
+        quantization="scalar",
+        hnsw_ef=64,
+        oversampling=2.0,
+    ),
+}
+
+
+def get_collection_profile(name: str | None = None) -> CollectionProfile:
+    """
+    프로파일 선택 우선순위:
+    1) name 인자
+    2) 환경변수 QDRANT_COLLECTION_PROFILE
+    3) DEFAULT_COLLECTION_PROFILE ("default")
+    """
+    name = name or os.getenv("QDRANT_COLLECTION_PROFILE", DEFAULT_COLLECTION_PROFILE)
+    if name not in COLLECTION_PROFILES:
+        raise ValueError(
+            f"unknown collection profile: {name} (available: {', '.join(COLLECTION_PROFILES)})"
+        )
+    return COLLECTION_PROFILES[name]
@@ -1,9 +1,18 @@
 import argparse
+import gzip
+import hashlib
+import json
+import os
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List
 
 
 from dotenv import load_dotenv
+from pypdf import PdfReader, PdfWriter
 
 from langchain_core.documents import Document
 from langchain_upstage.document_parse import OutputFormat
@@ -11,26 +20,171 @@ from langchain_upstage import UpstageDocumentParseLoader
 
 from rich import print as rprint
 
+from app.agents.cache import CACHE_DIR, make_cache_key
 from app.agents.document_parser.constants import TERMS_DIR
 from app.agents.document_parser.state.document_parser_state import DocumentParserState
 
 
 load_dotenv()
 
+# 파싱 결과 캐시: <PARSE_CACHE_DIR>/<key>.json.gz
+# - key: PDF 내용의 SHA-256 + output_format + coordinates (파일명이 바뀌어도 내용이 같으면 재사용)
+# - PDF가 개정되면 hash가 바뀌므로 자동으로 다시 파싱
+PARSE_CACHE_DIR = Path(os.getenv("DOCUMENT_PARSE_CACHE_DIR", CACHE_DIR / "document_parse"))
+HASH_READ_BYTES = 1024 * 1024
+
+# 병렬 파싱 설정
+# - UpstageDocumentParseLoader는 PDF를 10페이지 단위로 나눠 순차 요청하므로,
+#   shard 크기를 10의 배수로 두면 shard별 결과를 이어 붙인 HTML이 단일 요청 결과와 같다.
+#   (10의 배수가 아니면 올림하여 사용)
+# - DOCUMENT_PARSE_CONCURRENCY=1이면 기존처럼 전체 PDF를 loader 1개로 파싱
+LOADER_BATCH_PAGES = 10
+DOCUMENT_PARSE_SHARD_PAGES = int(os.getenv("DOCUMENT_PARSE_SHARD_PAGES", "10"))
+DOCUMENT_PARSE_CONCURRENCY = int(os.getenv("DOCUMENT_PARSE_CONCURRENCY", "4"))
+
 
 def document_parser_node(state: DocumentParserState):
     parse_document(state.file_name)
 
 
-def parse_document(file_name: str, output_format: OutputFormat = "html") -> Document:
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(HASH_READ_BYTES):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_cache_path(file_path: Path, output_format: OutputFormat, coordinates: bool) -> Path:
+    key = make_cache_key("document_parse", file_sha256(file_path), output_format, coordinates)
+    return PARSE_CACHE_DIR / f"{key}.json.gz"
+
+
+def load_cached_document(cache_path: Path) -> Document | None:
+    if not cache_path.exists():
+        return None
+    with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+        cached = json.load(f)
+    return Document(page_content=cached["page_content"], metadata=cached["metadata"])
+
+
+def save_cached_document(cache_path: Path, document: Document) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 깨진 캐시 파일이 남지 않게 합니다.
+    tmp_path = cache_path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump(
+            {"page_content": document.page_content, "metadata": document.metadata},
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, cache_path)
+
+
+def align_shard_pages(shard_pages: int) -> int:
+    """shard 크기를 loader 요청 단위(LOADER_BATCH_PAGES)의 배수로 올림합니다."""
+    aligned = max(1, -(-shard_pages // LOADER_BATCH_PAGES)) * LOADER_BATCH_PAGES
+    if aligned != shard_pages:
+        rprint(
+            f"⚠️DOCUMENT_PARSE_SHARD_PAGES={shard_pages} is not a positive multiple of "
+            f"{LOADER_BATCH_PAGES}, using {aligned}"
+        )
+    return aligned
+
+
+def split_pdf_shards(file_path: Path, shard_pages: int, target_dir: Path) -> tuple[List[Path], int]:
+    """PDF를 shard_pages 페이지 단위 PDF 파일로 나누고 (shard 경로 목록, 전체 페이지 수)를 반환합니다."""
+    reader = PdfReader(str(file_path))
+    total_pages = reader.get_num_pages()
+    shard_paths = []
+    for start_page in range(0, total_pages, shard_pages):
+        writer = PdfWriter()
+        writer.append(reader, pages=(start_page, min(start_page + shard_pages, total_pages)))
+        shard_path = target_dir / f"{file_path.stem}_{start_page:05d}.pdf"
+        with shard_path.open("wb") as f:
+            writer.write(f)
+        shard_paths.append(shard_path)
+    return shard_paths, total_pages
+
+
+def parse_document_sharded(
+    file_path: Path,
+    output_format: OutputFormat,
+    coordinates: bool,
+    shard_pages: int = DOCUMENT_PARSE_SHARD_PAGES,
+    concurrency: int = DOCUMENT_PARSE_CONCURRENCY,
+) -> Document:
+    """
+    PDF를 페이지 범위 shard로 나눠 동시에 파싱한 뒤 페이지 순서대로 합친 단일 Document를 반환합니다.
+
+    shard 결과를 순서대로 이어 붙이므로 footer 페이지 마커가 유지되어
+    page_splitter.split_pages_and_add_metadata를 그대로 사용할 수 있습니다.
+    """
+    # loader 요청 경계와 shard 경계가 어긋나면 이어 붙인 결과가 단일 파싱 결과와 달라짐
+    shard_pages = align_shard_pages(shard_pages)
+    with tempfile.TemporaryDirectory(prefix="document_parse_") as tmp_dir:
+        shard_paths, total_pages = split_pdf_shards(file_path, shard_pages, Path(tmp_dir))
+        rprint(
+            f"🚀document parsing shards: {len(shard_paths)} x {shard_pages} pages "
+            f"(total pages: {total_pages}, concurrency: {concurrency})"
+        )
+
+        def _parse_shard(shard_path: Path) -> Document:
+            return UpstageDocumentParseLoader(
+                file_path=str(shard_path),
+                output_format=output_format,
+                coordinates=coordinates,
+            ).load()[0]
+
+        executor = ThreadPoolExecutor(concurrency, thread_name_prefix="document-parse")
+        try:
+            futures = [executor.submit(_parse_shard, shard_path) for shard_path in shard_paths]
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                rprint(f"⏳document parsing shard done: {done}/{len(futures)}")
+            shard_documents = [future.result() for future in futures]
+        finally:
+            # 실패 시 대기 중인 shard는 취소
+            executor.shutdown(cancel_futures=True)
+
+    metadata = {"total_pages": total_pages}
+    if coordinates:
+        metadata["coordinates"] = [
+            coordinate
+            for shard_document in shard_documents
+            for coordinate in shard_document.metadata.get("coordinates", [])
+        ]
+    return Document(
+        page_content="".join(shard_document.page_content for shard_document in shard_documents),
+        metadata=metadata,
+    )
+
+
+def parse_document(
+    file_name: str,
+    output_format: OutputFormat = "html",
+    force_reparse: bool = False,
+) -> Document:
+    """
+    약관 PDF를 Upstage Document Parse로 파싱합니다.
+
+    같은 내용의 PDF를 같은 설정으로 파싱한 결과가 캐시에 있으면 API를 호출하지 않고 반환합니다.
+    force_reparse=True이면 캐시를 무시하고 다시 파싱한 뒤 캐시를 갱신합니다.
+    """
     TERM_FILE_PATH = TERMS_DIR / file_name
     rprint("🔗parse_document TERM_FILE_PATH:", TERM_FILE_PATH)
 
-    dp_loader = UpstageDocumentParseLoader(
-        file_path=str(TERM_FILE_PATH),
-        output_format=output_format,
-        coordinates=False,
-    )
+    coordinates = False
+    cache_path = parse_cache_path(TERM_FILE_PATH, output_format, coordinates)
+    if not force_reparse:
+        start_time = time.perf_counter()
+        cached_document = load_cached_document(cache_path)
+        if cached_document is not None:
+            elapsed = time.perf_counter() - start_time
+            rprint(
+                f"✅document parse cache hit: {cache_path.name} (elapsed: {elapsed:.2f}s)"
+            )
+            return cached_document
 
     rprint("🚀document parsing start. output format:", output_format)
     start_time = time.perf_counter()
@@ -45,31 +199,46 @@ def parse_document(file_name: str, output_format: OutputFormat = "html") -> Docu
     progress_thread.start()
 
     try:
-        dp_result = (
-            dp_loader.load()
-        )  # UpstageDocumentParse는 전체 문서를 하나의 Document로 추출함
+        if DOCUMENT_PARSE_CONCURRENCY > 1:
+            dp_result = parse_document_sharded(TERM_FILE_PATH, output_format, coordinates)
+        else:
+            dp_loader = UpstageDocumentParseLoader(
+                file_path=str(TERM_FILE_PATH),
+                output_format=output_format,
+                coordinates=coordinates,
+            )
+            # UpstageDocumentParse는 전체 문서를 하나의 Document로 추출함
+            dp_result = dp_loader.load()[0]
     finally:
         stop_event.set()
         progress_thread.join()
 
     elapsed = time.perf_counter() - start_time
     rprint(
-        f"✅document parsing done. result length: {len(dp_result)} (elapsed: {elapsed:.2f}s)"
+        f"✅document parsing done. result length: {len(dp_result.page_content)} (elapsed: {elapsed:.2f}s)"
     )
 
-    return dp_result[0]
+    save_cached_document(cache_path, dp_result)
+    rprint("✅document parse cache saved:", cache_path)
+
+    return dp_result
 
 
 def create_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run document parser graph.")
     parser.add_argument("--file-name", help="PDF file name with extension")
+    parser.add_argument(
+        "--force-reparse",
+        action="store_true",
+        help="파싱 결과 캐시를 무시하고 다시 파싱",
+    )
     return parser
 
 
 if __name__ == "__main__":
     args = create_arg_parser().parse_args()
     file_name = args.file_name
-    parse_document(file_name)
+    parse_document(file_name, force_reparse=args.force_reparse)
 
 
 # uv run python -m app.agents.document_parser.nodes.document_parser --file-name meritz_1_maum_pet_12_16.pdf
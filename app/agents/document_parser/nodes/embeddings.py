@@ -1,13 +1,105 @@
+import os
+import threading
+from typing import Dict
+
+import httpx
 from dotenv import load_dotenv
 
 from langchain_upstage import UpstageEmbeddings
 
 from rich import print as rprint
 
+from app.agents.document_parser.constants import EMBEDDING_MODEL_NAME
+
 load_dotenv()
 
+# 프로세스 전역 임베딩 클라이언트 레지스트리
+# - 모델명 별로 UpstageEmbeddings 인스턴스를 1개만 생성하고 재사용합니다.
+# - 인스턴스마다 HTTP client를 새로 만들면 요청마다 TLS handshake 비용이 발생하므로
+#   keep-alive connection pool을 가진 httpx client를 공유합니다.
+_EMBEDDINGS_REGISTRY: Dict[str, UpstageEmbeddings] = {}
+_EMBEDDINGS_REGISTRY_LOCK = threading.Lock()
+_EMBEDDINGS_STATS: Dict[str, int] = {"created": 0, "reused": 0}
+
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_ASYNC_CLIENT: httpx.AsyncClient | None = None
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("EMBEDDING_HTTP_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(
+            os.getenv("EMBEDDING_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+        ),
+        keepalive_expiry=float(os.getenv("EMBEDDING_HTTP_KEEPALIVE_EXPIRY", "60")),
+    )
+
+
+def _http_timeout() -> httpx.Timeout:
+    return httpx.Timeout(float(os.getenv("EMBEDDING_HTTP_TIMEOUT", "30")))
+
+
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """임베딩 API 호출에 공유할 keep-alive HTTP client를 반환합니다. (lock 내부에서 호출)"""
+    global _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(limits=_http_limits(), timeout=_http_timeout())
+    if _HTTP_ASYNC_CLIENT is None:
+        _HTTP_ASYNC_CLIENT = httpx.AsyncClient(
+            limits=_http_limits(), timeout=_http_timeout()
+        )
+    return _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+
+def load_underlying_embeddings(model: str = EMBEDDING_MODEL_NAME) -> UpstageEmbeddings:
+    """
+    모델별로 공유되는 UpstageEmbeddings 인스턴스를 반환합니다.
+
+    최초 호출 시에만 인스턴스를 생성하고, 이후 호출은 같은 인스턴스를 재사용합니다.
+    여러 스레드에서 동시에 호출해도 인스턴스는 1개만 생성됩니다.
+    """
+    underlying_embeddings = _EMBEDDINGS_REGISTRY.get(model)
+    if underlying_embeddings is not None:
+        with _EMBEDDINGS_REGISTRY_LOCK:
+            _EMBEDDINGS_STATS["reused"] += 1
+        return underlying_embeddings
+
+    with _EMBEDDINGS_REGISTRY_LOCK:
+        # lock 획득 전에 다른 스레드가 먼저 생성했을 수 있으므로 다시 확인합니다.
+        underlying_embeddings = _EMBEDDINGS_REGISTRY.get(model)
+        if underlying_embeddings is not None:
+            _EMBEDDINGS_STATS["reused"] += 1
+            return underlying_embeddings
+
+        http_client, http_async_client = _get_http_clients()
+        underlying_embeddings = UpstageEmbeddings(
+            model=model,
+            http_client=http_client,
+            http_async_client=http_async_client,
+        )
+        _EMBEDDINGS_REGISTRY[model] = underlying_embeddings
+        _EMBEDDINGS_STATS["created"] += 1
+        rprint("✅initialize embeddings client:", model)
 
-def load_underlying_embeddings():
-    underlying_embeddings = UpstageEmbeddings(model="solar-embedding-1-large")
-    # rprint(">>> underlying_embeddings", underlying_embeddings)
     return underlying_embeddings
+
+
+def get_embeddings_stats() -> Dict[str, int]:
+    """임베딩 클라이언트 생성/재사용 횟수를 반환합니다."""
+    with _EMBEDDINGS_REGISTRY_LOCK:
+        return {**_EMBEDDINGS_STATS, "models": len(_EMBEDDINGS_REGISTRY)}
+
+
+def reset_embeddings_registry() -> None:
+    """레지스트리와 공유 HTTP client를 정리합니다. (테스트/프로세스 종료 시 사용)"""
+    global _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+    with _EMBEDDINGS_REGISTRY_LOCK:
+        _EMBEDDINGS_REGISTRY.clear()
+        _EMBEDDINGS_STATS.update(created=0, reused=0)
+        if _HTTP_CLIENT is not None:
+            _HTTP_CLIENT.close()
+        # AsyncClient는 이벤트 루프 밖에서 닫을 수 없으므로 참조만 해제합니다.
+        _HTTP_CLIENT = None
+        _HTTP_ASYNC_CLIENT = None
@@ -0,0 +1,187 @@
+"""
+증분 적재 (청크 content hash 기반 deterministic point ID)
+
+point ID = uuid5(content hash)
+content hash = sha256(file_name, page, 청크 텍스트, tagging_version, embedding_model)
+
+같은 약관을 다시 적재하면 적재 대상 파일(metadata.doc.file_name)의 기존 point와 비교해서
+- 이미 있는 point(같은 ID)는 임베딩/upsert하지 않는다.
+  metadata(chunk_id 등)만 바뀌었으면 payload만 갱신한다. (임베딩 재사용)
+  임베딩 모델(indexing.embedding_model)은 hash에 포함되므로, 모델이 바뀌면 payload 갱신이 아니라 다시 임베딩한다.
+- 새로 생기거나 바뀐 청크만 ingest_pipeline으로 임베딩/upsert한다.
+- 이번 청크에 없는 point(stale)는 upsert가 끝난 뒤 삭제한다.
+  random UUID로 적재했던 기존 point도 여기에 포함된다.
+
+재실행해도 point가 중복되지 않고, 약관 개정 시 바뀐 청크만 임베딩한다.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+from typing import Any, Dict, List
+
+from langchain_core.documents import Document
+from langchain_qdrant import QdrantVectorStore
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchAny,
+    PointIdsList,
+    SetPayload,
+    SetPayloadOperation,
+)
+
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.document_parser.nodes.ingest_pipeline import ingest_documents
+
+# 청크 point ID 생성용 uuid5 namespace (변경하면 모든 point가 새 ID로 다시 적재됨)
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "pet-insurance-recommender.chunk")
+SCROLL_PAGE_SIZE = 256
+PAYLOAD_UPDATE_BATCH_SIZE = 256
+
+
+def chunk_content_hash(document: Document) -> str:
+    doc_metadata = document.metadata.get("doc") or {}
+    indexing = document.metadata.get("indexing") or {}
+    key = [
+        doc_metadata.get("file_name"),
+        doc_metadata.get("page"),
+        document.page_content,
+        indexing.get("tagging_version"),
+        # vector를 만든 모델이 바뀌면 같은 텍스트라도 새 point로 다시 임베딩
+        indexing.get("embedding_model"),
+    ]
+    return hashlib.sha256(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def chunk_point_id(content_hash: str) -> str:
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, content_hash))
+
+
+def _with_point_id(document: Document) -> Document:
+    content_hash = chunk_content_hash(document)
+    metadata = {
+        **document.metadata,
+        "indexing": {**(document.metadata.get("indexing") or {}), "content_hash": content_hash},
+    }
+    return Document(
+        id=chunk_point_id(content_hash), page_content=document.page_content, metadata=metadata
+    )
+
+
+def _metadata_key(metadata: Dict[str, Any] | None) -> str:
+    # Qdrant payload(JSON)와 비교할 수 있도록 직렬화 결과로 비교
+    return json.dumps(metadata, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _existing_points(vector_store: QdrantVectorStore, file_names: List[str]) -> Dict[str, str]:
+    """file_names에 속한 기존 point의 {ID: metadata 직렬화 결과}를 반환합니다."""
+    metadata_key = vector_store.metadata_payload_key
+    scroll_filter = Filter(
+        must=[FieldCondition(key=f"{metadata_key}.doc.file_name", match=MatchAny(any=file_names))]
+    )
+    points: Dict[str, str] = {}
+    offset = None
+    while True:
+        records, offset = vector_store.client.scroll(
+            collection_name=vector_store.collection_name,
+            scroll_filter=scroll_filter,
+            limit=SCROLL_PAGE_SIZE,
+            offset=offset,
+            with_payload=[metadata_key],
+            with_vectors=False,
+        )
+        for record in records:
+            points[str(record.id)] = _metadata_key((record.payload or {}).get(metadata_key))
+        if offset is None:
+            return points
+
+
+def _update_metadata(vector_store: QdrantVectorStore, documents: List[Document]) -> None:
+    for start in range(0, len(documents), PAYLOAD_UPDATE_BATCH_SIZE):
+        vector_store.client.batch_update_points(
+            collection_name=vector_store.collection_name,
+            update_operations=[
+                SetPayloadOperation(
+                    set_payload=SetPayload(
+                        payload={vector_store.metadata_payload_key: document.metadata},
+                        points=[document.id],
+                    )
+                )
+                for document in documents[start : start + PAYLOAD_UPDATE_BATCH_SIZE]
+            ],
+            wait=True,
+        )
+
+
+def sync_documents(vector_store: QdrantVectorStore, documents: List[Document]) -> Dict[str, Any]:
+    """
+    documents의 파일 단위로 Qdrant collection을 documents와 같은 상태로 맞추고 diff 결과를 반환합니다.
+
+    Returns:
+        files, chunks, duplicates, unchanged, metadata_updated, added, deleted, elapsed_s, ingest(처리량 통계)
+    """
+    start_time = time.perf_counter()
+
+    targets: Dict[str, Document] = {}
+    for document in map(_with_point_id, documents):
+        # 같은 페이지의 같은 텍스트 청크는 1개만 적재
+        targets.setdefault(document.id, document)
+    file_names = sorted({(d.metadata.get("doc") or {}).get("file_name") for d in targets.values()})
+
+    existing = _existing_points(vector_store, file_names)
+    added = [d for point_id, d in targets.items() if point_id not in existing]
+    metadata_updated = [
+        d
+        for point_id, d in targets.items()
+        if point_id in existing and existing[point_id] != _metadata_key(d.metadata)
+    ]
+    stale_ids = [point_id for point_id in existing if point_id not in targets]
+
+    ingest_stats = ingest_documents(vector_store, added) if added else None
+    if metadata_updated:
+        _update_metadata(vector_store, metadata_updated)
+    # 새 point 적재 후 삭제하여 재적재 중에도 검색 결과가 비지 않게 함
+    if stale_ids:
+        vector_store.client.delete(
+            collection_name=vector_store.collection_name,
+            points_selector=PointIdsList(points=stale_ids),
+            wait=True,
+        )
+
+    return {
+        "files": file_names,
+        "chunks": len(documents),
+        "duplicates": len(documents) - len(targets),
+        "unchanged": len(targets) - len(added) - len(metadata_updated),
+        "metadata_updated": len(metadata_updated),
+        "added": len(added),
+        "deleted": len(stale_ids),
+        "elapsed_s": time.perf_counter() - start_time,
+        "ingest": ingest_stats,
+    }
+
+
+def print_diff_report(report: Dict[str, Any]) -> None:
+    table = Table(title=f"ingest diff ({', '.join(report['files'])})")
+    for column in ("chunks", "unchanged", "metadata_updated", "added", "deleted", "duplicates"):
+        table.add_column(column, justify="right")
+    table.add_row(
+        *(
+            str(report[column])
+            for column in ("chunks", "unchanged", "metadata_updated", "added", "deleted", "duplicates")
+        )
+    )
+    rprint(table)
+
+    ingest_stats = report["ingest"]
+    if ingest_stats:
+        rprint(
+            f"✅embedded {ingest_stats['chunks']} chunks "
+            f"({ingest_stats['chunks_per_s']:.1f} chunks/s, "
+            f"time-to-first-upsert: {ingest_stats['time_to_first_upsert_s']:.2f}s)"
+        )
+    rprint(f"✅sync complete (elapsed: {report['elapsed_s']:.2f}s)")
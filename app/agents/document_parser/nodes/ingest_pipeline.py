@@ -0,0 +1,288 @@
+"""
+약관 청크 적재 파이프라인 (batch 임베딩 동시 실행 + 병렬 upsert)
+
+QdrantVectorStore.add_documents는 임베딩 API를 순차 호출한 뒤 upsert하므로 수백 페이지 약관 적재에 수 분이 걸린다.
+이 모듈은 다음 순서로 적재한다.
+- 청크를 EMBEDDING_BATCH_SIZE 단위 batch로 나눈다. (batch 1개 = 임베딩 API 요청 1개)
+- 최대 EMBEDDING_CONCURRENCY개 batch를 동시에 임베딩한다.
+  요청 수(EMBEDDING_RPM)와 토큰 수(EMBEDDING_TPM)는 token bucket으로 제한한다.
+- 429/5xx/연결 오류는 exponential backoff + jitter로 재시도한다.
+  429 응답이면 Retry-After 동안 다른 worker의 요청도 함께 멈춘다.
+- 임베딩이 끝난 batch부터 바로 Qdrant에 병렬 upsert한다. (QDRANT_UPSERT_CONCURRENCY)
+
+적재가 끝나면 chunks/sec와 첫 upsert 완료까지 걸린 시간(time-to-first-upsert)을 반환한다.
+payload/vector 형식은 QdrantVectorStore.add_documents와 같다.
+"""
+
+import os
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List
+
+from langchain_core.documents import Document
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
+from langchain_upstage import UpstageEmbeddings
+from qdrant_client.models import PointStruct, SparseVector
+
+from rich import print as rprint
+
+# Upstage 임베딩 API의 요청당 최대 text 수 (langchain_upstage.embeddings.MAX_EMBED_BATCH_SIZE)
+MAX_EMBED_BATCH_SIZE = 100
+RETRY_BACKOFF_BASE_S = 1.0
+RETRY_BACKOFF_MAX_S = 30.0
+
+
+class TokenBucket:
+    """
+    분당 허용량을 초 단위로 채우는 thread-safe token bucket
+
+    rate_per_minute가 0 이하이면 호출 수는 제한하지 않고 pause만 적용한다. bucket 크기(burst)는 1분 허용량이다.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.rate_per_second = rate_per_minute / 60
+        self.capacity = rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """seconds 동안 모든 acquire를 멈춥니다. (429 Retry-After)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait_for_pause(self) -> float:
+        """pause가 끝날 때까지 대기하고, 대기한 시간(s)을 반환합니다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._paused_until - time.monotonic()
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """amount만큼 token이 찰 때까지 대기하고, 대기한 시간(s)을 반환합니다."""
+        # 호출 제한이 없어도(rate 0) 429 Retry-After pause는 지켜야 함
+        waited = self._wait_for_pause()
+        if self.rate_per_second <= 0:
+            return waited
+        # bucket 크기보다 큰 요청이 영원히 대기하지 않도록 제한
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second
+                )
+                self._updated_at = now
+                if now >= self._paused_until and self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = max(
+                    self._paused_until - now, (amount - self._tokens) / self.rate_per_second
+                )
+            time.sleep(wait)
+            waited += wait
+
+
+def _retryable_exceptions() -> tuple[type[BaseException], ...]:
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    )
+
+    return (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _estimate_tokens(texts: List[str]) -> int:
+    # 한국어 약관은 토큰 수가 문자 수보다 적으므로 문자 수를 보수적인 근사치로 사용
+    return sum(len(text) for text in texts)
+
+
+def _batch_embeddings(embeddings, batch_size: int):
+    # UpstageEmbeddings는 embed_batch_size(기본 10)마다 API를 순차 호출하므로
+    # 파이프라인 batch 1개가 API 요청 1개가 되도록 맞춘다. (HTTP client는 공유)
+    # openai client의 내부 재시도(기본 max_retries=2)를 끄고 _with_retry에서만 재시도해야
+    # 429가 바로 bucket pause로 이어지고, batch당 요청 수가 max_retries + 1을 넘지 않는다.
+    # model_copy는 openai client를 다시 만들지 않으므로 새 인스턴스를 생성한다.
+    if isinstance(embeddings, UpstageEmbeddings):
+        return UpstageEmbeddings(
+            model=embeddings.model,
+            upstage_api_key=embeddings.upstage_api_key,
+            upstage_api_base=embeddings.upstage_api_base,
+            request_timeout=embeddings.request_timeout,
+            default_headers=embeddings.default_headers,
+            default_query=embeddings.default_query,
+            model_kwargs=embeddings.model_kwargs,
+            embed_batch_size=batch_size,
+            max_retries=0,
+            http_client=embeddings.http_client,
+            http_async_client=embeddings.http_async_client,
+        )
+    return embeddings
+
+
+class IngestPipeline:
+    """
+    Args:
+        vector_store: setup_vector_store로 만든 QdrantVectorStore (collection, vector 이름, 임베딩 설정 사용)
+        batch_size: 임베딩 API 요청 1개에 담을 청크 수
+        concurrency: 동시에 실행할 임베딩 요청 수
+        upsert_concurrency: 동시에 실행할 Qdrant upsert 수
+        requests_per_minute, tokens_per_minute: 임베딩 API 호출 제한 (0이면 미사용)
+        max_retries: 임베딩 요청 재시도 횟수
+    """
+
+    def __init__(
+        self,
+        vector_store: QdrantVectorStore,
+        batch_size: int = 32,
+        concurrency: int = 4,
+        upsert_concurrency: int = 2,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        max_retries: int = 5,
+    ):
+        self.vector_store = vector_store
+        self.batch_size = max(1, min(batch_size, MAX_EMBED_BATCH_SIZE))
+        self.concurrency = max(1, concurrency)
+        self.upsert_concurrency = max(1, upsert_concurrency)
+        self.max_retries = max_retries
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+        self.embeddings = _batch_embeddings(vector_store.embeddings, self.batch_size)
+        self.sparse_embeddings = (
+            vector_store.sparse_embeddings
+            if vector_store.retrieval_mode == RetrievalMode.HYBRID
+            else None
+        )
+
+    @classmethod
+    def from_env(cls, vector_store: QdrantVectorStore) -> "IngestPipeline":
+        return cls(
+            vector_store,
+            batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "32")),
+            concurrency=int(os.getenv("EMBEDDING_CONCURRENCY", "4")),
+            upsert_concurrency=int(os.getenv("QDRANT_UPSERT_CONCURRENCY", "2")),
+            requests_per_minute=float(os.getenv("EMBEDDING_RPM", "0")),
+            tokens_per_minute=float(os.getenv("EMBEDDING_TPM", "0")),
+            max_retries=int(os.getenv("EMBEDDING_MAX_RETRIES", "5")),
+        )
+
+    def _with_retry(self, fn: Callable[[], Any]) -> Any:
+        from openai import RateLimitError
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                return fn()
+            except _retryable_exceptions() as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = _retry_after_seconds(e) or min(
+                    RETRY_BACKOFF_MAX_S, RETRY_BACKOFF_BASE_S * 2**attempt
+                ) * random.uniform(0.5, 1.5)
+                if isinstance(e, RateLimitError):
+                    # 다른 worker도 함께 대기해야 429가 연쇄적으로 발생하지 않음
+                    self.request_bucket.pause(delay)
+                rprint(
+                    f"⚠️embedding retry {attempt + 1}/{self.max_retries} in {delay:.1f}s:",
+                    type(e).__name__,
+                )
+                time.sleep(delay)
+
+    def _embed_batch(self, documents: List[Document]) -> List[PointStruct]:
+        texts = [document.page_content for document in documents]
+
+        def _embed() -> List[List[float]]:
+            self.request_bucket.acquire()
+            self.token_bucket.acquire(_estimate_tokens(texts))
+            return self.embeddings.embed_documents(texts)
+
+        dense_vectors = self._with_retry(_embed)
+        sparse_vectors = (
+            self.sparse_embeddings.embed_documents(texts) if self.sparse_embeddings else None
+        )
+
+        points = []
+        for i, (document, dense_vector) in enumerate(zip(documents, dense_vectors)):
+            vector = {self.vector_store.vector_name: dense_vector}
+            if sparse_vectors is not None:
+                vector[self.vector_store.sparse_vector_name] = SparseVector(
+                    indices=sparse_vectors[i].indices, values=sparse_vectors[i].values
+                )
+            points.append(
+                PointStruct(
+                    id=document.id or uuid.uuid4().hex,
+                    vector=vector,
+                    payload={
+                        self.vector_store.content_payload_key: document.page_content,
+                        self.vector_store.metadata_payload_key: document.metadata,
+                    },
+                )
+            )
+        return points
+
+    def _upsert(self, points: List[PointStruct]) -> tuple[int, float]:
+        self.vector_store.client.upsert(
+            collection_name=self.vector_store.collection_name, points=points, wait=True
+        )
+        return len(points), time.perf_counter()
+
+    def run(self, documents: List[Document]) -> Dict[str, Any]:
+        """documents를 임베딩/적재하고 처리량 통계를 반환합니다."""
+        batches = [
+            documents[i : i + self.batch_size] for i in range(0, len(documents), self.batch_size)
+        ]
+        start_time = time.perf_counter()
+        first_upsert_at = None
+        upserted = 0
+
+        embed_pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="ingest-embed")
+        upsert_pool = ThreadPoolExecutor(self.upsert_concurrency, thread_name_prefix="ingest-upsert")
+        try:
+            embed_futures = [embed_pool.submit(self._embed_batch, batch) for batch in batches]
+            # 임베딩이 끝난 batch부터 upsert 시작 (batch 순서와 무관)
+            upsert_futures = [
+                upsert_pool.submit(self._upsert, future.result())
+                for future in as_completed(embed_futures)
+            ]
+            for future in as_completed(upsert_futures):
+                count, finished_at = future.result()
+                upserted += count
+                first_upsert_at = min(first_upsert_at or finished_at, finished_at)
+        finally:
+            # 실패 시 대기 중인 batch는 취소 (실행 중인 요청은 완료까지 대기)
+            embed_pool.shutdown(cancel_futures=True)
+            upsert_pool.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - start_time
+        return {
+            "chunks": upserted,
+            "batches": len(batches),
+            "elapsed_s": elapsed,
+            "chunks_per_s": upserted / elapsed if elapsed > 0 else 0.0,
+            "time_to_first_upsert_s": first_upsert_at - start_time if first_upsert_at else None,
+        }
+
+
+def ingest_documents(vector_store: QdrantVectorStore, documents: List[Document]) -> Dict[str, Any]:
+    """환경 변수 설정(EMBEDDING_BATCH_SIZE 등)으로 documents를 적재하고 처리량 통계를 반환합니다."""
+    return IngestPipeline.from_env(vector_store).run(documents)
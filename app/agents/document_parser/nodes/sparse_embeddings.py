@@ -0,0 +1,143 @@
+"""
+한국어 BM25 sparse 임베딩 (hybrid 검색용)
+
+외부 API 호출 없이 로컬에서 토큰화해 Qdrant named sparse vector를 만든다.
+- 문서: BM25 TF 가중치 (k1, b, 평균 문서 길이 기준 길이 정규화)
+- 질의: 고유 토큰별 1.0
+- IDF: collection의 sparse vector 설정(Modifier.IDF)으로 Qdrant 서버가 계산
+
+토큰 index는 토큰 문자열의 crc32이므로 vocabulary 파일 없이 적재/검색 프로세스가 같은 index를 만든다.
+적재와 검색은 같은 tokenizer(RAG_SPARSE_TOKENIZER)를 사용해야 한다.
+
+tokenizer
+- bigram (기본): 한글은 음절 bigram, 영문/숫자는 단어 단위
+    조사가 붙은 어절("슬개골탈구는", "면책기간의")에서도 "슬개", "개골", "면책"이 일치한다.
+- kiwi: 형태소 분석(kiwipiepy) 후 명사/어근/외국어/숫자만 사용 (`uv add kiwipiepy` 필요)
+"""
+
+import os
+import re
+import threading
+import unicodedata
+import zlib
+from collections import Counter
+from typing import Callable, List
+
+from langchain_qdrant.sparse_embeddings import SparseEmbeddings, SparseVector
+
+from rich import print as rprint
+
+DEFAULT_SPARSE_TOKENIZER = "bigram"
+
+_WORD_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]+")
+# 형태소 분석 시 검색어로 사용할 품사 (일반/고유 명사, 어근, 외국어, 숫자)
+_KIWI_TAGS = {"NNG", "NNP", "XR", "SL", "SN"}
+
+_global_sparse_embeddings: "KoreanBM25SparseEmbeddings | None" = None
+_sparse_embeddings_lock = threading.Lock()
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize_bigram(text: str) -> List[str]:
+    tokens: List[str] = []
+    for word in _WORD_PATTERN.findall(_normalize(text)):
+        if _HANGUL_PATTERN.fullmatch(word) and len(word) > 1:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _create_kiwi_tokenizer() -> Callable[[str], List[str]]:
+    try:
+        from kiwipiepy import Kiwi
+    except ImportError as e:
+        raise ImportError(
+            "kiwi tokenizer를 사용하려면 `uv add kiwipiepy`를 실행하세요."
+        ) from e
+
+    kiwi = Kiwi()
+
+    def tokenize_kiwi(text: str) -> List[str]:
+        return [
+            token.form
+            for token in kiwi.tokenize(_normalize(text))
+            if token.tag in _KIWI_TAGS
+        ]
+
+    return tokenize_kiwi
+
+
+def _token_index(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+class KoreanBM25SparseEmbeddings(SparseEmbeddings):
+    """
+    Args:
+        tokenizer: "bigram" | "kiwi"
+        k1, b: BM25 파라미터
+        avg_doc_len: 문서 길이 정규화에 사용할 평균 토큰 수 (corpus 통계 대신 고정값 사용)
+    """
+
+    def __init__(
+        self,
+        tokenizer: str = DEFAULT_SPARSE_TOKENIZER,
+        k1: float = 1.2,
+        b: float = 0.75,
+        avg_doc_len: float = 256.0,
+    ):
+        if tokenizer == "bigram":
+            self.tokenize = tokenize_bigram
+        elif tokenizer == "kiwi":
+            self.tokenize = _create_kiwi_tokenizer()
+        else:
+            raise ValueError(f"unknown sparse tokenizer: {tokenizer} (available: bigram, kiwi)")
+        self.tokenizer = tokenizer
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_len = avg_doc_len
+
+    def _to_sparse_vector(self, weights: dict[int, float]) -> SparseVector:
+        indices = sorted(weights)
+        return SparseVector(indices=indices, values=[weights[index] for index in indices])
+
+    def embed_document(self, text: str) -> SparseVector:
+        tokens = self.tokenize(text)
+        length_norm = self.k1 * (1 - self.b + self.b * len(tokens) / self.avg_doc_len)
+        weights: dict[int, float] = {}
+        for token, tf in Counter(tokens).items():
+            # crc32 충돌 시 같은 index의 가중치를 합산
+            index = _token_index(token)
+            weights[index] = weights.get(index, 0.0) + tf * (self.k1 + 1) / (tf + length_norm)
+        return self._to_sparse_vector(weights)
+
+    def embed_documents(self, texts: list[str]) -> list[SparseVector]:
+        return [self.embed_document(text) for text in texts]
+
+    def embed_query(self, text: str) -> SparseVector:
+        return self._to_sparse_vector(
+            {_token_index(token): 1.0 for token in set(self.tokenize(text))}
+        )
+
+
+def load_sparse_embeddings() -> KoreanBM25SparseEmbeddings:
+    """프로세스 전역에서 공유하는 sparse 임베딩 인스턴스를 반환합니다."""
+    global _global_sparse_embeddings
+
+    if _global_sparse_embeddings is None:
+        with _sparse_embeddings_lock:
+            if _global_sparse_embeddings is None:
+                _global_sparse_embeddings = KoreanBM25SparseEmbeddings(
+                    tokenizer=os.getenv("RAG_SPARSE_TOKENIZER", DEFAULT_SPARSE_TOKENIZER),
+                    avg_doc_len=float(os.getenv("RAG_SPARSE_AVG_DOC_LEN", "256")),
+                )
+                rprint(
+                    "✅initialize sparse embeddings:",
+                    _global_sparse_embeddings.tokenizer,
+                )
+    return _global_sparse_embeddings
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import List
-
-from bs4 import BeautifulSoup, Tag
+from typing import Iterator, List
 
 from langchain_core.documents import Document
 from langchain_upstage.document_parse import OutputFormat
 
 from app.agents.document_parser.constants import TERMS_DIR
+from app.agents.document_parser.nodes.artifact_sink import ArtifactSink, get_artifact_sink
 
 
 product_name_by_code = {
@@ -44,27 +44,6 @@ def _norm_text(s: str) -> str:
     return s.strip()
 
 
-def _extract_table_text(table_tag: Tag) -> str:
-    """
-    <table> → 행(row) 단위 텍스트로 변환
-    각 셀(cell)은 ' | ' 로 연결
-    """
-    rows = []
-
-    for tr in table_tag.find_all("tr", recursive=True):
-        cells = []
-        for cell in tr.find_all(["td", "th"], recursive=False):
-            text = cell.get_text(" ", strip=True)
-            if text:
-                cells.append(text)
-
-        if cells:
-            row_text = " | ".join(cells)
-            rows.append(row_text)
-
-    return "\n".join(rows)
-
-
 def _dedup_keep_order(items: List[str]) -> List[str]:
     seen = set()
     unique: List[str] = []
@@ -76,6 +55,177 @@ def _dedup_keep_order(items: List[str]) -> List[str]:
     return unique
 
 
+# 텍스트를 추출하는 block 태그 (중첩된 경우 가장 바깥 태그 기준으로 1번만 추출)
+_TEXT_TAGS = {"p", "h1", "h2", "h3", "li", "div", "span"}
+_VOID_TAGS = {"br", "img", "hr", "meta", "link", "input", "col", "area", "base", "wbr", "source"}
+_FEED_SIZE = 64 * 1024
+
+
+@dataclass
+class _Block:
+    tag: str
+    start: int
+    depth: int
+    parts: List[str] = field(default_factory=list)
+    # table 전용: 행(row)별 셀 텍스트
+    rows: List[List[str]] = field(default_factory=list)
+    cell_parts: List[str] | None = None
+
+
+class _PageSplitParser(HTMLParser):
+    """
+    Upstage Document Parse HTML을 한 번 순회하며 footer 페이지 마커마다 PageDoc을 만드는 event handler
+
+    - block 태그(_TEXT_TAGS, table)는 가장 바깥 태그에서만 텍스트를 추출한다. (중첩 태그 텍스트 중복 없음)
+    - table은 행 단위 텍스트로 변환하고 각 셀은 ' | '로 연결한다.
+    - 페이지 HTML은 원본 HTML에서 block 범위를 잘라 사용한다.
+    """
+
+    def __init__(self, source: str):
+        super().__init__(convert_charrefs=True)
+        self.source = source
+        # getpos()(line, column) → 원본 offset 변환용 각 줄의 시작 offset
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", source)]
+        self._stack: List[str] = []
+        self._block: _Block | None = None
+        self._footer_depth: int | None = None
+        self._footer_parts: List[str] = []
+        # feed 경계에서 나뉜 텍스트를 하나로 합치기 위한 버퍼
+        self._data: List[str] = []
+
+        self._buf_text: List[str] = []
+        self._buf_html: List[str] = []
+        self._buf_ids: List[str] = []
+        # iter_page_docs가 반환한 PageDoc은 비우므로 마지막 페이지 번호를 따로 기록
+        self.page_docs: List[PageDoc] = []
+        self._last_page_number = 0
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    def _flush_data(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data).strip()
+        self._data.clear()
+        if not text:
+            return
+        if self._footer_depth is not None:
+            self._footer_parts.append(text)
+        elif self._block is not None:
+            if self._block.cell_parts is not None:
+                self._block.cell_parts.append(text)
+            elif self._block.tag != "table":
+                self._block.parts.append(text)
+
+    def handle_data(self, data: str) -> None:
+        if self._block is not None or self._footer_depth is not None:
+            self._data.append(data)
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush_data()
+        depth = len(self._stack)
+        if tag not in _VOID_TAGS:
+            self._stack.append(tag)
+
+        block = self._block
+        if block is None and self._footer_depth is None:
+            if tag == "footer":
+                self._footer_depth = depth
+                self._footer_parts = []
+            elif tag in _TEXT_TAGS or tag == "table":
+                self._block = block = _Block(tag=tag, start=self._offset(), depth=depth)
+        elif block is not None and block.tag == "table":
+            if tag == "tr":
+                block.rows.append([])
+            elif tag in ("td", "th") and block.cell_parts is None:
+                block.cell_parts = []
+
+        if block is not None and (tag in _TEXT_TAGS or tag == "table"):
+            node_id = dict(attrs).get("id")
+            if node_id:
+                self._buf_ids.append(str(node_id))
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_data()
+        if tag not in self._stack:
+            return
+        # 닫히지 않은 하위 태그까지 함께 닫음
+        while self._stack:
+            depth = len(self._stack) - 1
+            closed = self._stack.pop()
+            self._close(closed, depth)
+            if closed == tag:
+                return
+
+    def _close(self, tag: str, depth: int, end: int | None = None) -> None:
+        block = self._block
+        if block is not None and block.tag == "table" and block.cell_parts is not None:
+            if tag in ("td", "th"):
+                cell_text = " ".join(block.cell_parts)
+                if cell_text and block.rows:
+                    block.rows[-1].append(cell_text)
+                block.cell_parts = None
+
+        if block is not None and depth == block.depth:
+            if end is None:
+                end = self.source.find(">", self._offset()) + 1
+            if block.tag == "table":
+                text = "\n".join(" | ".join(cells) for cells in block.rows if cells)
+            else:
+                text = " ".join(block.parts)
+            if text:
+                self._buf_text.append(text)
+            self._buf_html.append(self.source[block.start : end])
+            self._block = None
+        elif self._footer_depth is not None and depth == self._footer_depth:
+            self._footer_depth = None
+            m = _PAGE_RE.match("".join(self._footer_parts))
+            if m:
+                self._emit_page(int(m.group(1)))
+
+    def _emit_page(self, page_number: int) -> None:
+        self._last_page_number = page_number
+        self.page_docs.append(
+            PageDoc(
+                page_number=page_number,
+                text=_norm_text("\n".join(self._buf_text)),
+                html="\n".join(self._buf_html).strip(),
+                anchor_ids=_dedup_keep_order(self._buf_ids),
+            )
+        )
+        self._buf_text.clear()
+        self._buf_html.clear()
+        self._buf_ids.clear()
+
+    def close(self) -> None:
+        super().close()
+        self._flush_data()
+        # 문서 끝까지 닫히지 않은 태그를 닫음
+        while self._stack:
+            depth = len(self._stack) - 1
+            self._close(self._stack.pop(), depth, end=len(self.source))
+        # 마지막 페이지 footer가 누락된 경우를 대비한 fallback
+        if self._buf_text:
+            self._emit_page(self._last_page_number + 1)
+
+
+def iter_page_docs(full_html: str) -> Iterator[PageDoc]:
+    """
+    HTML을 순서대로 읽으며 footer 페이지 마커를 만날 때마다 PageDoc을 반환합니다.
+
+    footer가 없는 마지막 페이지는 직전 페이지 번호 + 1로 반환합니다.
+    """
+    parser = _PageSplitParser(full_html)
+    for start in range(0, len(full_html), _FEED_SIZE):
+        parser.feed(full_html[start : start + _FEED_SIZE])
+        yield from parser.page_docs
+        parser.page_docs.clear()
+    parser.close()
+    yield from parser.page_docs
+
+
 def split_pages_and_add_metadata(
     full_document: Document,
     file_name: str,
@@ -118,95 +268,9 @@ def split_pages_and_add_metadata(
         raise ValueError("❗️split_pages_and_add_metadata invalid params")
 
     result: List[Document] = []
+    sink = get_artifact_sink()
 
-    full_html = full_document.page_content
-    soup = BeautifulSoup(full_html, "html.parser")
-
-    root = soup.body if soup.body else soup
-
-    page_docs: List[PageDoc] = []
-    buf_text: List[str] = []
-    buf_html: List[str] = []
-    buf_ids: List[str] = []
-
-    for node in root.descendants:
-        if not isinstance(node, Tag):
-            continue
-
-        # -------------------------
-        # 1. 페이지 마커 처리
-        # -------------------------
-        if node.name == "footer":
-            raw = node.get_text(strip=True)
-            m = _PAGE_RE.match(raw)
-            if m:
-                page_num = int(m.group(1))
-                text = _norm_text("\n".join(buf_text))
-
-                page_docs.append(
-                    PageDoc(
-                        page_number=page_num,
-                        text=text,
-                        html="\n".join(buf_html).strip(),
-                        anchor_ids=_dedup_keep_order(buf_ids),
-                    )
-                )
-
-                buf_text.clear()
-                buf_html.clear()
-                buf_ids.clear()
-
-            continue
-
-        # -------------------------
-        # 2. Table 처리 (중복 방지)
-        # -------------------------
-        if node.name == "table":
-            table_text = _extract_table_text(node)
-            if table_text:
-                buf_text.append(table_text)
-            buf_html.append(str(node))
-
-            node_id = node.get("id")
-            if node_id:
-                buf_ids.append(str(node_id))
-
-            # table 내부는 여기서 이미 처리했으므로
-            # descendants 순회 중복 방지 위해 skip
-            continue
-
-        # -------------------------
-        # 3. 일반 텍스트 태그 처리
-        # -------------------------
-        if node.name in {
-            "p",
-            "h1",
-            "h2",
-            "h3",
-            "li",
-            "div",
-            "span",
-        }:
-            text = node.get_text(" ", strip=True)
-            if text:
-                buf_text.append(text)
-            buf_html.append(str(node))
-
-            node_id = node.get("id")
-            if node_id:
-                buf_ids.append(str(node_id))
-
-    # 마지막 페이지 footer가 누락된 경우를 대비한 fallback
-    if buf_text:
-        inferred_page = page_docs[-1].page_number + 1 if page_docs else 1
-        page_docs.append(
-            PageDoc(
-                page_number=inferred_page,
-                text=_norm_text("\n".join(buf_text)),
-                html="\n".join(buf_html).strip(),
-                anchor_ids=_dedup_keep_order(buf_ids),
-            )
-        )
+    page_docs = list(iter_page_docs(full_document.page_content))
 
     total_pages = len(page_docs)
     insurer_code = file_name.split("_")[0]
@@ -241,37 +305,48 @@ def split_pages_and_add_metadata(
         result.append(new_doc)
 
         target_dir = TERMS_DIR / file_name.split(".")[0] / output_format
-        create_page_html_and_text_files(
+        add_page_artifacts(
+            sink=sink,
             page_doc=page_doc,
             target_dir=target_dir,
             output_format=output_format,
-            overwrite=True,
         )
 
+    # 페이지 산출물 쓰기가 끝날 때까지 대기 (background write)
+    sink.flush()
+
     return result
 
 
-def create_page_html_and_text_files(
+def page_artifact_files(
     *,
     page_doc: PageDoc,
     target_dir: Path,
     output_format: OutputFormat = "html",
-    overwrite: bool = True,
-):
-    target_dir.mkdir(parents=True, exist_ok=True)
-
+) -> List[tuple[Path, str]]:
+    """페이지별 로컬 저장 파일 (경로, 내용) 목록: 원본 포맷 파일 + 텍스트 파일"""
     output_extension = output_extension_by_format.get(output_format)
     if output_extension is None:
         raise ValueError(f"Unsupported output_format: {output_format}")
 
     file_name = f"{target_dir.parent.name}_page_{page_doc.page_number}"
+    return [
+        (target_dir / f"{file_name}.{output_extension}", page_doc.html),
+        (target_dir / f"{file_name}.txt", page_doc.text),
+    ]
 
-    page_file_name = f"{file_name}.{output_extension}"
-    page_file_path = target_dir / page_file_name
-    if overwrite or not page_file_path.exists():
-        page_file_path.write_text(page_doc.html, encoding="utf-8")
 
-    text_file_name = f"{file_name}.txt"
-    text_file_path = target_dir / text_file_name
-    if overwrite or not text_file_path.exists():
-        text_file_path.write_text(page_doc.text, encoding="utf-8")
+def add_page_artifacts(
+    *,
+    sink: ArtifactSink,
+    page_doc: PageDoc,
+    target_dir: Path,
+    output_format: OutputFormat = "html",
+) -> None:
+    """페이지 산출물을 sink에 추가합니다. (통합 파일 레코드 + 선택 시 페이지별 파일)"""
+    if sink.per_file:
+        for file_path, content in page_artifact_files(
+            page_doc=page_doc, target_dir=target_dir, output_format=output_format
+        ):
+            sink.write_text(file_path, content)
+    sink.add_record(target_dir.parent / f"{target_dir.parent.name}_pages", asdict(page_doc))
@@ -0,0 +1,173 @@
+"""page_splitter.iter_page_docs 테스트 (기존 BeautifulSoup descendants 순회 방식과 비교).
+
+실행 예시:
+    uv run pytest app/agents/document_parser/nodes/splitter/test_page_splitter.py
+"""
+
+from typing import List
+
+import pytest
+
+from app.agents.document_parser.bench_page_splitter import legacy_page_docs
+from app.agents.document_parser.nodes.splitter import page_splitter
+from app.agents.document_parser.nodes.splitter.page_splitter import (
+    _FEED_SIZE,
+    PageDoc,
+    iter_page_docs,
+)
+
+
+def _element(element_id: str, tag: str, body: str, category: str) -> str:
+    return f"<{tag} id='{element_id}' data-category='{category}' style='font-size:14px'>{body}</{tag}>"
+
+
+def _flat_page(page_number: int) -> str:
+    """중첩 block 태그가 없는 Upstage 형식의 페이지 (p, table, footer)"""
+    parts = [
+        _element(
+            f"{page_number}-{i}",
+            "p",
+            f"제{page_number}조({i}) 회사는 보험금을 지급합니다 &amp; 보장<br>다음 줄 {i}",
+            "paragraph",
+        )
+        for i in range(6)
+    ]
+    parts.append(
+        _element(
+            f"{page_number}-t",
+            "table",
+            "<tr><th>구분</th><th>보장 내용</th></tr>"
+            f"<tr><td>통원</td><td>{page_number}만원 한도</td></tr>",
+            "table",
+        )
+    )
+    parts.append(_element(f"{page_number}-f", "footer", str(page_number), "footer"))
+    return "".join(parts)
+
+
+def _flat_html(pages: int, prefix: str = "") -> str:
+    return prefix + "".join(_flat_page(page_number) for page_number in range(1, pages + 1))
+
+
+def _streaming(full_html: str) -> List[PageDoc]:
+    return list(iter_page_docs(full_html))
+
+
+def _without_html(page_docs: List[PageDoc]) -> list:
+    # legacy는 BeautifulSoup이 다시 직렬화한 HTML을 반환하므로 HTML은 비교하지 않음
+    return [(doc.page_number, doc.text, doc.anchor_ids) for doc in page_docs]
+
+
+def test_flat_html_matches_legacy():
+    full_html = _flat_html(pages=5)
+
+    assert _without_html(_streaming(full_html)) == _without_html(legacy_page_docs(full_html))
+
+
+def test_html_is_source_markup():
+    full_html = _flat_html(pages=2)
+
+    page_docs = _streaming(full_html)
+
+    assert page_docs[0].html.split("\n")[0] == _element(
+        "1-0", "p", "제1조(0) 회사는 보험금을 지급합니다 &amp; 보장<br>다음 줄 0", "paragraph"
+    )
+    for page_doc in page_docs:
+        for line in page_doc.html.split("\n"):
+            assert line in full_html
+
+
+def test_nested_elements_are_extracted_once():
+    full_html = (
+        "<div id='1' data-category='list'><ul>"
+        "<li id='1-0'>a &amp; b</li><li id='1-1'>c</li>"
+        "</ul></div>"
+        "<p id='2'>d<br>e</p>"
+        "<table id='3'><tr><td>x</td><td>y</td></tr></table>"
+        "<footer id='4'>1</footer>"
+        "<p id='5'>tail</p>"
+    )
+
+    streaming = _streaming(full_html)
+    legacy = legacy_page_docs(full_html)
+
+    assert [doc.page_number for doc in streaming] == [doc.page_number for doc in legacy] == [1, 2]
+    assert [doc.anchor_ids for doc in streaming] == [doc.anchor_ids for doc in legacy]
+    # legacy는 div와 안쪽 li의 텍스트를 모두 추출(중복), streaming은 바깥 block만 추출
+    assert legacy[0].text == "a & b c\na & b\nc\nd e\nx | y"
+    assert streaming[0].text == "a & b c\nd e\nx | y"
+    assert streaming[1].text == legacy[1].text == "tail"
+
+
+def test_missing_last_footer_uses_next_page_number():
+    full_html = _flat_html(pages=3) + _element("4-0", "p", "마지막 페이지", "paragraph")
+
+    streaming = _streaming(full_html)
+
+    assert [doc.page_number for doc in streaming] == [1, 2, 3, 4]
+    assert _without_html(streaming) == _without_html(legacy_page_docs(full_html))
+
+
+def test_unclosed_trailing_block_is_kept():
+    full_html = _flat_html(pages=1) + "<p id='2-0'>닫히지 않은 문단"
+
+    streaming = _streaming(full_html)
+
+    assert streaming[-1].page_number == 2
+    assert streaming[-1].text == "닫히지 않은 문단"
+
+
+@pytest.fixture
+def single_feed(monkeypatch):
+    """문서 전체를 feed 1회로 처리하는 iter_page_docs (feed 경계 영향 없음)"""
+
+    def _run(full_html: str) -> List[PageDoc]:
+        monkeypatch.setattr(page_splitter, "_FEED_SIZE", len(full_html) + 1)
+        try:
+            return _streaming(full_html)
+        finally:
+            monkeypatch.setattr(page_splitter, "_FEED_SIZE", _FEED_SIZE)
+
+    return _run
+
+
+def test_input_spans_multiple_feeds():
+    full_html = _flat_html(pages=200)
+    assert len(full_html) > 2 * _FEED_SIZE
+
+    streaming = _streaming(full_html)
+
+    assert [doc.page_number for doc in streaming] == list(range(1, 201))
+    assert _without_html(streaming) == _without_html(legacy_page_docs(full_html))
+
+
+# feed 경계(_FEED_SIZE)가 시작 태그, 속성 값, 문자 참조(&amp;), 텍스트, 닫는 태그 안에 오도록 앞쪽 길이를 조정
+@pytest.mark.parametrize("shift", range(0, 140, 7))
+def test_feed_boundary_inside_tags(shift, single_feed):
+    base = _flat_html(pages=120)
+    assert len(base) > _FEED_SIZE
+    full_html = _element("0-pad", "p", "x" * shift, "paragraph") + base
+
+    streaming = _streaming(full_html)
+
+    assert streaming == single_feed(full_html)
+    assert _without_html(streaming) == _without_html(legacy_page_docs(full_html))
+
+
+def test_feed_boundary_inside_every_position_of_a_tag(single_feed):
+    # 경계 직전에 놓인 block 태그의 모든 위치에서 잘려도 결과가 같아야 함
+    block = _element("b-1", "p", "경계 &amp; 문단", "paragraph")
+    for offset in range(1, len(block)):
+        filler = "x" * (_FEED_SIZE - offset - len("<p id='pad'></p>"))
+        full_html = (
+            f"<p id='pad'>{filler}</p>"
+            + block
+            + _element("b-f", "footer", "1", "footer")
+            + _flat_page(2)
+        )
+        assert full_html[_FEED_SIZE - offset : _FEED_SIZE - offset + 2] == block[:2]
+
+        streaming = _streaming(full_html)
+
+        assert streaming == single_feed(full_html), offset
+        assert streaming[0].text.endswith("경계 & 문단")
@@ -5,22 +5,16 @@ from pprint import pformat
 
 from langchain_core.documents import Document
 
+from app.agents.document_parser.nodes.artifact_sink import ArtifactSink
 
-def create_chunk_file(
-    *,
-    chunk: Document,
-    target_dir: Path,
-    overwrite: bool = True,
-) -> None:
-    target_dir.mkdir(parents=True, exist_ok=True)
 
+def chunk_file_path(*, chunk: Document, target_dir: Path) -> Path:
     chunk_id = chunk.metadata["indexing"]["chunk_id"]
     chunk_id_only_number = chunk_id.split("_")[-1]
-    output_file_name = f"{target_dir.parent.name}_{chunk_id_only_number}.py"
-    output_file_path = target_dir / output_file_name
-    if not overwrite and output_file_path.exists():
-        return
+    return target_dir / f"{target_dir.parent.name}_{chunk_id_only_number}.py"
 
+
+def format_chunk_file(chunk: Document) -> str:
     chunk_literal = pformat(
         {
             "page_content": chunk.page_content,
@@ -28,4 +22,18 @@ def create_chunk_file(
         },
         sort_dicts=False,
     )
-    output_file_path.write_text(f"chunk = {chunk_literal}\n", encoding="utf-8")
+    return f"chunk = {chunk_literal}\n"
+
+
+def add_chunk_artifacts(*, sink: ArtifactSink, chunk: Document, target_dir: Path) -> None:
+    """청크 산출물을 sink에 추가합니다. (통합 파일 레코드 + 선택 시 청크별 .py 파일)"""
+    if sink.per_file:
+        # pformat 비용도 background thread에서 처리
+        sink.submit(
+            chunk_file_path(chunk=chunk, target_dir=target_dir),
+            lambda path: path.write_text(format_chunk_file(chunk), encoding="utf-8"),
+        )
+    sink.add_record(
+        target_dir.parent / f"{target_dir.parent.name}_chunks",
+        {"page_content": chunk.page_content, "metadata": chunk.metadata},
+    )
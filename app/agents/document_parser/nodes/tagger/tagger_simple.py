@@ -7,7 +7,6 @@ from typing import Any, Dict, List, Tuple
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from langchain.chat_models import init_chat_model
 
 from langchain_core.documents import Document
 
@@ -16,8 +15,10 @@ try:
 except Exception:  # pragma: no cover - optional dependency fallback
     tracing_context = None
 
-from app.agents.document_parser.constants import TERMS_DIR
-from app.agents.document_parser.nodes.tagger.chunk_file import create_chunk_file
+from app.agents.document_parser.constants import EMBEDDING_MODEL_NAME, TERMS_DIR
+from app.agents.llm_registry import get_chat_model
+from app.agents.document_parser.nodes.artifact_sink import get_artifact_sink
+from app.agents.document_parser.nodes.tagger.chunk_file import add_chunk_artifacts
 from app.agents.document_parser.nodes.tagger.tag_summary import (
     summarize_counts,
 )
@@ -28,7 +29,6 @@ from app.agents.document_parser.nodes.tagger.tag_summary import (
 load_dotenv()
 
 # 같은 프로세스에서 반복되는 초기화/태깅 요청을 줄이기 위한 캐시
-_STRUCTURED_LLM_CACHE: Dict[Tuple[str], Any] = {}
 _TAG_RESULT_CACHE: Dict[Tuple[str, str, float], Dict[str, Any]] = {}
 _TAG_RESULT_CACHE_MAX = int(os.getenv("TAGGING_RESULT_CACHE_MAX", "5000"))
 
@@ -67,6 +67,10 @@ RISK_DOMAINS = [
 ]
 TERM_TYPES = ["basic", "special", "other"]
 
+# 태깅 규칙/라벨 버전
+# - 증분 적재의 청크 content hash에 포함되므로, 규칙/라벨을 바꾸면 올려서 전체 청크를 다시 적재합니다.
+TAGGING_VERSION = "simple-v1"
+
 
 # =========================
 # 1) 규칙 기반(Regex) 1차 태깅
@@ -165,7 +169,7 @@ def llm_tag_solar_pro2(
     Returns:
         rule_tag와 동일 형태 + method="llm"
     """
-    # init_chat_model은 LangChain 표준 경로를 사용하므로
+    # 공용 LLM 레지스트리(app/agents/llm_registry.py)를 사용하므로
     # 프로젝트 전체에서 모델 호출 방식과 tracing 구성이 일관됩니다.
     # 기존 시그니처 호환을 위해 api_key/base_url/timeout_s 인자는 유지하고,
     # 현재 코드베이스 관례대로 env 기반 설정을 우선 사용합니다.
@@ -190,13 +194,8 @@ def llm_tag_solar_pro2(
         f"TEXT:\n{text}"
     )
 
-    # 모델/스키마 래퍼는 생성 비용이 있으므로 재사용합니다.
-    cache_key = (model,)
-    structured_llm = _STRUCTURED_LLM_CACHE.get(cache_key)
-    if structured_llm is None:
-        llm = init_chat_model(model=model, temperature=0.0)
-        structured_llm = llm.with_structured_output(ChunkTagOutput)
-        _STRUCTURED_LLM_CACHE[cache_key] = structured_llm
+    # 모델/스키마별 client는 공용 레지스트리에서 재사용합니다. (동시성 제한/재시도 포함)
+    structured_llm = get_chat_model("tagger", schema=ChunkTagOutput, model=model)
 
     messages = [
         {"role": "system", "content": system},
@@ -322,7 +321,7 @@ def tag_chunk(
 def tag_chunks(
     chunks: List[Document],
     *,
-    embedding_model: str = "solar-embedding-1-large",
+    embedding_model: str = EMBEDDING_MODEL_NAME,
     use_llm_when: str = "never",
     llm_conf_threshold: float = 0.55,
 ) -> List[Document]:
@@ -345,6 +344,7 @@ def tag_chunks(
         raise ValueError("UPSTAGE_API_KEY is not set. Please check your .env file.")
 
     tagged_chunks: List[Document] = []
+    sink = get_artifact_sink()
     llm_used_count = 0
     for idx, chunk in enumerate(chunks):
         # tag_chunk는 str 입력을 기대하므로 page_content만 전달합니다.
@@ -371,6 +371,7 @@ def tag_chunks(
                 "embedding_model": embedding_model,
                 "tag_method": tag["method"],
                 "tag_confidence": tag["confidence"],
+                "tagging_version": TAGGING_VERSION,
             },
         }
 
@@ -380,7 +381,8 @@ def tag_chunks(
         target_dir = (
             TERMS_DIR / chunk.metadata["doc"]["file_name"].split(".")[0] / "chunks"
         )
-        create_chunk_file(
+        add_chunk_artifacts(
+            sink=sink,
             chunk=tagged_chunk,
             target_dir=target_dir,
         )
@@ -395,6 +397,9 @@ def tag_chunks(
                 f"(llm_used={llm_used_count})"
             )
 
+    # 청크 산출물 쓰기가 끝날 때까지 대기 (background write)
+    sink.flush()
+
     summarize_counts(
         tagged_chunks,
         clause_types=CLAUSE_TYPES,
@@ -0,0 +1,180 @@
+"""incremental_ingest.sync_documents 테스트 (in-memory Qdrant + 가짜 임베딩).
+
+실행 예시:
+    uv run pytest app/agents/document_parser/nodes/test_incremental_ingest.py
+"""
+
+from typing import List
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_qdrant import QdrantVectorStore
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from app.agents.document_parser.nodes.incremental_ingest import sync_documents
+
+COLLECTION_NAME = "test-incremental-ingest"
+DIM = 8
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """임베딩한 text 목록을 기록하는 가짜 임베딩"""
+
+    embedded: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+@pytest.fixture
+def vector_store() -> QdrantVectorStore:
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        COLLECTION_NAME, vectors_config=VectorParams(size=DIM, distance=Distance.COSINE)
+    )
+    return QdrantVectorStore(
+        client=client,
+        collection_name=COLLECTION_NAME,
+        embedding=CountingEmbeddings(size=DIM, embedded=[]),
+    )
+
+
+def _chunk(
+    text: str,
+    page: int,
+    chunk_id: str,
+    *,
+    file_name: str = "a.pdf",
+    embedding_model: str = "m1",
+    tagging_version: str = "simple-v1",
+) -> Document:
+    return Document(
+        page_content=text,
+        metadata={
+            "doc": {"file_name": file_name, "page": page},
+            "indexing": {
+                "chunk_id": chunk_id,
+                "embedding_model": embedding_model,
+                "tagging_version": tagging_version,
+            },
+        },
+    )
+
+
+def _chunks(**kwargs) -> List[Document]:
+    return [_chunk(f"제{i}조 보상하는 손해", i + 1, f"chunk_{i:06d}", **kwargs) for i in range(4)]
+
+
+def _diff(report: dict) -> dict:
+    return {
+        key: report[key]
+        for key in ("unchanged", "metadata_updated", "added", "deleted", "duplicates")
+    }
+
+
+def _points(vector_store: QdrantVectorStore) -> dict:
+    records, _ = vector_store.client.scroll(COLLECTION_NAME, limit=100, with_payload=True)
+    return {str(record.id): record.payload for record in records}
+
+
+def test_initial_sync_adds_every_chunk(vector_store):
+    report = sync_documents(vector_store, _chunks())
+
+    assert _diff(report) == {
+        "unchanged": 0, "metadata_updated": 0, "added": 4, "deleted": 0, "duplicates": 0
+    }
+    assert len(_points(vector_store)) == 4
+
+
+def test_resync_is_noop(vector_store):
+    sync_documents(vector_store, _chunks())
+    vector_store.embeddings.embedded.clear()
+
+    report = sync_documents(vector_store, _chunks())
+
+    assert _diff(report) == {
+        "unchanged": 4, "metadata_updated": 0, "added": 0, "deleted": 0, "duplicates": 0
+    }
+    assert vector_store.embeddings.embedded == []
+
+
+def test_metadata_change_updates_payload_only(vector_store):
+    sync_documents(vector_store, _chunks())
+    vector_store.embeddings.embedded.clear()
+    chunks = _chunks()
+    chunks[0].metadata["indexing"]["chunk_id"] = "chunk_999999"
+
+    report = sync_documents(vector_store, chunks)
+
+    assert _diff(report)["metadata_updated"] == 1
+    assert _diff(report)["added"] == 0
+    assert vector_store.embeddings.embedded == []
+    chunk_ids = {
+        payload["metadata"]["indexing"]["chunk_id"] for payload in _points(vector_store).values()
+    }
+    assert "chunk_999999" in chunk_ids
+
+
+def test_text_change_adds_new_point_and_deletes_old(vector_store):
+    sync_documents(vector_store, _chunks())
+    vector_store.embeddings.embedded.clear()
+    chunks = _chunks()
+    chunks[1] = _chunk("제1조 개정된 보상하는 손해", 2, "chunk_000001")
+
+    report = sync_documents(vector_store, chunks)
+
+    assert _diff(report) == {
+        "unchanged": 3, "metadata_updated": 0, "added": 1, "deleted": 1, "duplicates": 0
+    }
+    assert vector_store.embeddings.embedded == ["제1조 개정된 보상하는 손해"]
+    texts = {payload["page_content"] for payload in _points(vector_store).values()}
+    assert "제1조 보상하는 손해" not in texts
+    assert len(texts) == 4
+
+
+def test_removed_chunk_is_deleted(vector_store):
+    sync_documents(vector_store, _chunks())
+
+    report = sync_documents(vector_store, _chunks()[:3])
+
+    assert _diff(report)["deleted"] == 1
+    assert len(_points(vector_store)) == 3
+
+
+def test_other_files_are_untouched(vector_store):
+    sync_documents(vector_store, _chunks(file_name="b.pdf"))
+
+    report = sync_documents(vector_store, _chunks()[:2])
+
+    assert _diff(report)["deleted"] == 0
+    assert len(_points(vector_store)) == 6
+
+
+def test_duplicate_chunks_are_ingested_once(vector_store):
+    chunks = _chunks()
+    chunks.append(_chunk(chunks[0].page_content, 1, "chunk_000004"))
+
+    report = sync_documents(vector_store, chunks)
+
+    assert _diff(report)["duplicates"] == 1
+    assert len(_points(vector_store)) == 4
+
+
+@pytest.mark.parametrize(
+    "changed", [{"embedding_model": "m2"}, {"tagging_version": "simple-v2"}]
+)
+def test_model_or_tagging_version_change_reembeds(vector_store, changed):
+    sync_documents(vector_store, _chunks())
+    vector_store.embeddings.embedded.clear()
+
+    report = sync_documents(vector_store, _chunks(**changed))
+
+    # payload만 갱신하면 vector와 metadata가 어긋나므로 다시 임베딩해야 함
+    assert _diff(report) == {
+        "unchanged": 0, "metadata_updated": 0, "added": 4, "deleted": 4, "duplicates": 0
+    }
+    assert len(vector_store.embeddings.embedded) == 4
+    assert len(_points(vector_store)) == 4
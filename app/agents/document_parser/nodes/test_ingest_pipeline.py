@@ -0,0 +1,72 @@
+"""ingest_pipeline.TokenBucket 테스트.
+
+실행 예시:
+    uv run pytest app/agents/document_parser/nodes/test_ingest_pipeline.py
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.agents.document_parser.nodes.ingest_pipeline import TokenBucket
+
+
+@pytest.mark.parametrize("rate_per_minute", [0, 600])
+def test_pause_blocks_acquire(rate_per_minute):
+    bucket = TokenBucket(rate_per_minute)
+    bucket.pause(0.3)
+
+    start = time.perf_counter()
+    waited = bucket.acquire()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.25
+    assert waited >= 0.25
+
+
+@pytest.mark.parametrize("rate_per_minute", [0, 600])
+def test_pause_blocks_every_worker(rate_per_minute):
+    bucket = TokenBucket(rate_per_minute)
+    bucket.pause(0.3)
+    finished_at = []
+
+    def _worker():
+        bucket.acquire()
+        finished_at.append(time.perf_counter())
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=_worker) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert min(finished_at) - start >= 0.25
+
+
+def test_unlimited_rate_does_not_wait():
+    bucket = TokenBucket(0)
+    start = time.perf_counter()
+    for _ in range(1000):
+        assert bucket.acquire() == 0.0
+    assert time.perf_counter() - start < 0.1
+
+
+def test_rate_limits_after_burst():
+    # 분당 600회 = 초당 10회, burst(1분 허용량)를 모두 쓰면 다음 요청은 약 0.1초 대기
+    bucket = TokenBucket(600)
+    bucket.acquire(600)
+
+    start = time.perf_counter()
+    bucket.acquire()
+    elapsed = time.perf_counter() - start
+
+    assert 0.05 <= elapsed < 0.5
+
+
+def test_amount_larger_than_capacity_is_capped():
+    bucket = TokenBucket(60)
+    start = time.perf_counter()
+    bucket.acquire(10_000)
+    assert time.perf_counter() - start < 0.1
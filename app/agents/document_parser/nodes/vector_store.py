@@ -1,45 +1,182 @@
 import os
-import time
+import threading
 from typing import List
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import Modifier, PayloadSchemaType, SparseVectorParams
 
 from langchain_core.vectorstores import VectorStore
 from langchain_core.documents import Document
-from langchain_qdrant import QdrantVectorStore
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
 
 from rich import print as rprint
 
+from app.agents.document_parser.nodes.collection_profile import get_collection_profile
 from app.agents.document_parser.nodes.embeddings import load_underlying_embeddings
+from app.agents.document_parser.nodes.incremental_ingest import print_diff_report, sync_documents
+from app.agents.document_parser.nodes.sparse_embeddings import load_sparse_embeddings
+
+# langchain_qdrant QdrantVectorStore의 기본 payload key
+CONTENT_PAYLOAD_KEY = "page_content"
+METADATA_PAYLOAD_KEY = "metadata"
+# hybrid 검색용 BM25 named sparse vector (dense vector는 langchain_qdrant 기본값인 unnamed vector)
+SPARSE_VECTOR_NAME = "bm25"
+
+# 검색 필터(rag_agent.tools.search_filter)와 증분 적재(incremental_ingest)에 사용하는 payload 필드
+# index가 없으면 필터 검색 시 모든 후보 point의 payload를 읽어야 하므로 적재 시 생성한다.
+PAYLOAD_INDEX_FIELDS = {
+    "metadata.doc.file_name": PayloadSchemaType.KEYWORD,  # 증분 적재 시 파일별 기존 point 조회
+    "metadata.doc.insurer_code": PayloadSchemaType.KEYWORD,
+    "metadata.doc.product_code": PayloadSchemaType.KEYWORD,
+    "metadata.term_type": PayloadSchemaType.KEYWORD,
+    "metadata.clause.clause_type": PayloadSchemaType.KEYWORD,
+    "metadata.clause.risk_domains": PayloadSchemaType.KEYWORD,  # keyword 배열
+}
 
 _global_vector_db_client = None
+_global_async_vector_db_client = None
 
+# 존재가 확인된 collection 이름 (검색 시 매번 collection_exists 왕복을 하지 않기 위한 캐시)
+_known_collections: set[str] = set()
+_known_collections_lock = threading.Lock()
+# collection 이름 → SPARSE_VECTOR_NAME sparse vector 보유 여부 (collection 설정은 재생성 전까지 바뀌지 않음)
+_sparse_vector_support: dict[str, bool] = {}
 
-def setup_vector_store(
-    underlying_embeddings,
-    collection_name,
-) -> VectorStore:
-    global _global_vector_db_client
 
-    qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
-    # qdrant_api_key = os.getenv("QDRANT_API_KEY") # 현재 불필요, 추후에 필요할 수 있음
-    vector_size = int(os.getenv("QDRANT_VECTOR_SIZE", "4096"))
+def _vector_db_client_kwargs() -> dict:
+    # QDRANT_PREFER_GRPC=1 이면 gRPC(기본 6334 포트) 사용 (docker-compose.qdrant.yml에서 노출)
+    return {
+        "url": os.getenv("QDRANT_URL", "http://localhost:6333"),
+        # "api_key": os.getenv("QDRANT_API_KEY"), # 현재 불필요, 추후에 필요할 수 있음
+        "timeout": 30,
+        "prefer_grpc": os.getenv("QDRANT_PREFER_GRPC", "0") == "1",
+        "grpc_port": int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+    }
+
+
+def get_vector_db_client() -> QdrantClient:
+    """프로세스 전역에서 공유하는 Qdrant client를 반환합니다."""
+    global _global_vector_db_client
 
     if _global_vector_db_client is None:
-        _global_vector_db_client = QdrantClient(
-            url=qdrant_url,
-            # api_key=qdrant_api_key,
-            timeout=30,
-        )  # Docker Compose로 실행한 Qdrant 서버
+        # Docker Compose로 실행한 Qdrant 서버
+        _global_vector_db_client = QdrantClient(**_vector_db_client_kwargs())
         rprint("✅initialize vector store client", _global_vector_db_client)
 
-    if not _global_vector_db_client.collection_exists(collection_name):
-        _global_vector_db_client.create_collection(
+    return _global_vector_db_client
+
+
+def get_async_vector_db_client() -> AsyncQdrantClient:
+    """프로세스 전역에서 공유하는 비동기 Qdrant client를 반환합니다."""
+    global _global_async_vector_db_client
+
+    if _global_async_vector_db_client is None:
+        _global_async_vector_db_client = AsyncQdrantClient(**_vector_db_client_kwargs())
+        rprint("✅initialize async vector store client", _global_async_vector_db_client)
+
+    return _global_async_vector_db_client
+
+
+def collection_exists_cached(collection_name: str) -> bool:
+    """
+    collection 존재 여부를 반환합니다.
+
+    존재가 확인된 collection만 캐시하므로, 없던 collection이 나중에 생성되어도 다시 확인됩니다.
+    """
+    if collection_name in _known_collections:
+        return True
+    exists = get_vector_db_client().collection_exists(collection_name)
+    if exists:
+        with _known_collections_lock:
+            _known_collections.add(collection_name)
+    return exists
+
+
+async def acollection_exists_cached(collection_name: str) -> bool:
+    """collection_exists_cached의 비동기 버전"""
+    if collection_name in _known_collections:
+        return True
+    exists = await get_async_vector_db_client().collection_exists(collection_name)
+    if exists:
+        with _known_collections_lock:
+            _known_collections.add(collection_name)
+    return exists
+
+
+def _remember_sparse_vector_support(collection_name: str, collection_info) -> bool:
+    supported = SPARSE_VECTOR_NAME in (collection_info.config.params.sparse_vectors or {})
+    if not supported:
+        rprint(f"⚠️sparse vector '{SPARSE_VECTOR_NAME}' not found (dense only):", collection_name)
+    _sparse_vector_support[collection_name] = supported
+    return supported
+
+
+def collection_has_sparse_vector(collection_name: str) -> bool:
+    """collection에 hybrid 검색용 sparse vector가 설정되어 있는지 반환합니다. (결과 캐시)"""
+    if collection_name in _sparse_vector_support:
+        return _sparse_vector_support[collection_name]
+    return _remember_sparse_vector_support(
+        collection_name, get_vector_db_client().get_collection(collection_name)
+    )
+
+
+async def acollection_has_sparse_vector(collection_name: str) -> bool:
+    """collection_has_sparse_vector의 비동기 버전"""
+    if collection_name in _sparse_vector_support:
+        return _sparse_vector_support[collection_name]
+    return _remember_sparse_vector_support(
+        collection_name, await get_async_vector_db_client().get_collection(collection_name)
+    )
+
+
+def create_collection(
+    collection_name: str, vector_size: int, profile: str | None = None
+) -> None:
+    """collection 프로파일(quantization, on-disk, HNSW) 설정으로 collection을 생성합니다."""
+    collection_profile = get_collection_profile(profile)
+    get_vector_db_client().create_collection(
+        collection_name=collection_name,
+        vectors_config=collection_profile.vectors_config(vector_size),
+        hnsw_config=collection_profile.hnsw_config(),
+        quantization_config=collection_profile.quantization_config(),
+        # IDF는 Qdrant가 collection 통계로 계산 (문서 vector에는 BM25 TF 가중치만 저장)
+        sparse_vectors_config={SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)},
+    )
+    rprint(
+        "✅create vector store collection:",
+        collection_name,
+        collection_profile.model_dump(exclude_defaults=True),
+    )
+
+
+def ensure_payload_indexes(collection_name: str) -> None:
+    """PAYLOAD_INDEX_FIELDS 중 아직 index가 없는 필드의 payload index를 생성합니다."""
+    client = get_vector_db_client()
+    existing = client.get_collection(collection_name).payload_schema or {}
+    for field_name, field_schema in PAYLOAD_INDEX_FIELDS.items():
+        if field_name in existing:
+            continue
+        client.create_payload_index(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+            field_name=field_name,
+            field_schema=field_schema,
+            wait=True,
         )
-        rprint("✅create vector store collection:", collection_name)
+        rprint(f"✅create payload index: {collection_name}.{field_name}")
+
+
+def setup_vector_store(
+    underlying_embeddings,
+    collection_name,
+) -> VectorStore:
+    vector_size = int(os.getenv("QDRANT_VECTOR_SIZE", "4096"))
+
+    client = get_vector_db_client()
+
+    if not collection_exists_cached(collection_name):
+        create_collection(collection_name, vector_size)
+
+    ensure_payload_indexes(collection_name)
 
     """
     QdrantClient:
@@ -57,23 +194,45 @@ def setup_vector_store(
       - Point = row
       - Segment = 여러 row를 담은 data file + index, 검색 시 여러 Segment를 병렬로 검색
     """
+    if collection_has_sparse_vector(collection_name):
+        # 적재 시 dense + BM25 sparse vector를 함께 저장 (hybrid 검색)
+        return QdrantVectorStore(
+            client=client,
+            collection_name=collection_name,
+            embedding=underlying_embeddings,
+            sparse_embedding=load_sparse_embeddings(),
+            sparse_vector_name=SPARSE_VECTOR_NAME,
+            retrieval_mode=RetrievalMode.HYBRID,
+        )
     return QdrantVectorStore(
-        client=_global_vector_db_client,
+        client=client,
         collection_name=collection_name,
         embedding=underlying_embeddings,
     )
 
 
+def document_from_point(point, collection_name: str) -> Document:
+    """Qdrant ScoredPoint/Record를 QdrantVectorStore와 같은 형태의 Document로 변환합니다."""
+    payload = point.payload or {}
+    metadata = dict(payload.get(METADATA_PAYLOAD_KEY) or {})
+    metadata["_id"] = point.id
+    metadata["_collection_name"] = collection_name
+    if getattr(point, "score", None) is not None:  # Record(retrieve 결과)에는 score 없음
+        metadata["_score"] = point.score
+    return Document(
+        page_content=payload.get(CONTENT_PAYLOAD_KEY, ""),
+        metadata=metadata,
+    )
+
+
 def ingest_chunks(collection_name: str, chunks: List[Document]) -> VectorStore:
     underlying_embeddings = load_underlying_embeddings()
     vector_store = setup_vector_store(underlying_embeddings, collection_name)
 
     if chunks:
         rprint("🚀ingest_chunks start")
-        start_time = time.perf_counter()
-        vector_store.add_documents(chunks)  # embedding + saving
-        elapsed = time.perf_counter() - start_time
-        rprint(f"✅ingest_chunks complete (elapsed: {elapsed:.2f}s)")
+        # 새로 생기거나 바뀐 청크만 임베딩/upsert, 없어진 청크 point는 삭제 (incremental_ingest.py)
+        print_diff_report(sync_documents(vector_store, chunks))
     else:
         rprint("⚠️no documents")
 
@@ -1,13 +1,17 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
 from .state import JudgeAgentState
-from .nodes.validator import validator_node
+from .nodes.validator import avalidator_node, validator_node
 
 # ==========================================
 #  그래프 정의 (변하지 않음)
 # ==========================================
 builder = StateGraph(JudgeAgentState)
-builder.add_node("validator", validator_node)
+# invoke/stream은 동기 함수, ainvoke/astream은 비동기 함수로 실행
+builder.add_node(
+    "validator", RunnableLambda(validator_node, afunc=avalidator_node)
+)
 builder.add_edge(START, "validator")
 builder.add_edge("validator", END)
 
@@ -1,7 +1,16 @@
+import hashlib
 import os
+from app.agents.cache import (
+    CACHE_DIR,
+    LRUCache,
+    SQLiteCache,
+    TieredCache,
+    make_cache_key,
+)
+from app.agents.document_parser.constants import COLLECTION_VERSION
+from app.agents.llm_registry import get_chat_model, get_profile_config
 from app.agents.vet_agent.state.vet_state import VetAgentState
 from dotenv import load_dotenv
-from langchain_upstage import ChatUpstage 
 from langchain_core.prompts import ChatPromptTemplate
 from ..state import JudgeAgentState, ValidationResult
 
@@ -10,10 +19,86 @@ from rich import print as rprint
 # .env 파일 로드 (API Key 때문에 필수)
 load_dotenv()
 
+LLM_PROFILE = "judge_validator"
+
+# ==========================================
+# 검증 결과 캐시
+# ==========================================
+# (vet 정보, 질병 목록, 검색된 chunk 집합)이 같으면 같은 ValidationResult로 간주
+_validation_cache: TieredCache | None = None
+_COLLECTION_VERSION_KEY = "__collection_version__"
+
+
+def get_validation_cache() -> TieredCache:
+    """
+    검증 결과 캐시를 반환합니다.
+
+    - 1차: 프로세스 내 LRU
+    - 2차: SQLite (JUDGE_CACHE_BACKEND=memory 인 경우 생략)
+
+    저장된 collection version이 현재 COLLECTION_VERSION과 다르면 캐시 전체를 비웁니다.
+    """
+    global _validation_cache
+
+    if _validation_cache is None:
+        ttl_s = float(os.getenv("JUDGE_CACHE_TTL_S", str(7 * 24 * 3600)))
+        l1 = LRUCache(max_entries=int(os.getenv("JUDGE_CACHE_MAX", "1024")), ttl_s=ttl_s)
+        l2 = None
+        if os.getenv("JUDGE_CACHE_BACKEND", "sqlite") == "sqlite":
+            path = os.getenv("JUDGE_CACHE_PATH", str(CACHE_DIR / "judge_validation.sqlite"))
+            l2 = SQLiteCache(
+                path,
+                table="validation_results",
+                max_entries=int(os.getenv("JUDGE_CACHE_DISK_MAX", "50000")),
+                ttl_s=ttl_s,
+            )
+            # 디스크 캐시가 생성된 시점의 collection version (TTL/eviction 대상 아님)
+            meta = SQLiteCache(path, table="validation_meta")
+            cached_version = meta.get(_COLLECTION_VERSION_KEY)
+            if cached_version != COLLECTION_VERSION:
+                l2.clear()
+                meta.set(_COLLECTION_VERSION_KEY, COLLECTION_VERSION)
+                if cached_version is not None:
+                    rprint(
+                        f"⚠️validation cache invalidated "
+                        f"(collection version: {cached_version} → {COLLECTION_VERSION})"
+                    )
+        _validation_cache = TieredCache(l1, l2)
+
+    return _validation_cache
+
+
+def _chunk_key(doc) -> str:
+    # 검증 프롬프트에는 본문(page_content)만 들어가므로 본문 hash를 key에 포함합니다.
+    # 재적재로 같은 point의 본문이 바뀌어도 COLLECTION_VERSION 변경 없이 이전 검증 결과를 사용하지 않습니다.
+    # Qdrant point id가 없는 문서(mock 등)는 본문 hash만 사용
+    content_hash = hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+    point_id = doc.metadata.get("_id")
+    if point_id is not None:
+        return f"{point_id}:{content_hash}"
+    return content_hash
+
+
+def make_validation_cache_key(state: JudgeAgentState) -> str:
+    """vet 필드(질병은 이름순 정렬) + 정렬된 chunk (id, 본문 hash) + collection version으로 key를 생성합니다."""
+    vet_data = state.model_dump(mode="json", include=VetAgentState.model_fields.keys())
+    vet_data["diseases"] = sorted(
+        vet_data.get("diseases") or [], key=lambda disease: disease["name"]
+    )
+    chunk_ids = sorted(_chunk_key(doc) for doc in state.retrieved_documents)
+    return make_cache_key(
+        "validation",
+        get_profile_config(LLM_PROFILE),
+        COLLECTION_VERSION,
+        vet_data,
+        chunk_ids,
+    )
+
+
 # ==========================================
 # 검증 노드 핵심 로직
 # ==========================================
-def validator_node(state: JudgeAgentState):
+def _build_validation_chain(state: JudgeAgentState):
 
     # 1. 데이터 꺼내기 
     vet_field_keys = VetAgentState.model_fields.keys()
@@ -26,9 +111,8 @@ def validator_node(state: JudgeAgentState):
     for idx, doc in enumerate(docs):
         rag_context += f"\n[약관 {idx+1}] {doc.page_content}\n"
 
-    # 3. LLM 설정 
-    llm = ChatUpstage(model="solar-pro2", temperature=0)
-    structured_llm = llm.with_structured_output(ValidationResult)
+    # 3. LLM 설정 (공용 레지스트리에서 재사용되는 client)
+    structured_llm = get_chat_model(LLM_PROFILE, schema=ValidationResult)
 
     # 4. 프롬프트 수정 (User + Vet 정보가 하나로 합쳐짐)
     system_prompt = """당신은 보험 약관 심사 전문가입니다.
@@ -50,13 +134,44 @@ def validator_node(state: JudgeAgentState):
         """)
     ])
 
-    # 5. 실행
     # vet_data는 딕셔너리이므로 str()로 변환해서 주입
     chain = prompt | structured_llm
-    result = chain.invoke({
+    inputs = {
         "vet_data": str(vet_data), 
         "rag_context": rag_context
-    })
-    
+    }
+    return chain, inputs
+
+
+def validator_node(state: JudgeAgentState):
+    # 캐시 hit이면 LLM client 생성과 호출을 모두 생략
+    cache = get_validation_cache()
+    cache_key = make_validation_cache_key(state)
+    validation_result = cache.get(cache_key)
+    if validation_result is not None:
+        return {"validation_result": validation_result}
+
+    chain, inputs = _build_validation_chain(state)
+
+    # 5. 실행
+    result = chain.invoke(inputs)
     
-    return {"validation_result": result.model_dump()}
+    validation_result = result.model_dump()
+    cache.set(cache_key, validation_result)
+    return {"validation_result": validation_result}
+
+
+async def avalidator_node(state: JudgeAgentState):
+    """validator_node의 비동기 버전"""
+    cache = get_validation_cache()
+    cache_key = make_validation_cache_key(state)
+    validation_result = cache.get(cache_key)
+    if validation_result is not None:
+        return {"validation_result": validation_result}
+
+    chain, inputs = _build_validation_chain(state)
+    result = await chain.ainvoke(inputs)
+
+    validation_result = result.model_dump()
+    cache.set(cache_key, validation_result)
+    return {"validation_result": validation_result}
@@ -1,7 +1,5 @@
 from typing import List, Dict, Any, Optional
 from enum import Enum
-from app.agents.rag_agent.rag_graph import RagGraphState
-from app.agents.rag_agent.state.rag_state import RagState
 from app.agents.vet_agent.state.vet_state import VetAgentState
 from langchain_core.documents import Document
 from pydantic import BaseModel, Field
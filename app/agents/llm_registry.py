@@ -0,0 +1,304 @@
+"""
+에이전트 공용 LLM client 레지스트리
+
+llm.yaml의 profile(호출 지점) 설정으로 chat model을 생성하고, (모델, temperature, 구조화 출력 schema)
+별로 1개만 만들어 재사용한다. 모든 client는 keep-alive connection pool을 가진 httpx client를 공유한다.
+
+반환되는 Runnable은 다음을 포함한다.
+- 모델별 동시 호출 수 제한 (models.<model>.max_concurrency)
+- 연결 오류/429/5xx 재시도 (exponential backoff + jitter, models.<model>.max_retries)
+- 모델별 호출 지연 시간 histogram (`get_llm_stats()`)
+
+사용 예시:
+    structured_llm = get_chat_model("judge_validator", schema=ValidationResult)
+    result = structured_llm.invoke(messages)
+"""
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import httpx
+import yaml
+from dotenv import load_dotenv
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from pydantic import BaseModel
+
+from rich import print as rprint
+
+load_dotenv()
+
+CONFIG_PATH = Path(os.getenv("LLM_CONFIG_PATH", Path(__file__).parent / "llm.yaml"))
+
+# 지연 시간 histogram bucket 상한(ms). 마지막 bucket은 상한 없음
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+DEFAULT_MODEL_CONFIG = {"max_concurrency": 8, "max_retries": 3, "timeout": 60}
+
+_config: Dict[str, Any] | None = None
+_CLIENTS: Dict[Tuple[str, float, type | None], Runnable] = {}
+_LIMITERS: Dict[str, "_ConcurrencyLimiter"] = {}
+_HISTOGRAMS: Dict[str, "_LatencyHistogram"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_ASYNC_CLIENT: httpx.AsyncClient | None = None
+
+
+def load_llm_config(path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    """llm.yaml을 최초 호출 시 1회 읽어 반환합니다."""
+    global _config
+
+    if _config is None:
+        _config = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return _config
+
+
+def get_profile_config(profile: str) -> Dict[str, Any]:
+    profiles = load_llm_config()["profiles"]
+    if profile not in profiles:
+        raise ValueError(f"unknown llm profile: {profile} (available: {', '.join(profiles)})")
+    return profiles[profile]
+
+
+def get_model_config(model: str) -> Dict[str, Any]:
+    return {**DEFAULT_MODEL_CONFIG, **(load_llm_config().get("models", {}).get(model) or {})}
+
+
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """LLM API 호출에 공유할 keep-alive HTTP client를 반환합니다. (lock 내부에서 호출)"""
+    global _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "50")),
+        max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60")),
+    )
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(limits=limits)
+    if _HTTP_ASYNC_CLIENT is None:
+        _HTTP_ASYNC_CLIENT = httpx.AsyncClient(limits=limits)
+    return _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+
+class _ConcurrencyLimiter:
+    """동기(thread) / 비동기(event loop별) 호출에 같은 상한을 적용하는 semaphore"""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._thread_semaphore = threading.BoundedSemaphore(max_concurrency)
+        # asyncio.Semaphore는 event loop에 묶이므로 loop별로 생성
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @contextmanager
+    def acquire(self):
+        with self._thread_semaphore:
+            yield
+
+    @asynccontextmanager
+    async def aacquire(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_concurrency)
+            )
+        async with semaphore:
+            yield
+
+
+class _LatencyHistogram:
+    """모델별 호출 지연 시간 histogram (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_ms = 0.0
+        self.wait_ms = 0.0
+
+    def start(self, wait_ms: float) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.wait_ms += wait_ms
+
+    def observe(self, latency_ms: float, error: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.errors += int(error)
+            self.total_ms += latency_ms
+            self.counts[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def _percentile(self, q: float) -> float | None:
+        """bucket 상한 기준 근사 백분위수(ms)"""
+        if not self.calls:
+            return None
+        threshold = q * self.calls
+        cumulative = 0
+        for idx, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return LATENCY_BUCKETS_MS[idx] if idx < len(LATENCY_BUCKETS_MS) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [
+                f">{LATENCY_BUCKETS_MS[-1]}ms"
+            ]
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "mean_ms": self.total_ms / self.calls if self.calls else None,
+                "mean_wait_ms": self.wait_ms / self.calls if self.calls else None,
+                "p50_ms": self._percentile(0.50),
+                "p95_ms": self._percentile(0.95),
+                "histogram": dict(zip(labels, self.counts)),
+            }
+
+
+def _retryable_exceptions() -> tuple[type[BaseException], ...]:
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    )
+
+    return (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+
+
+def _create_base_model(model: str, temperature: float):
+    from langchain_upstage import ChatUpstage
+
+    http_client, http_async_client = _get_http_clients()
+    return ChatUpstage(
+        model=model,
+        temperature=temperature,
+        timeout=get_model_config(model)["timeout"],
+        max_retries=0,  # 재시도는 레지스트리(with_retry)에서 일괄 처리
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+
+
+def _create_managed_model(
+    model: str, temperature: float, schema: type[BaseModel] | None
+) -> Runnable:
+    """동시성 제한 + 지연 시간 기록 + 재시도가 적용된 Runnable을 생성합니다. (lock 내부에서 호출)"""
+    model_config = get_model_config(model)
+    limiter = _LIMITERS.setdefault(model, _ConcurrencyLimiter(model_config["max_concurrency"]))
+    histogram = _HISTOGRAMS.setdefault(model, _LatencyHistogram())
+
+    base_model = _create_base_model(model, temperature)
+    bound = base_model.with_structured_output(schema) if schema else base_model
+
+    # config(callbacks 등)를 그대로 전달해야 tracing과 stream_mode="messages" 토큰 스트리밍이 유지됨
+    def _invoke(input: Any, config: RunnableConfig) -> Any:
+        queued_at = time.perf_counter()
+        with limiter.acquire():
+            start_time = time.perf_counter()
+            histogram.start((start_time - queued_at) * 1000)
+            error = True
+            try:
+                output = bound.invoke(input, config)
+                error = False
+                return output
+            finally:
+                histogram.observe((time.perf_counter() - start_time) * 1000, error)
+
+    async def _ainvoke(input: Any, config: RunnableConfig) -> Any:
+        queued_at = time.perf_counter()
+        async with limiter.aacquire():
+            start_time = time.perf_counter()
+            histogram.start((start_time - queued_at) * 1000)
+            error = True
+            try:
+                output = await bound.ainvoke(input, config)
+                error = False
+                return output
+            finally:
+                histogram.observe((time.perf_counter() - start_time) * 1000, error)
+
+    managed = RunnableLambda(_invoke, afunc=_ainvoke, name=f"llm:{model}")
+    if model_config["max_retries"] > 0:
+        managed = managed.with_retry(
+            retry_if_exception_type=_retryable_exceptions(),
+            wait_exponential_jitter=True,
+            stop_after_attempt=model_config["max_retries"] + 1,
+        )
+    return managed
+
+
+def get_chat_model(
+    profile: str,
+    *,
+    schema: type[BaseModel] | None = None,
+    model: str | None = None,
+    temperature: float | None = None,
+) -> Runnable:
+    """
+    profile 설정 기반 chat model Runnable을 반환합니다.
+
+    Args:
+        profile: llm.yaml profiles의 key (e.g. "judge_validator")
+        schema: 구조화 출력 pydantic 모델 (with_structured_output)
+        model, temperature: profile 설정 override
+    """
+    profile_config = get_profile_config(profile)
+    model = model or profile_config["model"]
+    temperature = temperature if temperature is not None else profile_config.get("temperature", 0.0)
+    cache_key = (model, float(temperature), schema)
+
+    client = _CLIENTS.get(cache_key)
+    if client is not None:
+        return client
+
+    with _REGISTRY_LOCK:
+        # lock 획득 전에 다른 스레드가 먼저 생성했을 수 있으므로 다시 확인합니다.
+        client = _CLIENTS.get(cache_key)
+        if client is None:
+            client = _create_managed_model(model, float(temperature), schema)
+            _CLIENTS[cache_key] = client
+            rprint(
+                f"✅initialize llm client: {model} (temperature={temperature}, "
+                f"schema={schema.__name__ if schema else None})"
+            )
+    return client
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    """모델별 호출 수/오류 수/동시 실행 수/지연 시간 histogram을 반환합니다."""
+    with _REGISTRY_LOCK:
+        return {
+            "clients": len(_CLIENTS),
+            "models": {model: histogram.snapshot() for model, histogram in _HISTOGRAMS.items()},
+        }
+
+
+def reset_llm_registry() -> None:
+    """레지스트리와 공유 HTTP client를 정리합니다. (테스트/설정 변경 시 사용)"""
+    global _config, _HTTP_CLIENT, _HTTP_ASYNC_CLIENT
+
+    with _REGISTRY_LOCK:
+        _CLIENTS.clear()
+        _LIMITERS.clear()
+        _HISTOGRAMS.clear()
+        _config = None
+        if _HTTP_CLIENT is not None:
+            _HTTP_CLIENT.close()
+        # AsyncClient는 이벤트 루프 밖에서 닫을 수 없으므로 참조만 해제합니다.
+        _HTTP_CLIENT = None
+        _HTTP_ASYNC_CLIENT = None
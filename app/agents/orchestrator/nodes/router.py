@@ -4,11 +4,18 @@ from langgraph.graph import END
 
 from app.agents.orchestrator.state.orchestrator_state import OrchestratorState
 
+NextNode = Literal["vet_diagnosis", "RAG", "__end__"]
+
 
 def route_after_user_input(
     state: OrchestratorState,
-) -> Literal["vet_diagnosis", "RAG", "__end__"]:
-    """diseases 존재 여부에 따라 다음 노드 결정. 차단 시 즉시 종료."""
+) -> NextNode | list[NextNode]:
+    """
+    diseases 존재 여부에 따라 다음 노드 결정. 차단 시 즉시 종료.
+
+    RAG 질의는 사용자 입력(종/품종/나이/성별/체중)만으로 생성되므로
+    diseases가 없으면 vet_diagnosis와 RAG를 동시에 실행(fan-out)합니다.
+    """
     if state.is_blocked:
         print(f"  [Router] BLOCKED: {state.blocked_reason} → END")
         return END
@@ -16,5 +23,5 @@ def route_after_user_input(
         print("  [Router] diseases 존재 → RAG로 이동")
         return "RAG"
     else:
-        print("  [Router] diseases 없음 → vet_diagnosis로 이동")
-        return "vet_diagnosis"
+        print("  [Router] diseases 없음 → vet_diagnosis, RAG 병렬 실행")
+        return ["vet_diagnosis", "RAG"]
@@ -1,13 +1,26 @@
+import asyncio
+import threading
+import time
 from pathlib import Path
+from typing import Any, AsyncIterator
 
+from langchain_core.documents import Document
 from langgraph.graph import END, START, StateGraph
-from langgraph.checkpoint.memory import InMemorySaver
 
 from rich import print as rprint
 
 from app.agents.utils import create_graph_image, get_parent_path
 
+from app.agents.composer_agent.constants import WRITER_STREAM_TAG
+
+from app.agents.orchestrator.checkpointer import (
+    aclose_checkpointer,
+    create_async_checkpointer,
+    create_checkpointer,
+    get_checkpointer_backend,
+)
 from app.agents.orchestrator.state.orchestrator_state import OrchestratorState
+from app.agents.rag_agent.state.rag_state import RetrievedChunkRef
 from app.agents.orchestrator.nodes import route_after_user_input
 from app.agents.user_input_template_agent.utils.cli import (
     create_arg_parser,
@@ -15,19 +28,38 @@ from app.agents.user_input_template_agent.utils.cli import (
     make_config,
 )
 
-from app.agents.rag_agent.rag_graph import graph as retrieve_graph
-from app.agents.user_input_template_agent.graph import graph as user_input_graph
-from app.agents.vet_agent.graph import graph as vet_graph
-from app.agents.judge_agent.graph import graph as judge_graph
-from app.agents.composer_agent.graph import graph as composer_graph
-
 
 def save_recommendation(state: OrchestratorState) -> dict:
-    """현재 사이클의 retrieved_documents를 recommendation_history에 누적합니다."""
-    return {"recommendation_history": [state.retrieved_documents]}
+    """
+    현재 사이클의 retrieved_documents를 recommendation_history에 누적합니다.
+
+    vet_diagnosis와 RAG 병렬 실행 결과가 합류(join)하는 노드로,
+    두 브랜치가 모두 끝난 다음 superstep에서 1회 실행됩니다.
+
+    체크포인터가 superstep마다 이력을 다시 직렬화하므로 Document 전체 대신
+    chunk 참조(RetrievedChunkRef)만 저장하고, 원문은 로컬 chunk 캐시에 보관합니다.
+    """
+    from app.agents.rag_agent.tools.hydrate import cache_documents
+
+    cache_documents(state.retrieved_documents)
+    # point id가 없는 Document는 복원할 수 없으므로 이력에서 제외 (cache_documents와 동일)
+    refs = [
+        ref
+        for document in state.retrieved_documents
+        if (ref := RetrievedChunkRef.from_document(document)) is not None
+    ]
+    return {"recommendation_history": [refs]}
 
 
 def build_orchestrator_graph(checkpointer=None):
+    # 서브그래프 모듈은 LLM/임베딩/Qdrant SDK 등 무거운 의존성을 import하므로
+    # 모듈 import 시점이 아닌 그래프 생성 시점에 불러옵니다.
+    from app.agents.rag_agent.rag_graph import graph as retrieve_graph
+    from app.agents.user_input_template_agent.graph import graph as user_input_graph
+    from app.agents.vet_agent.graph import graph as vet_graph
+    from app.agents.judge_agent.graph import graph as judge_graph
+    from app.agents.composer_agent.graph import graph as composer_graph
+
     graph_builder = StateGraph(OrchestratorState)
 
     graph_builder.add_node("user_input_template", user_input_graph)
@@ -38,8 +70,13 @@ def build_orchestrator_graph(checkpointer=None):
     graph_builder.add_node("composer", composer_graph)
 
     graph_builder.add_edge(START, "user_input_template")
-    graph_builder.add_conditional_edges("user_input_template", route_after_user_input)
-    graph_builder.add_edge("vet_diagnosis", "RAG")
+    graph_builder.add_conditional_edges(
+        "user_input_template",
+        route_after_user_input,
+        ["vet_diagnosis", "RAG", END],
+    )
+    # vet_diagnosis와 RAG는 같은 superstep에서 병렬 실행된 뒤 save_recommendation에서 합류
+    graph_builder.add_edge("vet_diagnosis", "save_recommendation")
     graph_builder.add_edge("RAG", "save_recommendation")
     graph_builder.add_edge("save_recommendation", "judge")
     graph_builder.add_edge("judge", "composer")
@@ -48,13 +85,100 @@ def build_orchestrator_graph(checkpointer=None):
     return graph_builder.compile(checkpointer=checkpointer)
 
 
-in_memory_saver = InMemorySaver()
-graph = build_orchestrator_graph(checkpointer=in_memory_saver)
-create_graph_image(
-    graph,
-    file_name="orchestrator_graph",
-    base_dir=get_parent_path(__file__),
-)
+_graph = None
+_graph_lock = threading.Lock()
+checkpointer = None
+
+
+def get_graph():
+    """
+    컴파일된 Orchestrator 그래프를 반환합니다. 최초 호출 시 1회만 컴파일합니다.
+
+    체크포인터 backend는 ORCHESTRATOR_CHECKPOINTER 환경변수로 선택합니다. (checkpointer.py 참고)
+    """
+    global _graph, checkpointer
+
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                checkpointer = create_checkpointer()
+                _graph = build_orchestrator_graph(checkpointer=checkpointer)
+    return _graph
+
+
+_async_graph = None
+_async_graph_lock = asyncio.Lock()
+
+
+async def aget_graph():
+    """
+    비동기 실행(ainvoke/astream/aget_state)용 Orchestrator 그래프를 반환합니다.
+
+    sqlite/postgres 동기 saver는 async 메서드를 지원하지 않으므로 async saver로 컴파일한 그래프를 사용합니다.
+    memory backend는 동기/비동기 모두 지원하므로 get_graph()와 같은 그래프(같은 thread 상태)를 공유합니다.
+    async saver의 DB 연결은 최초 호출한 event loop(FastAPI 서버)에 묶입니다.
+    """
+    global _async_graph
+
+    if get_checkpointer_backend() == "memory":
+        return get_graph()
+
+    if _async_graph is None:
+        async with _async_graph_lock:
+            if _async_graph is None:
+                _async_graph = build_orchestrator_graph(
+                    checkpointer=await create_async_checkpointer()
+                )
+    return _async_graph
+
+
+async def aclose_graph() -> None:
+    """aget_graph가 만든 async saver의 DB 연결을 닫습니다. (서버 종료 시)"""
+    global _async_graph
+
+    async with _async_graph_lock:
+        if _async_graph is not None:
+            await aclose_checkpointer(_async_graph.checkpointer)
+            _async_graph = None
+
+
+def __getattr__(name: str):
+    # 기존 `from ...orchestrator_graph import graph` 사용처 호환 (지연 컴파일)
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def render_graph_image() -> None:
+    """그래프 구조를 orchestrator_graph.png로 저장합니다. (mermaid 렌더링, 네트워크 사용)"""
+    create_graph_image(
+        get_graph(),
+        file_name="orchestrator_graph",
+        base_dir=get_parent_path(__file__),
+    )
+
+
+def warmup() -> float:
+    """
+    그래프 컴파일과 공유 클라이언트(LLM, 임베딩, Qdrant) 초기화를 미리 수행합니다.
+
+    Returns:
+        float: warmup 소요 시간(초)
+    """
+    from app.agents.document_parser.nodes.embeddings import load_underlying_embeddings
+    from app.agents.document_parser.nodes.vector_store import (
+        get_async_vector_db_client,
+        get_vector_db_client,
+    )
+    from app.agents.vet_agent.model.model import get_llm
+
+    start_time = time.perf_counter()
+    get_graph()
+    get_llm()
+    load_underlying_embeddings()
+    get_vector_db_client()
+    get_async_vector_db_client()
+    return time.perf_counter() - start_time
 
 
 def run_orchestration(yaml_path: str | Path, config: dict) -> dict:
@@ -72,12 +196,87 @@ def run_orchestration(yaml_path: str | Path, config: dict) -> dict:
     """
     state = load_state_from_yaml(yaml_path, OrchestratorState)
     # YAML에 명시된 필드만 전달하여 체크포인터 상태를 덮어쓰지 않도록 함
-    return graph.invoke(
+    return get_graph().invoke(
+        state.model_dump(exclude_unset=True),
+        config=config,
+    )
+
+
+async def arun_orchestration(yaml_path: str | Path, config: dict) -> dict:
+    """run_orchestration의 비동기 버전. 모든 노드가 비동기 클라이언트로 실행됩니다."""
+    state = load_state_from_yaml(yaml_path, OrchestratorState)
+    graph = await aget_graph()
+    return await graph.ainvoke(
         state.model_dump(exclude_unset=True),
         config=config,
     )
 
 
+async def astream_orchestration(
+    state: dict,
+    config: dict,
+    stream_mode: str | list[str] = "updates",
+) -> AsyncIterator[Any]:
+    """
+    Orchestrator 그래프를 비동기로 실행하며 노드 단위 진행 결과를 순차 반환합니다.
+
+    Args:
+        state (dict): 그래프 입력 (체크포인터 상태를 덮어쓰지 않도록 명시된 필드만 전달)
+        config (dict): LangGraph config (thread_id 등 configurable 포함)
+        stream_mode: LangGraph stream mode (e.g. "updates", "values", "messages")
+    """
+    graph = await aget_graph()
+    async for chunk in graph.astream(state, config=config, stream_mode=stream_mode):
+        yield chunk
+
+
+def get_recommendation_history(config: dict) -> list[list[Document]]:
+    """thread의 recommendation_history를 Document로 복원(hydration)하여 반환합니다."""
+    from app.agents.rag_agent.tools.hydrate import hydrate_chunk_refs
+
+    snapshot = get_graph().get_state(config)
+    return [
+        hydrate_chunk_refs(refs)
+        for refs in snapshot.values.get("recommendation_history", [])
+    ]
+
+
+async def aget_recommendation_history(config: dict) -> list[list[Document]]:
+    """get_recommendation_history의 비동기 버전"""
+    from app.agents.rag_agent.tools.hydrate import ahydrate_chunk_refs
+
+    graph = await aget_graph()
+    snapshot = await graph.aget_state(config)
+    return [
+        await ahydrate_chunk_refs(refs)
+        for refs in snapshot.values.get("recommendation_history", [])
+    ]
+
+
+# 노드 진행 상황(updates) + writer 토큰(messages)을 함께 받기 위한 stream 설정
+# (writer는 composer 서브그래프 내부 노드이므로 subgraphs=True 필요)
+TOKEN_STREAM_MODES = ["updates", "messages"]
+
+
+def to_pipeline_event(chunk: tuple) -> tuple[str, Any] | None:
+    """
+    `stream(..., stream_mode=TOKEN_STREAM_MODES, subgraphs=True)` chunk를 이벤트로 변환합니다.
+
+    Returns:
+        ("update", {node: update}): 최상위 그래프 노드 1개 완료
+        ("token", str): 최종 메시지(writer) 토큰
+        None: 서브그래프 내부 update, 다른 LLM(vet/judge 등)의 메시지
+    """
+    namespace, mode, data = chunk
+    if mode == "updates":
+        return ("update", data) if not namespace else None
+
+    message, metadata = data
+    if WRITER_STREAM_TAG in metadata.get("tags", []) and message.content:
+        return ("token", message.content)
+    return None
+
+
 def print_orchestration_result(result: dict) -> None:
     """Orchestrator 실행 결과를 콘솔에 출력합니다."""
     if result.get("is_blocked"):
@@ -93,9 +292,35 @@ def print_orchestration_result(result: dict) -> None:
 
 
 def main():
-    args = create_arg_parser().parse_args()
+    parser = create_arg_parser()
+    parser.add_argument(
+        "--use-async",
+        action="store_true",
+        help="ainvoke 기반 비동기 파이프라인으로 실행",
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="그래프 컴파일 및 클라이언트 초기화만 수행하고 종료",
+    )
+    parser.add_argument(
+        "--render-graph",
+        action="store_true",
+        help="그래프 이미지(orchestrator_graph.png)를 다시 생성",
+    )
+    args = parser.parse_args()
+
+    if args.render_graph:
+        render_graph_image()
+    if args.warmup:
+        rprint(f"✅warmup done (elapsed: {warmup():.2f}s)")
+        return
+
     config = make_config(args.thread_id)
-    result = run_orchestration(args.input, config=config)
+    if args.use_async:
+        result = asyncio.run(arun_orchestration(args.input, config=config))
+    else:
+        result = run_orchestration(args.input, config=config)
     print_orchestration_result(result)
 
 
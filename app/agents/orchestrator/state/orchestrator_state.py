@@ -1,17 +1,29 @@
-import operator
+import os
 from typing import Annotated, Optional
 
-from langchain_core.documents import Document
 from pydantic import Field
 
 from app.agents.judge_agent.state import JudgeAgentState
 from app.agents.vet_agent.state import VetAgentState
-from app.agents.rag_agent.state.rag_state import RagState
+from app.agents.rag_agent.state.rag_state import RagState, RetrievedChunkRef
+
+# thread별로 유지할 최근 추천 사이클 수 (체크포인터에 누적되는 상태 크기 상한)
+MAX_RECOMMENDATION_HISTORY = int(os.getenv("MAX_RECOMMENDATION_HISTORY", "5"))
+
+
+def append_recommendation_history(
+    left: list[list[RetrievedChunkRef]], right: list[list[RetrievedChunkRef]]
+) -> list[list[RetrievedChunkRef]]:
+    """operator.add와 같이 이력을 누적하되 최근 MAX_RECOMMENDATION_HISTORY개만 유지합니다."""
+    return (left + right)[-MAX_RECOMMENDATION_HISTORY:]
 
 
 class OrchestratorState(JudgeAgentState, RagState, VetAgentState):
-    recommendation_history: Annotated[list[list[Document]], operator.add] = Field(
-        default_factory=list, description="사이클별 추천 보험 상품 이력"
+    recommendation_history: Annotated[
+        list[list[RetrievedChunkRef]], append_recommendation_history
+    ] = Field(
+        default_factory=list,
+        description="사이클별 추천 보험 상품 이력 (최근 N개, chunk 참조만 저장)",
     )
     is_blocked: bool = False
     blocked_reason: Optional[str] = None
@@ -0,0 +1,194 @@
+"""로컬 벡터 검색 엔진(local_index) 구성별 지연 시간/메모리 벤치마크.
+
+임의의 정규화 vector 행렬(10k~1M)로 다음 구성을 비교한다.
+- argsort(f32): 기존 rag_agent_gs.cos_top 방식 (float32 행렬곱 + 전체 np.argsort)
+- argpartition(f32): float32 행렬 + argpartition top-k
+- argpartition(f16): float16 행렬 + argpartition top-k (메모리 1/2)
+- mmap(f16): 디스크 .npy를 mmap으로 연 float16 행렬 (warm page cache 기준)
+- batch(f16, m=N): N개 질의를 한 번의 행렬곱으로 검색한 질의당 지연 시간
+
+recall@k는 float32 exact 결과 대비 float16 구성의 top-k 일치율이다.
+float32 행렬이 --max-ram-mb를 넘는 크기에서는 float32 구성을 건너뛴다.
+
+실행 예시:
+    uv run python -m app.agents.rag_agent.bench_local_index
+    uv run python -m app.agents.rag_agent.bench_local_index --sizes 10000,100000,1000000 --dim 1024
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.rag_agent.tools.local_index import LocalVectorIndex, normalize_rows
+
+GENERATE_BLOCK_ROWS = 65536
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _write_random_matrix(path: Path, size: int, dim: int, seed: int) -> None:
+    """float16 정규화 행렬을 block 단위로 생성해 .npy로 저장합니다. (전체를 메모리에 올리지 않음)"""
+    rng = np.random.default_rng(seed)
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float16, shape=(size, dim))
+    for start in range(0, size, GENERATE_BLOCK_ROWS):
+        rows = min(GENERATE_BLOCK_ROWS, size - start)
+        matrix[start : start + rows] = normalize_rows(
+            rng.standard_normal((rows, dim), dtype=np.float32)
+        ).astype(np.float16)
+    matrix.flush()
+    del matrix
+
+
+def _measure(fn: Callable[[np.ndarray], np.ndarray], queries: np.ndarray) -> list[float]:
+    fn(queries[0])  # warmup (mmap page cache 적재 포함)
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _argsort_topk(matrix: np.ndarray, k: int) -> Callable[[np.ndarray], np.ndarray]:
+    def _search(query: np.ndarray) -> np.ndarray:
+        scores = matrix @ query
+        return np.argsort(-scores)[:k]
+
+    return _search
+
+
+def _index_topk(index: LocalVectorIndex, k: int) -> Callable[[np.ndarray], np.ndarray]:
+    def _search(query: np.ndarray) -> np.ndarray:
+        return index.search_batch(query, k)[0][0]
+
+    return _search
+
+
+def _recall(expected: np.ndarray, found: np.ndarray) -> float:
+    return statistics.mean(
+        len(set(e) & set(f)) / len(e) for e, f in zip(expected.tolist(), found.tolist())
+    )
+
+
+def run_benchmark(
+    sizes: list[int], dim: int, k: int, queries_count: int, batch_size: int, max_ram_mb: int
+) -> None:
+    table = Table(title=f"local vector index benchmark (dim={dim}, k={k}, queries={queries_count})")
+    table.add_column("size", justify="right")
+    table.add_column("config")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("QPS", justify="right")
+    table.add_column("matrix (MB)", justify="right")
+    table.add_column(f"recall@{k}", justify="right")
+
+    rng = np.random.default_rng(0)
+    queries = normalize_rows(rng.standard_normal((queries_count, dim), dtype=np.float32))
+
+    def add_row(size, config, latencies, nbytes, recall=None, per_query_divisor=1):
+        per_query = [latency / per_query_divisor for latency in latencies]
+        table.add_row(
+            f"{size:,}",
+            config,
+            f"{_percentile(per_query, 0.5):.3f}",
+            f"{_percentile(per_query, 0.95):.3f}",
+            f"{1000 / statistics.mean(per_query):.1f}",
+            f"{nbytes / 1024 / 1024:.1f}",
+            f"{recall:.3f}" if recall is not None else "-",
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            rprint(f"🚀generate {size:,} x {dim} vectors")
+            path = Path(tmp_dir) / f"vectors_{size}.npy"
+            _write_random_matrix(path, size, dim, seed=size)
+            ids = list(range(size))
+
+            mmap_index = LocalVectorIndex(np.load(path, mmap_mode="r"), ids)
+            f16_index = LocalVectorIndex(np.load(path), ids)
+            f16_found = f16_index.search_batch(queries, k)[0]
+
+            f32_bytes = size * dim * 4
+            recall = None
+            if f32_bytes <= max_ram_mb * 1024 * 1024:
+                f32_matrix = np.asarray(f16_index.matrix, dtype=np.float32)
+                f32_index = LocalVectorIndex(f32_matrix, ids)
+                expected = f32_index.search_batch(queries, k)[0]
+                recall = _recall(expected, f16_found)
+                add_row(
+                    size, "argsort(f32)", _measure(_argsort_topk(f32_matrix, k), queries), f32_bytes
+                )
+                add_row(
+                    size,
+                    "argpartition(f32)",
+                    _measure(_index_topk(f32_index, k), queries),
+                    f32_bytes,
+                    1.0,
+                )
+                del f32_matrix, f32_index
+            else:
+                rprint(f"⚠️skip float32 configs for size={size:,} (> --max-ram-mb {max_ram_mb})")
+
+            add_row(
+                size,
+                "argpartition(f16)",
+                _measure(_index_topk(f16_index, k), queries),
+                f16_index.nbytes,
+                recall,
+            )
+            add_row(
+                size,
+                "mmap(f16)",
+                _measure(_index_topk(mmap_index, k), queries),
+                mmap_index.nbytes,
+                recall,
+            )
+
+            batch_count = max(1, len(queries) // batch_size)
+            batches = queries[: batch_count * batch_size].reshape(batch_count, -1, dim)
+            add_row(
+                size,
+                f"batch(f16, m={batches.shape[1]})",
+                _measure(lambda batch: f16_index.search_batch(batch, k)[0], batches),
+                f16_index.nbytes,
+                recall,
+                per_query_divisor=batches.shape[1],
+            )
+            del f16_index, mmap_index
+
+    rprint(table)
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark local vector index.")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="vector 수 (쉼표 구분)")
+    parser.add_argument("--dim", type=int, default=1024, help="vector 차원 (운영: 4096)")
+    parser.add_argument("--k", type=int, default=3, help="top-k")
+    parser.add_argument("--queries", type=int, default=64, help="질의 수")
+    parser.add_argument("--batch-size", type=int, default=32, help="batch 검색 질의 수")
+    parser.add_argument(
+        "--max-ram-mb", type=int, default=2048, help="float32 구성을 측정할 최대 행렬 크기(MB)"
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        dim=args.dim,
+        k=args.k,
+        queries_count=args.queries,
+        batch_size=args.batch_size,
+        max_ram_mb=args.max_ram_mb,
+    )
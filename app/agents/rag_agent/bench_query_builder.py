@@ -0,0 +1,104 @@
+"""질의 생성 방식(template vs llm)별 지연 시간과 검색 결과 recall을 비교하는 벤치마크.
+
+- latency: 질의 문장 생성에 걸린 시간 (llm 모드는 memoization 미적용 기준)
+- recall@k: llm 모드 검색 결과(top-k)를 기준으로 template 모드 검색 결과가 겹치는 비율
+
+사전 조건: Qdrant 실행 + 약관 적재 완료, UPSTAGE_API_KEY 설정
+
+실행 예시:
+    uv run python -m app.agents.rag_agent.bench_query_builder
+    uv run python -m app.agents.rag_agent.bench_query_builder --limit 10 --k 5
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.rag_agent.nodes.embed_query import embed_query
+from app.agents.rag_agent.nodes.generate_user_query import (
+    _invoke_llm_query,
+    build_template_query,
+)
+from app.agents.rag_agent.state.rag_state import RagState
+from app.agents.rag_agent.tools.retrieve import retrieve
+from app.agents.user_input_template_agent.utils.cli import load_state_from_yaml
+from app.agents.vet_agent.state import VetAgentState
+
+SAMPLES_DIR = Path("app/agents/user_input_template_agent/samples/naver")
+
+
+def _doc_key(doc) -> str:
+    # langchain_qdrant가 metadata에 추가하는 point id를 우선 사용
+    return str(doc.metadata.get("_id") or doc.page_content)
+
+
+def _retrieve_keys(user_query: str, k: int) -> list[str]:
+    embedding = embed_query(RagState(user_query=user_query))["user_query_embedding"]
+    documents = retrieve(RagState(user_query_embedding=embedding))["retrieved_documents"]
+    return [_doc_key(doc) for doc in documents[:k]]
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_benchmark(limit: int, k: int) -> None:
+    yaml_paths = sorted(SAMPLES_DIR.glob("*.yaml"))[:limit]
+    states = [load_state_from_yaml(path, VetAgentState) for path in yaml_paths]
+    states = [state for state in states if state.species and state.gender]
+
+    latencies: dict[str, list[float]] = {"template": [], "llm": []}
+    recalls: list[float] = []
+
+    for i, state in enumerate(states, 1):
+        start = time.perf_counter()
+        template_query = build_template_query(state)
+        latencies["template"].append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        llm_query = _invoke_llm_query(state)
+        latencies["llm"].append((time.perf_counter() - start) * 1000)
+
+        reference = set(_retrieve_keys(llm_query, k))
+        candidate = set(_retrieve_keys(template_query, k))
+        recall = len(reference & candidate) / len(reference) if reference else 1.0
+        recalls.append(recall)
+
+        rprint(f"[{i}/{len(states)}] recall@{k}={recall:.2f}")
+        rprint(f"  template: {template_query}")
+        rprint(f"  llm     : {llm_query}")
+
+    table = Table(title=f"query builder benchmark (n={len(states)}, k={k})")
+    table.add_column("mode")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("mean (ms)", justify="right")
+    for mode, values in latencies.items():
+        table.add_row(
+            mode,
+            f"{_percentile(values, 0.5):.3f}",
+            f"{_percentile(values, 0.95):.3f}",
+            f"{statistics.mean(values):.3f}",
+        )
+    rprint(table)
+    rprint(
+        f"template recall@{k} (llm 기준): mean={statistics.mean(recalls):.3f}, "
+        f"min={min(recalls):.3f}"
+    )
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark RAG query builders.")
+    parser.add_argument("--limit", type=int, default=30, help="사용할 샘플 수")
+    parser.add_argument("--k", type=int, default=3, help="recall 계산에 사용할 top-k")
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(limit=args.limit, k=args.k)
@@ -0,0 +1,183 @@
+"""검색 경로별 지연 시간과 응답 payload 크기를 비교하는 micro-benchmark.
+
+- legacy: 기존 retrieve 경로
+    collection_exists + QdrantVectorStore 생성(collection 설정 검증) + similarity_search_with_score_by_vector
+- native(rest): QdrantClient.query_points + 캐시된 collection 존재 확인 + payload 필드 선택 (HTTP)
+- native(grpc): native(rest)와 같은 검색을 gRPC로 수행
+- native(async): AsyncQdrantClient.query_points (HTTP)
+
+질의 벡터는 collection에 저장된 point의 벡터를 scroll로 가져와 사용하므로 임베딩 API는 호출하지 않는다.
+단, legacy 경로는 QdrantVectorStore 생성 시 embeddings.embed_documents(["dummy_text"])로 벡터 크기를
+검증하므로 기본적으로 UPSTAGE_API_KEY가 필요하다. (--fake-embeddings 사용 시 Qdrant 측 오버헤드만 측정)
+
+사전 조건: Qdrant 실행 + 약관 적재 완료
+
+실행 예시:
+    uv run python -m app.agents.rag_agent.bench_retrieve
+    uv run python -m app.agents.rag_agent.bench_retrieve --iterations 200 --fake-embeddings
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Callable, List
+
+from langchain_core.embeddings import FakeEmbeddings
+from langchain_qdrant import QdrantVectorStore
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.document_parser.constants import COLLECTION_NAME
+from app.agents.document_parser.nodes.embeddings import load_underlying_embeddings
+from app.agents.document_parser.nodes.vector_store import (
+    _vector_db_client_kwargs,
+    document_from_point,
+)
+from app.agents.rag_agent.tools.retrieve import RETRIEVE_PAYLOAD_FIELDS, TOP_K
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _payload_bytes(documents) -> int:
+    return sum(
+        len(
+            json.dumps(
+                {"page_content": doc.page_content, "metadata": doc.metadata},
+                ensure_ascii=False,
+                default=str,
+            ).encode("utf-8")
+        )
+        for doc in documents
+    )
+
+
+def _load_query_vectors(client: QdrantClient, count: int) -> List[List[float]]:
+    points, _ = client.scroll(
+        collection_name=COLLECTION_NAME, limit=count, with_vectors=True, with_payload=False
+    )
+    return [point.vector for point in points]
+
+
+def _measure(fn: Callable, vectors: List[List[float]], iterations: int):
+    fn(vectors[0])  # warmup (연결 생성 등 제외)
+    latencies = []
+    documents = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        documents = fn(vectors[i % len(vectors)])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, _payload_bytes(documents)
+
+
+async def _ameasure(fn: Callable, vectors: List[List[float]], iterations: int):
+    await fn(vectors[0])
+    latencies = []
+    documents = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        documents = await fn(vectors[i % len(vectors)])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, _payload_bytes(documents)
+
+
+def run_benchmark(iterations: int, fake_embeddings: bool) -> None:
+    client_kwargs = _vector_db_client_kwargs()
+    rest_client = QdrantClient(**{**client_kwargs, "prefer_grpc": False})
+    grpc_client = QdrantClient(**{**client_kwargs, "prefer_grpc": True})
+    async_client = AsyncQdrantClient(**{**client_kwargs, "prefer_grpc": False})
+
+    if not rest_client.collection_exists(COLLECTION_NAME):
+        rprint("❗️collection not found:", COLLECTION_NAME)
+        return
+
+    vectors = _load_query_vectors(rest_client, count=min(iterations, 50))
+    if not vectors:
+        rprint("❗️no points in collection:", COLLECTION_NAME)
+        return
+
+    if fake_embeddings:
+        embeddings = FakeEmbeddings(size=len(vectors[0]))
+    else:
+        embeddings = load_underlying_embeddings()
+
+    def legacy(vector):
+        rest_client.collection_exists(COLLECTION_NAME)
+        vector_store = QdrantVectorStore(
+            client=rest_client, collection_name=COLLECTION_NAME, embedding=embeddings
+        )
+        documents = []
+        for document, score in vector_store.similarity_search_with_score_by_vector(
+            vector, k=TOP_K
+        ):
+            document.metadata["_score"] = score
+            documents.append(document)
+        return documents
+
+    def native(client: QdrantClient):
+        def _search(vector):
+            response = client.query_points(
+                collection_name=COLLECTION_NAME,
+                query=vector,
+                limit=TOP_K,
+                with_payload=RETRIEVE_PAYLOAD_FIELDS,
+            )
+            return [document_from_point(point, COLLECTION_NAME) for point in response.points]
+
+        return _search
+
+    async def native_async(vector):
+        response = await async_client.query_points(
+            collection_name=COLLECTION_NAME,
+            query=vector,
+            limit=TOP_K,
+            with_payload=RETRIEVE_PAYLOAD_FIELDS,
+        )
+        return [document_from_point(point, COLLECTION_NAME) for point in response.points]
+
+    results = {
+        "legacy": _measure(legacy, vectors, iterations),
+        "native(rest)": _measure(native(rest_client), vectors, iterations),
+    }
+    try:
+        results["native(grpc)"] = _measure(native(grpc_client), vectors, iterations)
+    except Exception as e:  # gRPC 포트가 열려 있지 않은 경우
+        rprint(f"⚠️skip native(grpc): {type(e).__name__}: {e}")
+    results["native(async)"] = asyncio.run(_ameasure(native_async, vectors, iterations))
+
+    table = Table(title=f"retrieve benchmark (n={iterations}, k={TOP_K}, collection={COLLECTION_NAME})")
+    table.add_column("path")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("mean (ms)", justify="right")
+    table.add_column("payload (bytes)", justify="right")
+    for path, (latencies, payload_bytes) in results.items():
+        table.add_row(
+            path,
+            f"{_percentile(latencies, 0.5):.3f}",
+            f"{_percentile(latencies, 0.95):.3f}",
+            f"{statistics.mean(latencies):.3f}",
+            str(payload_bytes),
+        )
+    rprint(table)
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark retrieve paths (legacy vs native).")
+    parser.add_argument("--iterations", type=int, default=100, help="경로별 검색 횟수")
+    parser.add_argument(
+        "--fake-embeddings",
+        action="store_true",
+        help="legacy 경로의 collection 검증에 FakeEmbeddings 사용 (임베딩 API 호출 제외)",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = create_arg_parser().parse_args()
+    run_benchmark(iterations=args.iterations, fake_embeddings=args.fake_embeddings)
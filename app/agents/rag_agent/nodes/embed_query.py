@@ -1,9 +1,85 @@
+import os
+import re
+import threading
+import unicodedata
+from array import array
+from typing import List
+
 from rich import print as rprint
 
+from app.agents.cache import (
+    CACHE_DIR,
+    LRUCache,
+    SQLiteCache,
+    TieredCache,
+    make_cache_key,
+)
 from app.agents.document_parser.nodes.embeddings import load_underlying_embeddings
 
 from app.agents.rag_agent.state.rag_state import RagState
 
+_query_embedding_cache: TieredCache | None = None
+_query_embedding_cache_lock = threading.Lock()
+
+
+def _serialize_embedding(embedding: List[float]) -> bytes:
+    # 4096차원 기준 JSON 대비 약 1/3 크기
+    # API 응답과 같은 float64로 저장하여 캐시 hit과 새 임베딩의 값이 동일하도록 함
+    return array("d", embedding).tobytes()
+
+
+def _deserialize_embedding(raw: bytes) -> List[float]:
+    values = array("d")
+    values.frombytes(raw)
+    return values.tolist()
+
+
+def get_query_embedding_cache() -> TieredCache:
+    """
+    질의 임베딩 캐시를 반환합니다.
+
+    - 1차: 프로세스 내 LRU
+    - 2차: SQLite (QUERY_EMBEDDING_CACHE_BACKEND=memory 인 경우 생략)
+    """
+    global _query_embedding_cache
+
+    if _query_embedding_cache is not None:
+        return _query_embedding_cache
+
+    with _query_embedding_cache_lock:
+        # 병렬 실행 노드가 동시에 초기화하지 않도록 lock 획득 후 다시 확인
+        if _query_embedding_cache is not None:
+            return _query_embedding_cache
+
+        ttl_s = float(os.getenv("QUERY_EMBEDDING_CACHE_TTL_S", str(30 * 24 * 3600)))
+        l1 = LRUCache(
+            max_entries=int(os.getenv("QUERY_EMBEDDING_CACHE_MAX", "2048")),
+            ttl_s=ttl_s,
+        )
+        l2 = None
+        if os.getenv("QUERY_EMBEDDING_CACHE_BACKEND", "sqlite") == "sqlite":
+            l2 = SQLiteCache(
+                os.getenv(
+                    "QUERY_EMBEDDING_CACHE_PATH",
+                    str(CACHE_DIR / "query_embeddings.sqlite"),
+                ),
+                # float32로 저장하던 기존 table과 형식이 다르므로 별도 table 사용
+                table="query_embeddings_f64",
+                max_entries=int(os.getenv("QUERY_EMBEDDING_CACHE_DISK_MAX", "100000")),
+                ttl_s=ttl_s,
+                serialize=_serialize_embedding,
+                deserialize=_deserialize_embedding,
+            )
+        _query_embedding_cache = TieredCache(l1, l2)
+
+    return _query_embedding_cache
+
+
+def normalize_query_text(text: str) -> str:
+    """캐시 key 생성을 위해 유니코드/공백을 정규화합니다."""
+    text = unicodedata.normalize("NFC", text)
+    return re.sub(r"\s+", " ", text).strip()
+
 
 def embed_query(state: RagState) -> RagState:
     # rprint(">>> embed_query input state", state)
@@ -12,5 +88,38 @@ def embed_query(state: RagState) -> RagState:
         raise ValueError("invalid user_query !")
 
     underlying_embeddings = load_underlying_embeddings()
+
+    # (모델명, 정규화된 질의) 기준으로 캐시 조회 → hit이면 임베딩 API 호출 생략
+    cache = get_query_embedding_cache()
+    cache_key = make_cache_key(
+        underlying_embeddings.model, normalize_query_text(state.user_query)
+    )
+    user_query_embedding = cache.get(cache_key)
+    if user_query_embedding is not None:
+        # rprint(">>> query embedding cache hit", cache.stats())
+        return {"user_query_embedding": user_query_embedding}
+
     user_query_embedding = underlying_embeddings.embed_query(state.user_query)
+    cache.set(cache_key, user_query_embedding)
+    return {"user_query_embedding": user_query_embedding}
+
+
+async def aembed_query(state: RagState) -> RagState:
+    """embed_query의 비동기 버전"""
+    if not state.user_query:
+        raise ValueError("invalid user_query !")
+
+    underlying_embeddings = load_underlying_embeddings()
+
+    cache = get_query_embedding_cache()
+    cache_key = make_cache_key(
+        underlying_embeddings.model, normalize_query_text(state.user_query)
+    )
+    # SQLite(2차) 조회/저장은 event loop를 막지 않도록 thread에서 실행
+    user_query_embedding = await cache.aget(cache_key)
+    if user_query_embedding is not None:
+        return {"user_query_embedding": user_query_embedding}
+
+    user_query_embedding = await underlying_embeddings.aembed_query(state.user_query)
+    await cache.aset(cache_key, user_query_embedding)
     return {"user_query_embedding": user_query_embedding}
@@ -1,20 +1,68 @@
-from langchain.chat_models import init_chat_model
+import os
+from typing import Awaitable, Callable, Dict
+
+from langchain_core.runnables import RunnableConfig
 
 from rich import print as rprint
 
+from app.agents.cache import LRUCache, make_cache_key
+from app.agents.llm_registry import get_chat_model
 from app.agents.rag_agent.state.rag_state import RagState, GenerateUserQueryOutput
 
 from app.agents.vet_agent.state import VetAgentState
 
+QueryBuilder = Callable[[VetAgentState], str]
+AsyncQueryBuilder = Callable[[VetAgentState], Awaitable[str]]
 
-def generate_user_query(state: VetAgentState) -> RagState:
-    # rprint(">>> generate_user_query input state", state)
+DEFAULT_QUERY_BUILDER = "template"
 
-    if not state or not state.species:
-        raise ValueError("invalid VetAgentState !")
+GENDER_KR = {"male": "수컷", "female": "암컷"}
+
+# LLM 모드 전용 memoization: 정규화된 프로필 → 생성된 질의
+_llm_query_cache = LRUCache(
+    max_entries=int(os.getenv("LLM_QUERY_CACHE_MAX", "1024")),
+    ttl_s=float(os.getenv("LLM_QUERY_CACHE_TTL_S", str(24 * 3600))),
+)
+
+
+def normalize_profile(state: VetAgentState) -> dict:
+    """질의 생성에 사용되는 필드만 추려 정규화합니다. (memoization key 용도)"""
+    return {
+        "species": (state.species or "").strip(),
+        "breed": (state.breed or "").strip(),
+        "age": state.age,
+        "gender": state.gender.value if state.gender else None,
+        "weight": state.weight,
+    }
+
+
+def build_template_query(state: VetAgentState) -> str:
+    """
+    LLM 호출 없이 템플릿으로 질의 문장을 생성합니다. (기본 모드)
+
+    >>> "10살 수컷 치와와 강아지(체중 10kg)에게 맞는 펫보험 상품을 추천해 주세요."
+    """
+    profile = normalize_profile(state)
+
+    subject = " ".join(
+        part
+        for part in (
+            f"{profile['age']}살" if profile["age"] is not None else "",
+            GENDER_KR.get(profile["gender"], ""),
+            profile["breed"],
+            profile["species"],
+        )
+        if part
+    )
+    if profile["weight"] is not None:
+        subject += f"(체중 {profile['weight']}kg)"
 
-    prompt = f"""
-사용자의 정보를 알려줄게. 
+    return f"{subject}에게 맞는 펫보험 상품을 추천해 주세요."
+
+
+def _build_llm_query_prompt(state: VetAgentState) -> str:
+    return f"""
+사용자의 정보를 알려줄게.
 
 종: {state.species}
 품종: {state.breed}
@@ -24,15 +72,123 @@ def generate_user_query(state: VetAgentState) -> RagState:
 
 위 정보를 빠짐없이 모두 포함해서, 마치 사용자가 직접 보험 상품 추천을 요청한 것과 같은 자연스러운 질문 문장으로 만들어줘. 생성된 문장에는 사용자의 정보가 단 하나도 빠지지 않고 포함되어야 해.
 """
+
+
+def _load_structured_llm():
+    return get_chat_model("rag_query", schema=GenerateUserQueryOutput)
+
+
+def _invoke_llm_query(state: VetAgentState) -> str:
+    prompt = _build_llm_query_prompt(state)
     # rprint(">>> generated prompt", prompt)
 
-    MODEL = "solar-pro2"
-    llm = init_chat_model(model=MODEL, temperature=0.0)
-    structured_llm = llm.with_structured_output(GenerateUserQueryOutput)
+    structured_llm = _load_structured_llm()
     llm_response: GenerateUserQueryOutput = structured_llm.invoke(
         # [{"role": "system", "content": prompt}]
         prompt
     )
     # rprint(">>> llm_response", llm_response)
 
-    return {"user_query": llm_response.user_query}
+    return llm_response.user_query
+
+
+async def _ainvoke_llm_query(state: VetAgentState) -> str:
+    structured_llm = _load_structured_llm()
+    llm_response: GenerateUserQueryOutput = await structured_llm.ainvoke(
+        _build_llm_query_prompt(state)
+    )
+    return llm_response.user_query
+
+
+def build_llm_query(state: VetAgentState) -> str:
+    """
+    LLM으로 자연어 질의 문장을 생성합니다. (opt-in 모드)
+
+    temperature 0.0으로 생성하므로 같은 프로필은 같은 결과로 간주하고 memoization합니다.
+    """
+    cache_key = make_cache_key("llm_query", normalize_profile(state))
+    user_query = _llm_query_cache.get(cache_key)
+    if user_query is None:
+        user_query = _invoke_llm_query(state)
+        _llm_query_cache.set(cache_key, user_query)
+    return user_query
+
+
+async def abuild_llm_query(state: VetAgentState) -> str:
+    """build_llm_query의 비동기 버전"""
+    cache_key = make_cache_key("llm_query", normalize_profile(state))
+    user_query = _llm_query_cache.get(cache_key)
+    if user_query is None:
+        user_query = await _ainvoke_llm_query(state)
+        _llm_query_cache.set(cache_key, user_query)
+    return user_query
+
+
+QUERY_BUILDERS: Dict[str, QueryBuilder] = {
+    "template": build_template_query,
+    "llm": build_llm_query,
+}
+
+# 네트워크 I/O가 있는 방식만 비동기 버전을 등록 (없으면 동기 버전 사용)
+ASYNC_QUERY_BUILDERS: Dict[str, AsyncQueryBuilder] = {
+    "llm": abuild_llm_query,
+}
+
+
+def register_query_builder(
+    name: str,
+    builder: QueryBuilder,
+    async_builder: AsyncQueryBuilder | None = None,
+) -> None:
+    """새로운 질의 생성 방식을 등록합니다."""
+    QUERY_BUILDERS[name] = builder
+    if async_builder is not None:
+        ASYNC_QUERY_BUILDERS[name] = async_builder
+
+
+def _resolve_query_builder_mode(config: RunnableConfig | None = None) -> str:
+    """
+    질의 생성 방식 선택 우선순위:
+    1) config["configurable"]["query_builder"]
+    2) 환경변수 RAG_QUERY_BUILDER
+    3) DEFAULT_QUERY_BUILDER ("template")
+    """
+    configurable = (config or {}).get("configurable", {})
+    mode = configurable.get("query_builder") or os.getenv(
+        "RAG_QUERY_BUILDER", DEFAULT_QUERY_BUILDER
+    )
+    if mode not in QUERY_BUILDERS:
+        raise ValueError(
+            f"unknown query builder: {mode} (available: {', '.join(QUERY_BUILDERS)})"
+        )
+    return mode
+
+
+def resolve_query_builder(config: RunnableConfig | None = None) -> QueryBuilder:
+    return QUERY_BUILDERS[_resolve_query_builder_mode(config)]
+
+
+def generate_user_query(
+    state: VetAgentState, config: RunnableConfig | None = None
+) -> RagState:
+    # rprint(">>> generate_user_query input state", state)
+
+    if not state or not state.species:
+        raise ValueError("invalid VetAgentState !")
+
+    query_builder = resolve_query_builder(config)
+    return {"user_query": query_builder(state)}
+
+
+async def agenerate_user_query(
+    state: VetAgentState, config: RunnableConfig | None = None
+) -> RagState:
+    """generate_user_query의 비동기 버전"""
+    if not state or not state.species:
+        raise ValueError("invalid VetAgentState !")
+
+    mode = _resolve_query_builder_mode(config)
+    async_builder = ASYNC_QUERY_BUILDERS.get(mode)
+    if async_builder is not None:
+        return {"user_query": await async_builder(state)}
+    return {"user_query": QUERY_BUILDERS[mode](state)}
@@ -1,3 +1,4 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.graph import StateGraph, START, END
 
@@ -5,10 +6,13 @@ from rich import print as rprint
 
 from app.agents import utils
 
-from app.agents.rag_agent.nodes.embed_query import embed_query
-from app.agents.rag_agent.nodes.generate_user_query import generate_user_query
+from app.agents.rag_agent.nodes.embed_query import aembed_query, embed_query
+from app.agents.rag_agent.nodes.generate_user_query import (
+    agenerate_user_query,
+    generate_user_query,
+)
 from app.agents.rag_agent.state.rag_state import RagState
-from app.agents.rag_agent.tools.retrieve import retrieve
+from app.agents.rag_agent.tools.retrieve import aretrieve, retrieve
 
 from app.agents.vet_agent.state import VetAgentState
 
@@ -19,13 +23,18 @@ class RagGraphState(VetAgentState, RagState): ...
 def build_graph() -> CompiledStateGraph:
     workflow = StateGraph(
         RagGraphState,
-        # input_schema=VetAgentState,
-        # output_schema=RagState,
+        input_schema=VetAgentState,
+        # vet_diagnosis와 병렬 실행되므로 RAG 결과 필드만 반환 (diseases 등 중복 갱신 방지)
+        output_schema=RagState,
     )
 
-    workflow.add_node("generate_user_query", generate_user_query)
-    workflow.add_node("embed_query", embed_query)
-    workflow.add_node("retrieve", retrieve)
+    # invoke/stream은 동기 함수, ainvoke/astream은 비동기 함수로 실행
+    workflow.add_node(
+        "generate_user_query",
+        RunnableLambda(generate_user_query, afunc=agenerate_user_query),
+    )
+    workflow.add_node("embed_query", RunnableLambda(embed_query, afunc=aembed_query))
+    workflow.add_node("retrieve", RunnableLambda(retrieve, afunc=aretrieve))
 
     workflow.add_edge(START, "generate_user_query")
     workflow.add_edge("generate_user_query", "embed_query")
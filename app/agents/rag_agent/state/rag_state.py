@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Union
 
 from langchain_core.documents import Document
 
@@ -10,6 +10,43 @@ class RagState(BaseModel):
     retrieved_documents: Optional[List[Document]] = Field(default_factory=list)
 
 
+class RetrievedChunkRef(BaseModel):
+    """
+    검색된 chunk의 경량 참조 (recommendation_history 저장용)
+
+    page_content/metadata 전체 대신 Qdrant point id와 식별 정보만 저장하고,
+    원문이 필요할 때 `rag_agent.tools.hydrate`로 복원합니다.
+    """
+
+    point_id: Union[str, int]
+    collection_name: str
+    score: Optional[float] = None
+    chunk_id: Optional[str] = None
+    file_name: Optional[str] = None
+    page: Optional[int] = None
+
+    @classmethod
+    def from_document(cls, document: Document) -> Optional["RetrievedChunkRef"]:
+        """
+        Qdrant point id/collection이 없는 Document(mock, 다른 retriever 결과 등)는
+        다시 조회할 수 없으므로 None을 반환합니다. (hydrate.cache_documents와 같은 기준)
+        """
+        metadata = document.metadata
+        point_id = metadata.get("_id")
+        collection_name = metadata.get("_collection_name")
+        if point_id is None or collection_name is None:
+            return None
+        doc_metadata = metadata.get("doc") or {}
+        return cls(
+            point_id=point_id,
+            collection_name=collection_name,
+            score=metadata.get("_score"),
+            chunk_id=(metadata.get("indexing") or {}).get("chunk_id"),
+            file_name=doc_metadata.get("file_name"),
+            page=doc_metadata.get("page"),
+        )
+
+
 class GenerateUserQueryOutput(BaseModel):
     user_query: str = Field(
         description="주어진 정보를 바탕으로 LLM이 생성한 사용자 질문"
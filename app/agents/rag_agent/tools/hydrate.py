@@ -0,0 +1,126 @@
+"""
+RetrievedChunkRef → Document 복원 (lazy hydration)
+
+recommendation_history에는 chunk 참조(RetrievedChunkRef)만 저장되므로,
+원문이 필요한 시점에 로컬 chunk 캐시 → Qdrant(retrieve API) 순서로 Document를 복원한다.
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, List
+
+from langchain_core.documents import Document
+
+from app.agents.cache import LRUCache, make_cache_key
+from app.agents.document_parser.nodes.vector_store import (
+    document_from_point,
+    get_async_vector_db_client,
+    get_vector_db_client,
+)
+from app.agents.rag_agent.state.rag_state import RetrievedChunkRef
+from app.agents.rag_agent.tools.retrieve import RETRIEVE_PAYLOAD_FIELDS
+
+# (collection_name, point_id) → Document (score 제외)
+_chunk_cache = LRUCache(
+    max_entries=int(os.getenv("CHUNK_CACHE_MAX", "4096")),
+    ttl_s=float(os.getenv("CHUNK_CACHE_TTL_S", str(24 * 3600))),
+)
+
+
+def _chunk_cache_key(collection_name: str, point_id) -> str:
+    return make_cache_key("chunk", collection_name, str(point_id))
+
+
+def cache_documents(documents: List[Document]) -> None:
+    """검색 결과 Document를 chunk 캐시에 저장합니다. (이후 hydration 시 Qdrant 호출 생략)"""
+    for document in documents:
+        metadata = document.metadata
+        if "_id" not in metadata or "_collection_name" not in metadata:
+            continue
+        _chunk_cache.set(
+            _chunk_cache_key(metadata["_collection_name"], metadata["_id"]),
+            document,
+        )
+
+
+def get_chunk_cache_stats() -> Dict:
+    return _chunk_cache.stats()
+
+
+def _with_score(document: Document, ref: RetrievedChunkRef) -> Document:
+    metadata = {**document.metadata}
+    if ref.score is not None:
+        metadata["_score"] = ref.score
+    else:
+        metadata.pop("_score", None)
+    return Document(page_content=document.page_content, metadata=metadata)
+
+
+def _lookup_cached(
+    refs: List[RetrievedChunkRef],
+) -> tuple[Dict[int, Document], Dict[str, List[int]]]:
+    """캐시 hit은 {ref index: Document}, miss는 {collection_name: [ref index]}로 분류합니다."""
+    hydrated: Dict[int, Document] = {}
+    missing: Dict[str, List[int]] = defaultdict(list)
+    for idx, ref in enumerate(refs):
+        document = _chunk_cache.get(_chunk_cache_key(ref.collection_name, ref.point_id))
+        if document is not None:
+            hydrated[idx] = document
+        else:
+            missing[ref.collection_name].append(idx)
+    return hydrated, missing
+
+
+def _merge_fetched(
+    refs: List[RetrievedChunkRef],
+    indices: List[int],
+    collection_name: str,
+    records,
+    hydrated: Dict[int, Document],
+) -> None:
+    documents = {
+        str(record.id): document_from_point(record, collection_name) for record in records
+    }
+    cache_documents(list(documents.values()))
+    for idx in indices:
+        document = documents.get(str(refs[idx].point_id))
+        if document is not None:  # 재적재 등으로 삭제된 point는 제외
+            hydrated[idx] = document
+
+
+def hydrate_chunk_refs(refs: List[RetrievedChunkRef]) -> List[Document]:
+    """
+    chunk 참조를 Document로 복원합니다. 입력 순서를 유지하며, 존재하지 않는 point는 제외합니다.
+
+    캐시 miss는 collection별로 묶어 Qdrant retrieve API 1회로 조회합니다.
+    """
+    hydrated, missing = _lookup_cached(refs)
+
+    if missing:
+        client = get_vector_db_client()
+        for collection_name, indices in missing.items():
+            records = client.retrieve(
+                collection_name=collection_name,
+                ids=[refs[idx].point_id for idx in indices],
+                with_payload=RETRIEVE_PAYLOAD_FIELDS,
+            )
+            _merge_fetched(refs, indices, collection_name, records, hydrated)
+
+    return [_with_score(hydrated[idx], refs[idx]) for idx in sorted(hydrated)]
+
+
+async def ahydrate_chunk_refs(refs: List[RetrievedChunkRef]) -> List[Document]:
+    """hydrate_chunk_refs의 비동기 버전"""
+    hydrated, missing = _lookup_cached(refs)
+
+    if missing:
+        client = get_async_vector_db_client()
+        for collection_name, indices in missing.items():
+            records = await client.retrieve(
+                collection_name=collection_name,
+                ids=[refs[idx].point_id for idx in indices],
+                with_payload=RETRIEVE_PAYLOAD_FIELDS,
+            )
+            _merge_fetched(refs, indices, collection_name, records, hydrated)
+
+    return [_with_score(hydrated[idx], refs[idx]) for idx in sorted(hydrated)]
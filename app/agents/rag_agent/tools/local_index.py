@@ -0,0 +1,310 @@
+"""
+로컬 벡터 검색 엔진 (numpy brute-force)
+
+Qdrant collection의 vector/payload를 디스크 스냅샷(.npy + payload JSON)으로 저장해 두고,
+- Qdrant 장애 시 retrieve의 대체 검색 경로 (RAG_LOCAL_INDEX_MODE=fallback, 기본)
+- point 수가 적은 collection의 빠른 검색 경로 (RAG_LOCAL_INDEX_MODE=local)
+로 사용한다.
+
+- vector는 L2 정규화 후 float32(기본)/float16 행렬로 저장하므로 내적이 곧 cosine 유사도
+    float16은 메모리가 1/2이지만 검색 시 block마다 float32로 변환하므로 단일 질의 지연 시간이 늘어난다.
+    (변환 비용은 search_batch로 여러 질의를 묶으면 상쇄됨, bench_local_index 참고)
+- 행렬은 np.load(mmap_mode="r")로 열어 필요한 block만 page cache로 읽음
+- 검색은 block 단위 행렬곱 + argpartition으로 top-k만 부분 정렬 (전체 argsort 대비 O(n))
+- 여러 질의를 (m, d) 행렬로 묶어 한 번의 행렬곱으로 검색 (search_batch)
+
+payload 필터는 retrieve에서 사용하는 형태(must + MatchAny/MatchValue)만 지원하며, 하이브리드 검색은 지원하지 않는다.
+
+실행 예시:
+    # Qdrant collection → 로컬 스냅샷 생성
+    uv run python -m app.agents.rag_agent.tools.local_index export
+    uv run python -m app.agents.rag_agent.tools.local_index export --dtype float16
+"""
+
+import argparse
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import grpc
+import numpy as np
+from qdrant_client import models
+from qdrant_client.http.exceptions import ResponseHandlingException
+from rich import print as rprint
+
+from app.agents.cache import CACHE_DIR
+from app.agents.document_parser.constants import COLLECTION_NAME
+
+LOCAL_INDEX_DIR = Path(os.getenv("RAG_LOCAL_INDEX_DIR", CACHE_DIR / "local_index"))
+
+# block 단위 행렬곱 크기 (float16 → float32 변환 시 임시 메모리 = SEARCH_BLOCK_ROWS * dim * 4 bytes)
+SEARCH_BLOCK_ROWS = int(os.getenv("RAG_LOCAL_INDEX_BLOCK_ROWS", "65536"))
+EXPORT_BATCH_SIZE = 256
+_MASK_CACHE_MAX = 64
+
+# Qdrant 서버에 연결할 수 없을 때 발생하는 예외 (REST: 연결 오류 래핑, gRPC: RpcError)
+QDRANT_UNAVAILABLE_ERRORS = (ResponseHandlingException, grpc.RpcError, ConnectionError)
+
+# collection 이름 → 로컬 스냅샷 (collection별로 1회만 mmap으로 엶)
+_global_local_indexes: Dict[str, "LocalVectorIndex"] = {}
+_local_index_lock = threading.Lock()
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def topk_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """행별 점수 상위 k개의 index를 점수 내림차순으로 반환합니다. (argpartition + k개만 정렬)"""
+    k = min(k, scores.shape[-1])
+    if k <= 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1)
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+def _get_path(payload: Dict[str, Any], key: str) -> Any:
+    value: Any = payload
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _condition_matches(payload: Dict[str, Any], condition) -> bool:
+    value = _get_path(payload, condition.key)
+    values = value if isinstance(value, list) else [value]
+    match = condition.match
+    if isinstance(match, models.MatchAny):
+        return any(item in match.any for item in values)
+    if isinstance(match, models.MatchValue):
+        return match.value in values
+    raise NotImplementedError(f"unsupported match for local index: {type(match).__name__}")
+
+
+def payload_matches(payload: Dict[str, Any], search_filter: models.Filter | None) -> bool:
+    if search_filter is None:
+        return True
+    return all(_condition_matches(payload, condition) for condition in search_filter.must or [])
+
+
+class LocalVectorIndex:
+    """
+    Args:
+        matrix: (n, d) L2 정규화된 vector 행렬 (np.memmap 가능)
+        ids: point id 목록 (행 순서)
+        payloads: point payload 목록 (행 순서)
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        ids: Sequence[Any],
+        payloads: Sequence[Dict[str, Any]] | None = None,
+    ):
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError(f"matrix shape {matrix.shape} does not match ids ({len(ids)})")
+        self.matrix = matrix
+        self.ids = list(ids)
+        self.payloads = list(payloads) if payloads is not None else [{} for _ in ids]
+        self._mask_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._mask_lock = threading.Lock()
+
+    @classmethod
+    def from_vectors(
+        cls,
+        vectors: np.ndarray,
+        ids: Sequence[Any],
+        payloads: Sequence[Dict[str, Any]] | None = None,
+        dtype: str = "float32",
+    ) -> "LocalVectorIndex":
+        return cls(normalize_rows(vectors).astype(dtype), ids, payloads)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes
+
+    def _filter_mask(self, search_filter: models.Filter | None) -> np.ndarray | None:
+        """필터를 만족하는 행 mask (필터별로 캐시)"""
+        if search_filter is None:
+            return None
+        cache_key = search_filter.model_dump_json()
+        with self._mask_lock:
+            mask = self._mask_cache.get(cache_key)
+            if mask is not None:
+                self._mask_cache.move_to_end(cache_key)
+                return mask
+        mask = np.fromiter(
+            (payload_matches(payload, search_filter) for payload in self.payloads),
+            dtype=bool,
+            count=len(self.payloads),
+        )
+        with self._mask_lock:
+            self._mask_cache[cache_key] = mask
+            while len(self._mask_cache) > _MASK_CACHE_MAX:
+                self._mask_cache.popitem(last=False)
+        return mask
+
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        k: int,
+        search_filter: models.Filter | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (m, d) 질의 행렬의 행별 top-k (index, score)를 반환합니다.
+
+        행렬을 SEARCH_BLOCK_ROWS 단위로 나눠 block별 top-k 후보만 남긴 뒤 병합하므로,
+        mmap 행렬도 전체를 메모리에 올리지 않고 검색합니다. 필터에 맞는 행이 k개보다 적으면
+        결과의 나머지 자리는 index -1, score -inf입니다.
+        """
+        queries = normalize_rows(np.atleast_2d(queries))
+        mask = self._filter_mask(search_filter)
+        candidate_indices, candidate_scores = [], []
+        for start in range(0, len(self), SEARCH_BLOCK_ROWS):
+            block = np.asarray(self.matrix[start : start + SEARCH_BLOCK_ROWS], dtype=np.float32)
+            scores = queries @ block.T  # (m, block_rows)
+            if mask is not None:
+                scores[:, ~mask[start : start + len(block)]] = -np.inf
+            block_top = topk_indices(scores, k)
+            candidate_indices.append(block_top + start)
+            candidate_scores.append(np.take_along_axis(scores, block_top, axis=-1))
+
+        if not candidate_indices:
+            empty = np.empty((len(queries), 0))
+            return empty.astype(np.int64), empty
+        indices = np.concatenate(candidate_indices, axis=-1)
+        scores = np.concatenate(candidate_scores, axis=-1)
+        top = topk_indices(scores, k)
+        indices = np.take_along_axis(indices, top, axis=-1)
+        scores = np.take_along_axis(scores, top, axis=-1)
+        indices[np.isneginf(scores)] = -1
+        return indices, scores
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        search_filter: models.Filter | None = None,
+    ) -> List[models.ScoredPoint]:
+        """단일 질의 검색 결과를 Qdrant ScoredPoint 형태로 반환합니다. (document_from_point 호환)"""
+        indices, scores = self.search_batch(np.asarray(query, dtype=np.float32), k, search_filter)
+        return [
+            models.ScoredPoint(
+                id=self.ids[index],
+                version=0,
+                score=float(score),
+                payload=self.payloads[index],
+            )
+            for index, score in zip(indices[0], scores[0])
+            if index >= 0
+        ]
+
+    def save(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "vectors.npy", np.asarray(self.matrix))
+        (path / "points.json").write_text(
+            json.dumps({"ids": self.ids, "payloads": self.payloads}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> "LocalVectorIndex":
+        matrix = np.load(path / "vectors.npy", mmap_mode="r" if mmap else None)
+        points = json.loads((path / "points.json").read_text(encoding="utf-8"))
+        return cls(matrix, points["ids"], points["payloads"])
+
+
+def local_index_path(collection_name: str = COLLECTION_NAME) -> Path:
+    return LOCAL_INDEX_DIR / collection_name
+
+
+def get_local_index_mode() -> str:
+    """off | fallback (Qdrant 장애 시, 기본) | local (항상 로컬 스냅샷 사용)"""
+    return os.getenv("RAG_LOCAL_INDEX_MODE", "fallback")
+
+
+def get_local_index(collection_name: str = COLLECTION_NAME) -> LocalVectorIndex | None:
+    """collection의 로컬 스냅샷을 최초 호출 시 1회 mmap으로 엽니다. 스냅샷이 없으면 None을 반환합니다."""
+    local_index = _global_local_indexes.get(collection_name)
+    if local_index is not None:
+        return local_index
+
+    path = local_index_path(collection_name)
+    if not (path / "vectors.npy").exists():
+        return None
+    with _local_index_lock:
+        local_index = _global_local_indexes.get(collection_name)
+        if local_index is None:
+            local_index = LocalVectorIndex.load(path)
+            _global_local_indexes[collection_name] = local_index
+            rprint(
+                f"✅load local vector index: {path} "
+                f"({len(local_index)} points, {local_index.matrix.dtype})"
+            )
+    return local_index
+
+
+def export_local_index(
+    collection_name: str,
+    payload_fields: Sequence[str] | bool = True,
+    dtype: str = "float32",
+) -> Path:
+    """Qdrant collection의 vector/payload를 로컬 스냅샷으로 저장합니다."""
+    from app.agents.document_parser.nodes.vector_store import get_vector_db_client
+
+    client = get_vector_db_client()
+    vectors, ids, payloads = [], [], []
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=EXPORT_BATCH_SIZE,
+            offset=offset,
+            with_vectors=True,
+            with_payload=payload_fields,
+        )
+        for point in points:
+            # hybrid collection은 {"": dense, "bm25": sparse} 형태이므로 dense vector만 사용
+            vector = point.vector.get("") if isinstance(point.vector, dict) else point.vector
+            vectors.append(vector)
+            ids.append(point.id)
+            payloads.append(point.payload or {})
+        if offset is None:
+            break
+
+    path = local_index_path(collection_name)
+    LocalVectorIndex.from_vectors(np.asarray(vectors), ids, payloads, dtype=dtype).save(path)
+    rprint(f"✅export local vector index: {path} ({len(ids)} points, {dtype})")
+    return path
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Local vector index (Qdrant snapshot).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Qdrant collection → 로컬 스냅샷")
+    export_parser.add_argument("--collection", default=COLLECTION_NAME)
+    export_parser.add_argument("--dtype", choices=["float32", "float16"], default="float32")
+    return parser
+
+
+def main():
+    from app.agents.rag_agent.tools.retrieve import RETRIEVE_PAYLOAD_FIELDS
+
+    args = create_arg_parser().parse_args()
+    if args.command == "export":
+        export_local_index(args.collection, RETRIEVE_PAYLOAD_FIELDS, dtype=args.dtype)
+
+
+if __name__ == "__main__":
+    main()
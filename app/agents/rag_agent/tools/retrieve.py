@@ -1,4 +1,10 @@
+import asyncio
+import os
+from typing import Any, Dict, List
+
+from langchain_core.documents import Document
 from langchain_core.tools import tool
+from qdrant_client import models
 
 from rich import print as rprint
 
@@ -6,12 +12,209 @@ from rich import print as rprint
 from app.agents.rag_agent.state.rag_state import RagState, RetrieveToolInput
 
 from app.agents.document_parser.constants import COLLECTION_NAME
-from app.agents.document_parser.nodes.embeddings import load_underlying_embeddings
-from app.agents.document_parser.nodes.vector_store import setup_vector_store
+from app.agents.document_parser.nodes.collection_profile import get_collection_profile
+from app.agents.document_parser.nodes.sparse_embeddings import load_sparse_embeddings
+from app.agents.document_parser.nodes.vector_store import (
+    SPARSE_VECTOR_NAME,
+    acollection_exists_cached,
+    acollection_has_sparse_vector,
+    collection_exists_cached,
+    collection_has_sparse_vector,
+    document_from_point,
+    get_async_vector_db_client,
+    get_vector_db_client,
+)
+from app.agents.rag_agent.tools.local_index import (
+    QDRANT_UNAVAILABLE_ERRORS,
+    get_local_index,
+    get_local_index_mode,
+)
+from app.agents.rag_agent.tools.search_filter import (
+    build_search_filters,
+    is_filtered_search_enabled,
+)
+
+TOP_K = 3
+# hybrid 검색 시 dense/sparse 각각 RRF fusion 전에 가져올 후보 수 = TOP_K * HYBRID_PREFETCH_MULTIPLIER
+HYBRID_PREFETCH_MULTIPLIER = int(os.getenv("RAG_HYBRID_PREFETCH_MULTIPLIER", "4"))
+
+# 검색 결과로 받아올 payload 필드 (source, anchor_ids 등 downstream에서 쓰지 않는 필드 제외)
+# - page_content: judge 검증 입력
+# - metadata.doc / clause / term_type: 상품 식별, 필터링
+# - metadata.indexing.chunk_id: recommendation_history 참조(RetrievedChunkRef)
+RETRIEVE_PAYLOAD_FIELDS = [
+    "page_content",
+    "metadata.doc.file_name",
+    "metadata.doc.insurer_code",
+    "metadata.doc.product_code",
+    "metadata.doc.product_name",
+    "metadata.doc.page",
+    "metadata.term_type",
+    "metadata.clause",
+    "metadata.indexing.chunk_id",
+]
+
+
+def _search_filters(state: RagState) -> List[models.Filter | None]:
+    # rag_graph에서는 VetAgentState 필드(preferred_insurers, diseases 등)를 함께 가진 state가 전달됨
+    if not is_filtered_search_enabled() or not hasattr(state, "preferred_insurers"):
+        return [None]
+    return build_search_filters(state)
+
+
+def _hybrid_requested(state: RagState) -> bool:
+    # sparse 질의는 user_query 문장으로 만들므로 문장이 없으면 dense 검색
+    return os.getenv("RAG_RETRIEVAL_MODE", "dense") == "hybrid" and bool(state.user_query)
+
+
+def _query_kwargs(
+    state: RagState,
+    sparse_query: models.SparseVector | None,
+    search_filter: models.Filter | None,
+    search_params: models.SearchParams | None,
+) -> Dict[str, Any]:
+    """
+    query_points 인자를 생성합니다.
+
+    - dense: user_query_embedding으로 검색
+    - hybrid: dense / BM25 sparse prefetch 결과를 1회 요청 안에서 RRF로 결합
+        sparse 질의는 로컬 토큰화로 만들어지므로 추가 임베딩 API 호출이 없다.
+    """
+    if sparse_query is None:
+        return {
+            "query": state.user_query_embedding,
+            "query_filter": search_filter,
+            "search_params": search_params,
+        }
+    prefetch_limit = TOP_K * HYBRID_PREFETCH_MULTIPLIER
+    return {
+        "prefetch": [
+            models.Prefetch(
+                query=state.user_query_embedding,
+                filter=search_filter,
+                params=search_params,
+                limit=prefetch_limit,
+            ),
+            models.Prefetch(
+                query=sparse_query,
+                using=SPARSE_VECTOR_NAME,
+                filter=search_filter,
+                limit=prefetch_limit,
+            ),
+        ],
+        "query": models.FusionQuery(fusion=models.Fusion.RRF),
+    }
+
+
+def _sparse_query(state: RagState) -> models.SparseVector:
+    sparse_vector = load_sparse_embeddings().embed_query(state.user_query)
+    return models.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values)
+
+
+def _merge_points(documents: List[Document], points) -> None:
+    """이미 찾은 point를 제외하고 TOP_K개까지 documents를 채웁니다."""
+    seen = {document.metadata["_id"] for document in documents}
+    for point in points:
+        if len(documents) >= TOP_K:
+            break
+        if point.id not in seen:
+            documents.append(document_from_point(point, COLLECTION_NAME))
+
+
+def _local_retrieve(state: RagState) -> List[Document] | None:
+    """로컬 스냅샷(local_index)으로 검색합니다. 스냅샷이 없으면 None을 반환합니다."""
+    local_index = get_local_index(COLLECTION_NAME)
+    if local_index is None:
+        return None
+    search_result: List[Document] = []
+    for search_filter in _search_filters(state):
+        _merge_points(
+            search_result, local_index.search(state.user_query_embedding, TOP_K, search_filter)
+        )
+        if len(search_result) >= TOP_K:
+            break
+    return search_result
+
+
+def _qdrant_retrieve(state: RagState) -> List[Document]:
+    if not collection_exists_cached(COLLECTION_NAME):
+        rprint("⚠️collection not found:", COLLECTION_NAME)
+        return []
+
+    client = get_vector_db_client()
+    # quantization rescoring/oversampling, hnsw_ef (collection 프로파일과 같은 설정 사용)
+    search_params = get_collection_profile().search_params()
+    sparse_query = (
+        _sparse_query(state)
+        if _hybrid_requested(state) and collection_has_sparse_vector(COLLECTION_NAME)
+        else None
+    )
+    search_result: List[Document] = []
+    for search_filter in _search_filters(state):
+        response = client.query_points(
+            collection_name=COLLECTION_NAME,
+            **_query_kwargs(state, sparse_query, search_filter, search_params),
+            limit=TOP_K,
+            with_payload=RETRIEVE_PAYLOAD_FIELDS,
+        )
+        _merge_points(search_result, response.points)
+        if len(search_result) >= TOP_K:
+            break
+    return search_result
+
+
+async def _aqdrant_retrieve(state: RagState) -> List[Document]:
+    if not await acollection_exists_cached(COLLECTION_NAME):
+        rprint("⚠️collection not found:", COLLECTION_NAME)
+        return []
+
+    client = get_async_vector_db_client()
+    # quantization rescoring/oversampling, hnsw_ef (collection 프로파일과 같은 설정 사용)
+    search_params = get_collection_profile().search_params()
+    sparse_query = (
+        _sparse_query(state)
+        if _hybrid_requested(state) and await acollection_has_sparse_vector(COLLECTION_NAME)
+        else None
+    )
+    search_result: List[Document] = []
+    for search_filter in _search_filters(state):
+        response = await client.query_points(
+            collection_name=COLLECTION_NAME,
+            **_query_kwargs(state, sparse_query, search_filter, search_params),
+            limit=TOP_K,
+            with_payload=RETRIEVE_PAYLOAD_FIELDS,
+        )
+        _merge_points(search_result, response.points)
+        if len(search_result) >= TOP_K:
+            break
+    return search_result
+
+
+def _fallback_to_local(state: RagState, error: Exception) -> List[Document]:
+    if get_local_index_mode() == "off":
+        raise error
+    rprint(f"⚠️qdrant unavailable ({type(error).__name__}), fallback to local index")
+    search_result = _local_retrieve(state)
+    if search_result is None:
+        raise error
+    return search_result
 
 
 def retrieve(state: RagState) -> RagState:
     """
+    QdrantClient.query_points로 user_query_embedding과 유사한 chunk를 검색합니다.
+
+    QdrantVectorStore 경로(매 호출 collection_exists 왕복 + wrapper 생성 + 전체 payload 수신) 대신
+    collection 존재 여부를 캐시하고 필요한 payload 필드만 받아옵니다.
+
+    선호 보험사/조항 유형/위험 영역 payload 필터를 Qdrant에 전달하고,
+    결과가 TOP_K보다 적으면 필터를 단계적으로 완화해 나머지를 채웁니다. (search_filter 참고)
+
+    RAG_RETRIEVAL_MODE=hybrid이면 dense + BM25 sparse 검색을 RRF로 결합합니다. (_query_kwargs 참고)
+
+    Qdrant에 연결할 수 없으면 로컬 스냅샷(local_index)으로 dense 검색하고,
+    RAG_LOCAL_INDEX_MODE=local이면 Qdrant 없이 항상 로컬 스냅샷을 사용합니다.
+
     tool 사용 시
 
     ```python
@@ -24,15 +227,31 @@ def retrieve(state: RagState) -> RagState:
     """
     # rprint("retrieve input state", state)
 
-    underlying_embeddings = load_underlying_embeddings()
+    if get_local_index_mode() == "local":
+        search_result = _local_retrieve(state)
+        if search_result is not None:
+            return {"retrieved_documents": search_result}
 
-    vector_store = setup_vector_store(
-        underlying_embeddings=underlying_embeddings, collection_name=COLLECTION_NAME
-    )
-
-    search_result = vector_store.similarity_search_by_vector(
-        state.user_query_embedding, k=3
-    )
+    try:
+        search_result = _qdrant_retrieve(state)
+    except QDRANT_UNAVAILABLE_ERRORS as e:
+        search_result = _fallback_to_local(state, e)
     # rprint(">>> search_result", [document.page_content for document in search_result])
 
     return {"retrieved_documents": search_result}
+
+
+async def aretrieve(state: RagState) -> RagState:
+    """retrieve의 비동기 버전. AsyncQdrantClient로 직접 검색합니다."""
+    # 로컬 검색은 CPU 연산(행렬곱)이므로 event loop를 막지 않도록 thread에서 실행
+    if get_local_index_mode() == "local":
+        search_result = await asyncio.to_thread(_local_retrieve, state)
+        if search_result is not None:
+            return {"retrieved_documents": search_result}
+
+    try:
+        search_result = await _aqdrant_retrieve(state)
+    except QDRANT_UNAVAILABLE_ERRORS as e:
+        search_result = await asyncio.to_thread(_fallback_to_local, state, e)
+
+    return {"retrieved_documents": search_result}
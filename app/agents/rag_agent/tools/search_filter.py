@@ -0,0 +1,129 @@
+"""
+검색 payload 필터 생성
+
+사용자 입력(선호 보험사, 건강 상태)과 수의사 진단 결과(질병)를 Qdrant payload 필터로 변환한다.
+필터 대상 필드는 적재 시 payload index가 생성된다. (`vector_store.PAYLOAD_INDEX_FIELDS`)
+
+필터가 너무 좁아 결과가 top-k보다 적으면 아래 순서로 조건을 하나씩 완화한다.
+    보험사 + 조항 유형 + 위험 영역 → 보험사 + 조항 유형 → 보험사 → 필터 없음
+"""
+
+import os
+import re
+from typing import Iterable, List, Tuple
+
+from qdrant_client import models
+
+from app.agents.vet_agent.diagnosis_table import (
+    load_diagnosis_table,
+    profile_key_from_state,
+)
+from app.agents.vet_agent.state import VetAgentState
+
+INSURER_CODE_FIELD = "metadata.doc.insurer_code"
+CLAUSE_TYPE_FIELD = "metadata.clause.clause_type"
+RISK_DOMAINS_FIELD = "metadata.clause.risk_domains"
+
+# 질병 추천 근거로 사용할 조항 유형 (tagger.CLAUSE_TYPES 중 보장/면책)
+FILTER_CLAUSE_TYPES = [
+    clause_type.strip()
+    for clause_type in os.getenv("RAG_FILTER_CLAUSE_TYPES", "coverage,exclusion").split(",")
+    if clause_type.strip()
+]
+
+# 질병명/건강 상태 → 위험 영역 (tagger.RISK_DOMAINS와 같은 라벨)
+# tagger의 RISK_DOMAIN_RULES는 약관 본문용이라 "심장"이 digestive("장")로 매칭되는 등
+# 질병명에는 맞지 않으므로 질병명 기준 규칙을 별도로 둔다.
+DISEASE_RISK_DOMAIN_RULES: List[Tuple[str, str]] = [
+    (r"(뇌|두부|머리|경련|발작|신경|디스크|척추|수두증)", "head"),
+    (r"(치아|치주|치석|치은|구강|잇몸|스케일링)", "dental"),
+    (r"(피부|습진|알레르기|아토피|가려움|외이염|귀|모낭|탈모)", "skin"),
+    (r"(관절|슬개골|탈구|고관절|십자인대|골절|뼈|다리)", "joint"),
+    (r"(비뇨|방광|요로|신장|신부전|결석|전립선)", "urinary"),
+    (r"(눈|각막|백내장|녹내장|망막|안구|결막)", "eye"),
+    (r"(소화|위염|장염|구토|설사|췌장|간염|간\s*질환|간부전|담낭|식도)", "digestive"),
+]
+
+
+def is_filtered_search_enabled() -> bool:
+    return os.getenv("RAG_FILTERED_SEARCH", "1") == "1"
+
+
+def map_risk_domains(texts: Iterable[str | None]) -> List[str]:
+    """질병명/건강 상태 텍스트를 위험 영역 목록으로 변환합니다. (입력 순서 유지, 중복 제거)"""
+    domains: List[str] = []
+    for text in texts:
+        if not text:
+            continue
+        for pattern, domain in DISEASE_RISK_DOMAIN_RULES:
+            if domain not in domains and re.search(pattern, text):
+                domains.append(domain)
+    return domains
+
+
+def _disease_names(state: VetAgentState) -> List[str]:
+    """
+    진단된 질병명을 반환합니다.
+
+    RAG는 vet_diagnosis와 병렬 실행되므로 state.diseases가 비어 있으면
+    품종별 사전 계산 테이블(LLM 호출 없음)에서 조회합니다.
+    """
+    if state.diseases:
+        return [disease.name for disease in state.diseases]
+    entry = load_diagnosis_table()["entries"].get(profile_key_from_state(state)) or []
+    return [disease["name"] for disease in entry]
+
+
+def _health_condition_texts(state: VetAgentState) -> List[str | None]:
+    condition = state.health_condition
+    if condition is None:
+        return []
+    return [condition.frequent_illness_area, condition.disease_surgery_history]
+
+
+def build_search_filters(state: VetAgentState) -> List[models.Filter | None]:
+    """
+    엄격한 조건부터 완화된 조건 순서의 필터 목록을 반환합니다. 마지막은 항상 None(필터 없음)입니다.
+
+    - 보험사: preferred_insurers (Insurer enum name이 약관 파일명의 insurer_code와 같음)
+    - 조항 유형: FILTER_CLAUSE_TYPES
+    - 위험 영역: 진단 질병 + 건강 상태에서 매핑한 risk_domains
+    """
+    insurer_codes = [insurer.name for insurer in state.preferred_insurers or []]
+    risk_domains = map_risk_domains(
+        [*_disease_names(state), *_health_condition_texts(state)]
+    )
+
+    insurer_condition = (
+        [models.FieldCondition(key=INSURER_CODE_FIELD, match=models.MatchAny(any=insurer_codes))]
+        if insurer_codes
+        else []
+    )
+    clause_condition = (
+        [
+            models.FieldCondition(
+                key=CLAUSE_TYPE_FIELD, match=models.MatchAny(any=FILTER_CLAUSE_TYPES)
+            )
+        ]
+        if FILTER_CLAUSE_TYPES
+        else []
+    )
+    risk_condition = (
+        [models.FieldCondition(key=RISK_DOMAINS_FIELD, match=models.MatchAny(any=risk_domains))]
+        if risk_domains
+        else []
+    )
+
+    filters: List[models.Filter | None] = []
+    for conditions in (
+        insurer_condition + clause_condition + risk_condition,
+        insurer_condition + clause_condition,
+        insurer_condition,
+    ):
+        if not conditions:
+            continue
+        search_filter = models.Filter(must=conditions)
+        if search_filter not in filters:
+            filters.append(search_filter)
+    filters.append(None)
+    return filters
@@ -1,17 +1,24 @@
 import numpy as np
 from typing import List, Dict, Any
-from query_emb import embed_texts, qvec
 from tc_emb import chunk_texts, chunk_metas, embeddings
 
 def cosine_topk(query_vec: np.ndarray, doc_vecs: np.ndarray, top_k: int = 3):
+    # doc_vecs(임베딩 저장소)는 저장할 때 이미 L2 정규화되어 있으므로, 질문 벡터만 정규화하면 내적이 cosine 유사도입니다.
+    # (질문마다 doc_vecs 전체를 정규화하면 mmap 행렬 전체가 복사됩니다.)
+    query_vec = query_vec / max(np.linalg.norm(query_vec), 1e-12)
     scores = doc_vecs @ query_vec
 
-    # 점수가 큰 순서대로 top_k개의 인덱스를 구하세요. np.argsort는 오름차순이므로 내림차순이 되게 조정해야 합니다.
-    top_idx = np.argsort(-scores)[:top_k]
+    # 전체 정렬(np.argsort) 대신 argpartition으로 top_k개만 고른 뒤, 그 k개만 내림차순 정렬합니다.
+    top_k = min(top_k, len(scores))
+    top_idx = np.argpartition(-scores, top_k - 1)[:top_k]
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
     return [(int(i), float(scores[i])) for i in top_idx]
 
 def retrieve_manual(query: str, top_k: int) -> List[Dict[str, Any]]:
-    #qvec = np.array(embed_texts([query])[0], dtype=np.float32) # 사용자 질문에 대한 임베딩 벡터 생성    
+    # 임베딩 저장소가 최신이면 cos_top import 시 네트워크 I/O가 없도록 임베딩 client는 검색할 때 import합니다.
+    from query_emb import embed_texts
+
+    qvec = np.array(embed_texts([query])[0], dtype=np.float32) # 사용자 질문에 대한 임베딩 벡터 생성
     # 위의 cosine_topk를 활용하여 top 결과를 받으세요.
     top = cosine_topk(qvec, embeddings, top_k=top_k)
     # 만들어둔 문서 텍스트 청크의 임베딩과의 유사도 점수 계산 후 top_k 개의 문서 텍스트 청크 인덱스와 점수 반환
@@ -0,0 +1,107 @@
+# 청크 임베딩 저장소 (.npy 행렬 + 메타데이터 병렬 배열)
+# - embeddings.npy: (N, D) float32 행렬, np.load(mmap_mode="r")로 복사 없이 로드
+#   행은 L2 정규화해서 저장하므로 (meta["normalized"]) 검색 시 질문 벡터와의 내적이 곧 cosine 유사도입니다.
+# - meta.json: 행 순서와 같은 병렬 배열 (hashes, ids, pages, texts) + 원본 PDF fingerprint
+# - 청크 텍스트의 sha256 hash를 key로 사용하므로, 재실행 시 바뀐 청크만 다시 임베딩합니다.
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+STORE_DIR = Path(__file__).parent / ".emb_store"
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(path: Path) -> Dict[str, int]:
+    # PDF 내용을 다시 읽지 않도록 크기 + 수정 시각으로 변경 여부를 판단합니다.
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+
+
+def load_store(store_dir: Path):
+    """(embeddings mmap 행렬, meta dict)를 반환합니다. 저장소가 없으면 (None, None)"""
+    if not (store_dir / "embeddings.npy").exists() or not (store_dir / "meta.json").exists():
+        return None, None
+    embeddings = np.load(store_dir / "embeddings.npy", mmap_mode="r")
+    meta = json.loads((store_dir / "meta.json").read_text(encoding="utf-8"))
+    return embeddings, meta
+
+
+def _write_store(store_dir: Path, embeddings: np.ndarray, meta: Dict[str, Any]) -> None:
+    # 임시 파일에 쓴 뒤 교체하여, 중간에 실패해도 기존 저장소가 깨지지 않게 합니다.
+    store_dir.mkdir(parents=True, exist_ok=True)
+    tmp_npy = store_dir / "embeddings.tmp.npy"
+    tmp_meta = store_dir / "meta.tmp.json"
+    np.save(tmp_npy, embeddings)
+    tmp_meta.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_npy, store_dir / "embeddings.npy")
+    os.replace(tmp_meta, store_dir / "meta.json")
+
+
+def update_store(
+    store_dir: Path,
+    chunks: List[Dict[str, Any]],
+    embed_texts: Callable[[List[str]], List[List[float]]],
+    source: Dict[str, Any] | None = None,
+    batch_size: int = 64,
+):
+    """
+    chunks(id, page, text)의 임베딩 저장소를 갱신하고 (embeddings mmap 행렬, meta)를 반환합니다.
+
+    기존 저장소에 같은 텍스트 hash가 있으면 그 행을 재사용하고, 새로 생기거나 바뀐 청크만 임베딩합니다.
+    """
+    old_embeddings, old_meta = load_store(store_dir)
+    old_rows = {h: i for i, h in enumerate(old_meta["hashes"])} if old_meta else {}
+    # 정규화 전 형식의 저장소는 재사용하는 행도 정규화합니다.
+    old_normalized = bool(old_meta and old_meta.get("normalized"))
+
+    hashes = [text_hash(c["text"]) for c in chunks]
+    missing = [i for i, h in enumerate(hashes) if h not in old_rows]
+    # 같은 텍스트의 청크가 여러 개면 한 번만 임베딩합니다.
+    missing_texts = {hashes[i]: chunks[i]["text"] for i in missing}
+    print(f"embedding store: reuse {len(chunks) - len(missing)} / embed {len(missing_texts)} chunks")
+
+    new_vectors: Dict[str, np.ndarray] = {}
+    items = list(missing_texts.items())
+    for start in range(0, len(items), batch_size):
+        batch = items[start : start + batch_size]
+        vectors = embed_texts([text for _, text in batch])
+        for (h, _), vector in zip(batch, vectors):
+            new_vectors[h] = normalize_rows(vector)
+
+    if not chunks:
+        embeddings = np.empty((0, 0), dtype=np.float32)
+    else:
+        dim = old_embeddings.shape[1] if old_embeddings is not None else len(next(iter(new_vectors.values())))
+        embeddings = np.empty((len(chunks), dim), dtype=np.float32)
+        for i, h in enumerate(hashes):
+            if h not in old_rows:
+                embeddings[i] = new_vectors[h]
+            elif old_normalized:
+                embeddings[i] = old_embeddings[old_rows[h]]
+            else:
+                embeddings[i] = normalize_rows(old_embeddings[old_rows[h]])
+
+    meta = {
+        "source": source,
+        "normalized": True,
+        "hashes": hashes,
+        "ids": [c["id"] for c in chunks],
+        "pages": [c.get("page") for c in chunks],
+        "texts": [c["text"] for c in chunks],
+    }
+    # 기존 mmap 파일을 덮어쓰기 전에 참조를 해제합니다. (Windows에서 파일 교체 실패 방지)
+    del old_embeddings
+    _write_store(store_dir, embeddings, meta)
+    return load_store(store_dir)
@@ -3,7 +3,7 @@ from typing import List, Dict, Any
 import math
 from collections import defaultdict
 from qdrant_client import QdrantClient
-from qdrant_client.models import VectorParams, Distance, SparseVectorParams
+from qdrant_client.models import SparseVector, SparseVectorParams
 
 # import pre-split chunks (assumes tc_chunk.py creates `chunks` list)
 from tc_chunk import chunks
@@ -48,14 +48,14 @@ def create_collection(name: str):
         client.delete_collection(collection_name=name)
     except Exception:
         pass
-    # create minimal collection with sparse vector config
+    # create sparse-only collection (named sparse vector "sparse", no dense vectors)
     client.create_collection(
         collection_name=name,
-        vectors_config=VectorParams(size=1, distance=Distance.COSINE),
+        vectors_config={},
         sparse_vectors_config={"sparse": SparseVectorParams()},
     )
 
-# upload points: store sparse indices/values in payload and use dummy dense vector
+# upload points: store tf-idf as a named sparse vector so it is searchable
 def upload(name: str, chunks: List[Dict[str, Any]], sparse_vectors: Dict[str, List[tuple]]):
     points = []
     for idx, chunk in enumerate(chunks, start=1):
@@ -65,13 +65,11 @@ def upload(name: str, chunks: List[Dict[str, Any]], sparse_vectors: Dict[str, Li
         points.append(
             {
                 "id": idx,
-                "vector": [0.0],  # dummy dense vector so collection accepts point
+                "vector": {"sparse": SparseVector(indices=indices, values=values)},
                 "payload": {
                     "chunk_id": chunk["id"],
                     "page": chunk.get("page"),
                     "text": chunk.get("text"),
-                    "sparse_indices": indices,
-                    "sparse_values": values,
                 },
             }
         )
@@ -1,11 +1,28 @@
-from tc_chunk import chunks
-from query_emb import embed_texts
-import numpy as np
+import os
+from pathlib import Path
 
-chunk_texts = [c["text"] for c in chunks] # 이전에 만든 청크들을 불러옵니다.
-chunk_metas = [{"id": c["id"], "page": c["page"]} for c in chunks] # 각 청크의 메타 데이터(아이디, 페이지 번호)를 불러옵니다.
+from emb_store import STORE_DIR, file_fingerprint, load_store, update_store
 
-#위에서 만든 임베딩 함수를 이용하여, pdf 문서를 청킹해서 만든 각각의 텍스트 청크에 대한 임베딩 수행합니다.
-embeddings = embed_texts(chunk_texts)
-embeddings = np.array(embeddings, dtype=np.float32)
-# print("embeddings shape:", embeddings.shape)
\ No newline at end of file
+# 청크 임베딩은 .emb_store/<pdf 이름>/ 에 저장해 두고 재사용합니다.
+# - PDF가 바뀌지 않았으면 PDF 파싱/임베딩 API 호출 없이 mmap으로 바로 로드합니다.
+# - PDF가 바뀌었거나 GS_EMB_REFRESH=1 이면 다시 청킹한 뒤, 바뀐 청크만 임베딩합니다.
+#   (tc_chunk.py의 CHUNK_SIZE/CHUNK_OVERLAP을 바꾼 경우 GS_EMB_REFRESH=1로 실행)
+PDF_PATH = Path(__file__).parent / "meritz.pdf"
+STORE_PATH = STORE_DIR / PDF_PATH.stem
+
+embeddings, meta = load_store(STORE_PATH)
+if (
+    meta is None
+    or meta["source"] != file_fingerprint(PDF_PATH)
+    or not meta.get("normalized") # 정규화 전 형식의 저장소 (기존 임베딩을 재사용하여 1회 변환)
+    or os.getenv("GS_EMB_REFRESH") == "1"
+):
+    from tc_chunk import chunks # 이전에 만든 청크들을 불러옵니다.
+    from query_emb import embed_texts
+
+    #위에서 만든 임베딩 함수를 이용하여, pdf 문서를 청킹해서 만든 각각의 텍스트 청크 중 바뀐 청크만 임베딩합니다.
+    embeddings, meta = update_store(STORE_PATH, chunks, embed_texts, source=file_fingerprint(PDF_PATH))
+
+chunk_texts = meta["texts"] # 각 청크의 텍스트
+chunk_metas = [{"id": i, "page": p} for i, p in zip(meta["ids"], meta["pages"])] # 각 청크의 메타 데이터(아이디, 페이지 번호)
+# print("embeddings shape:", embeddings.shape)
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 import io
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PIL import Image as PILImage
-
-from langgraph.graph.state import CompiledStateGraph
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
 
 
 def get_current_file_name(
@@ -28,6 +30,9 @@ def create_graph_image(
     file_name: str,
     base_dir: str = None,
 ):
+    # PIL과 mermaid 렌더링은 이미지 생성 시에만 필요하므로 지연 import
+    from PIL import Image as PILImage
+
     png_data = graph.get_graph().draw_mermaid_png()
 
     img = PILImage.open(
@@ -0,0 +1,334 @@
+"""
+품종별 취약 질병 사전 계산 테이블 + memoization
+
+취약 질병 분석 결과는 (종, 품종, 연령대, 성별, 중성화 여부)에 거의 전적으로 의존하므로
+- offline: data/breeds.yaml의 모든 품종 × 연령대 × 성별 × 중성화 조합을 LLM으로 미리 계산해
+  data/breed_disease_table.json에 저장하고,
+- online: vet_diagnosis_node에서 테이블 → 프로세스 내 memo 순서로 조회한 뒤 miss일 때만 LLM을 호출한다.
+
+건강 상태(health_condition)가 입력된 경우는 개인화된 결과이므로 테이블을 사용하지 않고 memo만 사용한다.
+
+실행 예시:
+    # 사전 계산 (기존 테이블에 있는 조합은 건너뜀)
+    uv run python -m app.agents.vet_agent.diagnosis_table precompute --concurrency 8
+    # 샘플 입력 기준 테이블 hit rate 및 LLM 지연 시간 절감량 리포트
+    uv run python -m app.agents.vet_agent.diagnosis_table report
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.cache import LRUCache, make_cache_key
+from app.agents.vet_agent.state import DiseaseInfo, VetAgentOutputState, VetAgentState
+
+DATA_DIR = Path(__file__).parent / "data"
+BREEDS_PATH = DATA_DIR / "breeds.yaml"
+TABLE_PATH = Path(os.getenv("VET_DISEASE_TABLE_PATH", DATA_DIR / "breed_disease_table.json"))
+
+# (연령대 이름, 최소 나이, 최대 나이, 사전 계산 시 사용할 대표 나이)
+AGE_BUCKETS = (
+    ("junior", 0, 1, 1),
+    ("adult", 2, 6, 4),
+    ("senior", 7, 10, 8),
+    ("geriatric", 11, None, 12),
+)
+GENDERS = ("male", "female")
+NEUTERED = (True, False)
+
+_table: Dict[str, Any] | None = None
+_table_lock = threading.Lock()
+
+# 테이블 miss 후 LLM 결과 memoization: profile key → diseases(dict 목록)
+_diagnosis_memo = LRUCache(
+    max_entries=int(os.getenv("VET_DIAGNOSIS_MEMO_MAX", "2048")),
+    ttl_s=float(os.getenv("VET_DIAGNOSIS_MEMO_TTL_S", str(7 * 24 * 3600))),
+)
+
+_stats_lock = threading.Lock()
+_stats = {"table_hits": 0, "memo_hits": 0, "misses": 0, "llm_latency_s": 0.0}
+
+
+def _normalize_text(text: str | None) -> str:
+    text = unicodedata.normalize("NFC", text or "")
+    return re.sub(r"\s+", "", text)
+
+
+def age_bucket(age: int | None) -> str | None:
+    if age is None:
+        return None
+    for name, min_age, max_age, _ in AGE_BUCKETS:
+        if age >= min_age and (max_age is None or age <= max_age):
+            return name
+    return None
+
+
+def make_profile_key(
+    species: str | None,
+    breed: str | None,
+    age: int | None,
+    gender: str | None,
+    is_neutered: bool | None,
+) -> str:
+    """테이블 key: 종|품종|연령대|성별|중성화 여부 (미입력 필드는 빈 문자열)"""
+    parts = (
+        _normalize_text(species),
+        _normalize_text(breed),
+        age_bucket(age) or "",
+        gender or "",
+        "" if is_neutered is None else str(is_neutered).lower(),
+    )
+    return "|".join(parts)
+
+
+def profile_key_from_state(state: VetAgentState) -> str:
+    return make_profile_key(
+        state.species,
+        state.breed,
+        state.age,
+        state.gender.value if state.gender else None,
+        state.is_neutered,
+    )
+
+
+def _has_health_condition(state: VetAgentState) -> bool:
+    condition = state.health_condition
+    return condition is not None and bool(condition.model_dump(exclude_none=True))
+
+
+def load_diagnosis_table(path: Path = TABLE_PATH) -> Dict[str, Any]:
+    """사전 계산 테이블을 최초 호출 시 1회 로드합니다. 파일이 없으면 빈 테이블을 반환합니다."""
+    global _table
+
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                if path.exists():
+                    _table = json.loads(path.read_text(encoding="utf-8"))
+                    rprint(f"✅load vet disease table: {len(_table['entries'])} entries")
+                else:
+                    _table = {"meta": {}, "entries": {}}
+    return _table
+
+
+def lookup_diseases(state: VetAgentState) -> List[DiseaseInfo] | None:
+    """사전 계산 테이블 → memo 순서로 조회합니다. 둘 다 miss이면 None을 반환합니다."""
+    profile_key = profile_key_from_state(state)
+
+    if not _has_health_condition(state):
+        entry = load_diagnosis_table()["entries"].get(profile_key)
+        if entry is not None:
+            with _stats_lock:
+                _stats["table_hits"] += 1
+            return [DiseaseInfo.model_validate(disease) for disease in entry]
+
+    memo_key = make_cache_key(
+        profile_key,
+        state.health_condition.model_dump() if state.health_condition else None,
+    )
+    diseases = _diagnosis_memo.get(memo_key)
+    with _stats_lock:
+        _stats["memo_hits" if diseases is not None else "misses"] += 1
+    if diseases is None:
+        return None
+    return [DiseaseInfo.model_validate(disease) for disease in diseases]
+
+
+def remember_diseases(
+    state: VetAgentState, diseases: List[DiseaseInfo], llm_latency_s: float
+) -> None:
+    """LLM 분석 결과를 memo에 저장하고 LLM 지연 시간을 기록합니다."""
+    memo_key = make_cache_key(
+        profile_key_from_state(state),
+        state.health_condition.model_dump() if state.health_condition else None,
+    )
+    _diagnosis_memo.set(memo_key, [disease.model_dump() for disease in diseases])
+    with _stats_lock:
+        _stats["llm_latency_s"] += llm_latency_s
+
+
+def get_vet_diagnosis_stats() -> Dict[str, Any]:
+    """
+    hit rate와 LLM 호출 생략으로 절감한 지연 시간(추정치)을 반환합니다.
+
+    절감량 = hit 수 × 평균 LLM 지연 시간 (online miss 측정값, 없으면 사전 계산 시 측정값)
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    hits = stats["table_hits"] + stats["memo_hits"]
+    total = hits + stats["misses"]
+    if stats["misses"]:
+        avg_llm_latency_s = stats["llm_latency_s"] / stats["misses"]
+    else:
+        avg_llm_latency_s = load_diagnosis_table()["meta"].get("avg_latency_s", 0.0)
+    return {
+        **stats,
+        "hit_rate": hits / total if total else 0.0,
+        "avg_llm_latency_s": avg_llm_latency_s,
+        "estimated_saved_s": hits * avg_llm_latency_s,
+    }
+
+
+# ==========================================
+# offline 사전 계산
+# ==========================================
+def iter_profiles(breeds_path: Path = BREEDS_PATH):
+    """data/breeds.yaml 기준 모든 (종, 품종, 연령대, 성별, 중성화) 조합의 대표 입력을 생성합니다."""
+    breeds_by_species = yaml.safe_load(breeds_path.read_text(encoding="utf-8"))
+    for species, breeds in breeds_by_species.items():
+        for breed, (_, _, _, age), gender, is_neutered in product(
+            breeds, AGE_BUCKETS, GENDERS, NEUTERED
+        ):
+            yield VetAgentState(
+                species=species,
+                breed=breed,
+                age=age,
+                gender=gender,
+                is_neutered=is_neutered,
+            )
+
+
+def _write_table(table: Dict[str, Any], path: Path) -> None:
+    # 중간에 중단되어도 기존 테이블이 손상되지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(table, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+    )
+    tmp_path.replace(path)
+
+
+async def precompute_table(
+    path: Path = TABLE_PATH,
+    concurrency: int = 8,
+    limit: int | None = None,
+) -> Dict[str, Any]:
+    """누락된 조합만 LLM으로 분석하여 테이블에 추가합니다."""
+    from app.agents.vet_agent.model.model import get_llm, load_config
+    from app.agents.vet_agent.nodes.vet_diagnosis_node import _build_prompt
+
+    table = (
+        json.loads(path.read_text(encoding="utf-8"))
+        if path.exists()
+        else {"meta": {}, "entries": {}}
+    )
+    entries = table["entries"]
+    pending = [
+        state for state in iter_profiles() if profile_key_from_state(state) not in entries
+    ][:limit]
+    rprint(f"🚀precompute start: {len(pending)} profiles (cached: {len(entries)})")
+
+    structured_llm = get_llm(VetAgentOutputState)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def _worker(state: VetAgentState):
+        nonlocal failures
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                result = await structured_llm.ainvoke(_build_prompt(state))
+            except Exception as e:
+                failures += 1
+                rprint(f"❗️{profile_key_from_state(state)}: {e}")
+                return
+            latencies.append(time.perf_counter() - start_time)
+            entries[profile_key_from_state(state)] = [
+                disease.model_dump() for disease in result.diseases
+            ]
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(_worker(state) for state in pending))
+    elapsed = time.perf_counter() - start_time
+
+    if latencies:
+        # 기존 평균과 이번 측정값을 entry 수 기준으로 합산
+        prev_count = table["meta"].get("latency_samples", 0)
+        prev_avg = table["meta"].get("avg_latency_s", 0.0)
+        count = prev_count + len(latencies)
+        table["meta"]["avg_latency_s"] = (prev_avg * prev_count + sum(latencies)) / count
+        table["meta"]["latency_samples"] = count
+    table["meta"]["model"] = load_config()["model"]
+    table["meta"]["age_buckets"] = [list(bucket) for bucket in AGE_BUCKETS]
+    _write_table(table, path)
+
+    rprint(
+        f"✅precompute complete: {len(latencies)} added, {failures} failed, "
+        f"{len(entries)} total (elapsed: {elapsed:.2f}s)"
+    )
+    return table
+
+
+def report(sample_dir: Path) -> None:
+    """샘플 입력을 테이블 조회 경로로 재생하여 hit rate와 지연 시간 절감량을 출력합니다."""
+    from pydantic import ValidationError
+
+    from app.agents.user_input_template_agent.utils.cli import load_state_from_yaml
+
+    skipped = 0
+    for yaml_path in sorted(sample_dir.glob("*.yaml")):
+        try:
+            state = load_state_from_yaml(yaml_path, VetAgentState)
+        except ValidationError:
+            skipped += 1
+            continue
+        if state.species:
+            lookup_diseases(state)
+    if skipped:
+        rprint(f"⚠️skipped {skipped} invalid samples")
+
+    stats = get_vet_diagnosis_stats()
+    table = Table(title=f"vet diagnosis lookup ({sample_dir})")
+    for column in ("table hits", "misses", "hit rate", "avg LLM (s)", "saved (s)"):
+        table.add_column(column, justify="right")
+    table.add_row(
+        str(stats["table_hits"]),
+        str(stats["misses"]),
+        f"{stats['hit_rate']:.1%}",
+        f"{stats['avg_llm_latency_s']:.2f}",
+        f"{stats['estimated_saved_s']:.1f}",
+    )
+    rprint(table)
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Vet diagnosis precomputed table")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    precompute_parser = subparsers.add_parser("precompute", help="누락된 조합 사전 계산")
+    precompute_parser.add_argument("--concurrency", type=int, default=8, help="동시 LLM 호출 수")
+    precompute_parser.add_argument(
+        "--limit", type=int, default=None, help="이번 실행에서 계산할 최대 조합 수"
+    )
+
+    report_parser = subparsers.add_parser("report", help="샘플 입력 기준 hit rate 리포트")
+    report_parser.add_argument(
+        "--sample-dir",
+        default="app/agents/user_input_template_agent/samples/naver",
+        help="입력 YAML 디렉토리",
+    )
+    return parser
+
+
+def main():
+    args = create_arg_parser().parse_args()
+    if args.command == "precompute":
+        asyncio.run(precompute_table(concurrency=args.concurrency, limit=args.limit))
+    else:
+        report(Path(args.sample_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
 from app.agents.user_input_template_agent.state import UserInputTemplateState
-from app.agents.vet_agent.nodes import vet_diagnosis_node
+from app.agents.vet_agent.nodes import avet_diagnosis_node, vet_diagnosis_node
 from app.agents.vet_agent.state import VetAgentOutputState, VetAgentState
 
 builder = StateGraph(
@@ -10,7 +11,10 @@ builder = StateGraph(
     output_schema=VetAgentOutputState,
 )
 
-builder.add_node("vet_diagnosis", vet_diagnosis_node)
+# invoke/stream은 동기 함수, ainvoke/astream은 비동기 함수로 실행
+builder.add_node(
+    "vet_diagnosis", RunnableLambda(vet_diagnosis_node, afunc=avet_diagnosis_node)
+)
 builder.add_edge(START, "vet_diagnosis")
 builder.add_edge("vet_diagnosis", END)
 
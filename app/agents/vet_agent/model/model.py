@@ -1,34 +1,29 @@
 from pathlib import Path
-import yaml
+
 from dotenv import load_dotenv
-from langchain.chat_models import init_chat_model
+from pydantic import BaseModel
+
+from app.agents.llm_registry import get_chat_model, get_profile_config
 
 ENV_PATH = Path(__file__).parents[4] / ".env"
-CONFIG_PATH = Path(__file__).parent / "model.yaml"
+LLM_PROFILE = "vet_diagnosis"
 
 load_dotenv(ENV_PATH)
 
 
-def load_config(path: Path = CONFIG_PATH) -> dict:
-    """model.yaml에서 모델 설정을 불러옵니다."""
-    return yaml.safe_load(path.read_text())
-
+def load_config() -> dict:
+    """app/agents/llm.yaml의 vet_diagnosis profile 설정을 불러옵니다."""
+    return get_profile_config(LLM_PROFILE)
 
-def create_llm(config: dict | None = None):
-    """설정 기반으로 LLM 인스턴스를 생성합니다."""
-    if config is None:
-        config = load_config()
-    return init_chat_model(
-        model=config["model"],
-        temperature=config.get("temperature", 0.1),
-    )
 
+def get_llm(schema: type[BaseModel] | None = None):
+    """vet_diagnosis profile의 공용 LLM client를 반환합니다. (최초 호출 시 1회 생성)"""
+    return get_chat_model(LLM_PROFILE, schema=schema)
 
-llm = create_llm()
 
 if __name__ == "__main__":
     from rich import print as rprint
 
     config = load_config()
     rprint(config)
-    rprint(llm)
+    rprint(get_llm())
@@ -1 +1,4 @@
-from app.agents.vet_agent.nodes.vet_diagnosis_node import vet_diagnosis_node
+from app.agents.vet_agent.nodes.vet_diagnosis_node import (
+    avet_diagnosis_node,
+    vet_diagnosis_node,
+)
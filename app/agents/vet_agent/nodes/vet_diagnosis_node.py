@@ -1,25 +1,52 @@
 import json
+import time
 
-from app.agents.vet_agent.model.model import llm
+from app.agents.vet_agent.diagnosis_table import lookup_diseases, remember_diseases
+from app.agents.vet_agent.model.model import get_llm
 from app.agents.vet_agent.state import VetAgentOutputState, VetAgentState
 
 
-def vet_diagnosis_node(state: VetAgentState) -> dict:
-    """반려동물 취약 질병 정보를 LLM으로 분석하는 노드"""
-    structured_llm = llm.with_structured_output(VetAgentOutputState)
+def _build_prompt(state: VetAgentState) -> str:
     input_summary = json.dumps(
         state.model_dump(exclude={"diseases"}, exclude_none=True),
         ensure_ascii=False,
         indent=2,
     )
-    result = structured_llm.invoke(
-        f"""당신은 수의사입니다.
+    return f"""당신은 수의사입니다.
 다음 반려동물 정보를 기반으로 해당 반려동물이 잘 걸리는 질병을 분석해주세요.
 각 질병에 대해 질병명, 발병률, 발병시기를 포함해주세요.
 
 반려동물 정보:
 {input_summary}"""
-    )
+
+
+def vet_diagnosis_node(state: VetAgentState) -> dict:
+    """
+    반려동물 취약 질병 정보를 분석하는 노드
+
+    사전 계산 테이블/memo에 같은 프로필이 있으면 LLM을 호출하지 않습니다. (diagnosis_table.py 참고)
+    """
+    diseases = lookup_diseases(state)
+    if diseases is not None:
+        return {"diseases": diseases}
+
+    start_time = time.perf_counter()
+    structured_llm = get_llm(VetAgentOutputState)
+    result = structured_llm.invoke(_build_prompt(state))
+    remember_diseases(state, result.diseases, time.perf_counter() - start_time)
+    return {"diseases": result.diseases}
+
+
+async def avet_diagnosis_node(state: VetAgentState) -> dict:
+    """vet_diagnosis_node의 비동기 버전"""
+    diseases = lookup_diseases(state)
+    if diseases is not None:
+        return {"diseases": diseases}
+
+    start_time = time.perf_counter()
+    structured_llm = get_llm(VetAgentOutputState)
+    result = await structured_llm.ainvoke(_build_prompt(state))
+    remember_diseases(state, result.diseases, time.perf_counter() - start_time)
     return {"diseases": result.diseases}
 
 
@@ -0,0 +1,277 @@
+"""POST /recommendations 부하 테스트.
+
+기본 모드는 LLM/임베딩/Qdrant 호출 노드를 지연 시간만 흉내 내는 stub 노드로 교체한
+그래프를 앱에 주입하고, ASGI transport로 요청을 보내 API 계층의 처리량을 측정한다.
+`--url`을 지정하면 실행 중인 서버(실제 LLM 사용)에 요청한다.
+
+실행 예시:
+    uv run python -m app.api.load_test --requests 500 --concurrency 100
+    uv run python -m app.api.load_test --llm-latency-ms 800 --concurrency 200
+    uv run python -m app.api.load_test --url http://localhost:8000 --requests 20
+
+stub 모드에서는 부하 테스트 후 같은 thread_id로 --returning-turns번 재요청하여
+재방문 사용자의 체크포인트(namespace 수, 체크포인트 수)가 턴 수와 무관하게 일정한지 확인한다.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langgraph.graph import END, START, StateGraph
+from rich import print as rprint
+from rich.table import Table
+
+from app.agents.composer_agent.constants import WRITER_STREAM_TAG
+from app.agents.orchestrator.checkpointer import create_memory_checkpointer
+from app.agents.orchestrator.nodes import route_after_user_input
+from app.agents.orchestrator.state.orchestrator_state import OrchestratorState
+from app.agents.user_input_template_agent.graph import graph as user_input_graph
+from app.agents.user_input_template_agent.utils.cli import load_state_from_yaml
+from app.agents.user_input_template_agent.state import UserInputTemplateState
+from app.agents.vet_agent.state import DiseaseInfo
+from app.main import create_app
+
+DEFAULT_INPUT = "app/agents/user_input_template_agent/samples/user_input_all.yaml"
+STUB_FINAL_MESSAGE = " ".join(["추천"] * 50)
+
+
+class _StreamingStubChatModel(GenericFakeChatModel):
+    """토큰 사이에 지연을 두고 스트리밍하는 stub LLM"""
+
+    token_delay_s: float = 0.0
+
+    async def _astream(self, *args, **kwargs):
+        async for chunk in super()._astream(*args, **kwargs):
+            await asyncio.sleep(self.token_delay_s)
+            yield chunk
+
+
+def build_stub_orchestrator_graph(llm_latency_s: float):
+    """Orchestrator와 같은 노드 구성이지만 외부 호출 노드는 asyncio.sleep으로 대체한 그래프"""
+
+    async def vet_diagnosis(state: OrchestratorState) -> dict:
+        await asyncio.sleep(llm_latency_s)
+        return {
+            "diseases": [
+                DiseaseInfo(name="슬개골 탈구", incidence_rate="높음", onset_period="전 연령")
+            ]
+        }
+
+    async def rag(state: OrchestratorState) -> dict:
+        await asyncio.sleep(llm_latency_s / 4)  # 임베딩 + 검색
+        return {"user_query": "stub", "retrieved_documents": []}
+
+    async def save_recommendation(state: OrchestratorState) -> dict:
+        return {}
+
+    async def judge(state: OrchestratorState) -> dict:
+        await asyncio.sleep(llm_latency_s)
+        return {"validation_result": {"selected_policies": [], "review_summary": "stub"}}
+
+    async def composer(state: OrchestratorState) -> dict:
+        # 첫 토큰까지 지연(llm_latency_s / 4) 후 나머지 시간 동안 토큰 단위 스트리밍
+        await asyncio.sleep(llm_latency_s / 4)
+        llm = _StreamingStubChatModel(
+            messages=iter([STUB_FINAL_MESSAGE]),
+            token_delay_s=llm_latency_s * 3 / 4 / len(STUB_FINAL_MESSAGE.split(" ")),
+        ).with_config(tags=[WRITER_STREAM_TAG])
+        message = await llm.ainvoke("stub")
+        return {"final_message": message.content}
+
+    graph_builder = StateGraph(OrchestratorState)
+    graph_builder.add_node("user_input_template", user_input_graph)
+    graph_builder.add_node("vet_diagnosis", vet_diagnosis)
+    graph_builder.add_node("RAG", rag)
+    graph_builder.add_node("save_recommendation", save_recommendation)
+    graph_builder.add_node("judge", judge)
+    graph_builder.add_node("composer", composer)
+
+    graph_builder.add_edge(START, "user_input_template")
+    graph_builder.add_conditional_edges(
+        "user_input_template",
+        route_after_user_input,
+        ["vet_diagnosis", "RAG", END],
+    )
+    graph_builder.add_edge("vet_diagnosis", "save_recommendation")
+    graph_builder.add_edge("RAG", "save_recommendation")
+    graph_builder.add_edge("save_recommendation", "judge")
+    graph_builder.add_edge("judge", "composer")
+    graph_builder.add_edge("composer", END)
+
+    return graph_builder.compile(checkpointer=create_memory_checkpointer())
+
+
+async def _send_request(
+    client: httpx.AsyncClient, payload: dict, params: dict | None = None
+) -> tuple[float, float | None, bool]:
+    """
+    (전체 지연 시간, TTFT, 성공 여부)를 반환합니다.
+
+    httpx.ASGITransport는 응답 본문을 모두 모은 뒤 반환하므로 클라이언트에서 첫 token 도착
+    시각을 측정할 수 없어, TTFT는 result 이벤트의 서버 측정값(metrics.ttft_ms)을 사용합니다.
+    """
+    start = time.perf_counter()
+    ttft = None
+    ok = False
+    event = None
+    async with client.stream(
+        "POST", "/recommendations", json=payload, params=params
+    ) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: ") :]
+                if event == "result":
+                    ok = True
+                elif event == "error":
+                    ok = False
+            elif line.startswith("data: ") and event == "result":
+                ttft_ms = json.loads(line[len("data: ") :])["metrics"]["ttft_ms"]
+                ttft = ttft_ms / 1000 if ttft_ms is not None else None
+    return time.perf_counter() - start, ttft, ok and response.status_code == 200
+
+
+async def run_load_test(
+    client: httpx.AsyncClient, payload: dict, total: int, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    ttfts: list[float] = []
+    failures = 0
+
+    async def _worker():
+        nonlocal failures
+        async with semaphore:
+            latency, ttft, ok = await _send_request(client, payload)
+            latencies.append(latency)
+            if ttft is not None:
+                ttfts.append(ttft)
+            if not ok:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+
+    def _pct(values: list[float], q: float) -> str:
+        if not values:
+            return "-"
+        ordered = sorted(values)
+        return f"{ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000:.1f}"
+
+    table = Table(title=f"POST /recommendations (n={total}, concurrency={concurrency})")
+    for column in (
+        "p50 (ms)",
+        "p95 (ms)",
+        "p99 (ms)",
+        "mean (ms)",
+        "TTFT p50 (ms)",
+        "TTFT p95 (ms)",
+        "RPS",
+        "failures",
+    ):
+        table.add_column(column, justify="right")
+    table.add_row(
+        _pct(latencies, 0.50),
+        _pct(latencies, 0.95),
+        _pct(latencies, 0.99),
+        f"{statistics.mean(latencies) * 1000:.1f}",
+        _pct(ttfts, 0.50),
+        _pct(ttfts, 0.95),
+        f"{total / elapsed:.1f}",
+        str(failures),
+    )
+    rprint(table)
+
+
+async def check_returning_user_checkpoints(
+    client: httpx.AsyncClient, payload: dict, checkpointer, turns: int
+) -> None:
+    """같은 thread_id로 반복 요청해도 thread의 체크포인트가 늘어나지 않는지 확인합니다."""
+    thread_id = "load-test-returning-user"
+    sizes: list[tuple[int, int]] = []
+    for _ in range(turns):
+        _, _, ok = await _send_request(
+            client, payload, params={"thread_id": thread_id}
+        )
+        assert ok, "returning user request failed"
+        namespaces = checkpointer.storage[thread_id]
+        sizes.append(
+            (len(namespaces), sum(len(checkpoints) for checkpoints in namespaces.values()))
+        )
+
+    max_checkpoints = checkpointer.max_checkpoints_per_thread
+    namespaces_count, checkpoints_count = sizes[-1]
+    rprint(
+        f"returning user ({turns} turns): namespaces={namespaces_count}, "
+        f"checkpoints={checkpoints_count}"
+    )
+    # 턴이 끝나면 root namespace만 남고, 체크포인트 수는 상한을 넘지 않아야 함
+    assert namespaces_count == 1, f"subgraph namespaces left: {namespaces_count}"
+    if max_checkpoints is not None:
+        assert all(count <= max_checkpoints for _, count in sizes), sizes
+    rprint("✅returning user checkpoints bounded")
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load test POST /recommendations.")
+    parser.add_argument("--input", default=DEFAULT_INPUT, help="요청 본문 YAML 경로")
+    parser.add_argument("--requests", type=int, default=200, help="전체 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=500,
+        help="stub LLM 노드 1회 호출 지연 시간(ms)",
+    )
+    parser.add_argument(
+        "--url", default=None, help="실행 중인 서버 주소 (지정 시 stub 미사용)"
+    )
+    parser.add_argument(
+        "--returning-turns",
+        type=int,
+        default=20,
+        help="같은 thread_id로 재요청할 횟수 (stub 모드, 0이면 미실행)",
+    )
+    return parser
+
+
+async def main():
+    args = create_arg_parser().parse_args()
+    payload = load_state_from_yaml(Path(args.input), UserInputTemplateState).model_dump(
+        mode="json", exclude_none=True
+    )
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=None)
+    else:
+        app = create_app(
+            orchestrator_graph=build_stub_orchestrator_graph(args.llm_latency_ms / 1000)
+        )
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://loadtest",
+            timeout=None,
+        )
+
+    async with client:
+        await run_load_test(client, payload, args.requests, args.concurrency)
+        if not args.url and args.returning_turns:
+            await check_returning_user_checkpoints(
+                client,
+                payload,
+                app.state.orchestrator_graph.checkpointer,
+                args.returning_turns,
+            )
+
+    if not args.url:
+        # 요청마다 새 thread_id가 생성되므로 thread eviction 동작을 확인할 수 있음
+        rprint("checkpointer stats:", app.state.orchestrator_graph.checkpointer.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
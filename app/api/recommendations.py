@@ -0,0 +1,122 @@
+"""
+보험 추천 API
+
+POST /recommendations
+    - 요청 본문을 UserInputTemplateState로 검증한 뒤 Orchestrator 그래프를 비동기 실행한다.
+    - 노드 단위 진행 결과(`updates`)를 Server-Sent Events로 스트리밍한다.
+
+SSE 이벤트 종류:
+    - update: 노드 1개 완료 시 {"node": ..., "update": ...}
+    - token: 최종 메시지(composer writer) 생성 토큰 {"content": ...}
+    - result: 파이프라인 종료 후 최종 결과 + metrics(ttft_ms, total_ms)
+    - error: 실행 중 예외 발생
+"""
+
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from app.agents.orchestrator.orchestrator_graph import (
+    TOKEN_STREAM_MODES,
+    to_pipeline_event,
+)
+from app.agents.user_input_template_agent.state import UserInputTemplateState
+from app.agents.user_input_template_agent.utils.cli import make_config
+
+router = APIRouter(tags=["recommendations"])
+
+# 최종 결과 이벤트에 포함할 OrchestratorState 필드
+RESULT_FIELDS = (
+    "diseases",
+    "validation_result",
+    "final_message",
+    "is_blocked",
+    "blocked_reason",
+)
+
+
+async def get_orchestrator_graph(request: Request):
+    """
+    app.state에 주입된 그래프를 우선 사용하고, 없으면 Orchestrator 그래프를 사용합니다.
+
+    API는 astream으로 실행하므로 async 체크포인터로 컴파일한 그래프(aget_graph)를 사용합니다.
+    """
+    graph = getattr(request.app.state, "orchestrator_graph", None)
+    if graph is None:
+        from app.agents.orchestrator.orchestrator_graph import aget_graph
+
+        graph = await aget_graph()
+        request.app.state.orchestrator_graph = graph
+    return graph
+
+
+def format_sse(event: str, data: Any) -> str:
+    payload = json.dumps(jsonable_encoder(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def stream_recommendation_events(
+    graph, state: dict, config: dict
+) -> AsyncIterator[str]:
+    start_time = time.perf_counter()
+    ttft_ms = None
+    try:
+        async for chunk in graph.astream(
+            state, config=config, stream_mode=TOKEN_STREAM_MODES, subgraphs=True
+        ):
+            event = to_pipeline_event(chunk)
+            if event is None:
+                continue
+
+            kind, data = event
+            if kind == "token":
+                if ttft_ms is None:
+                    ttft_ms = (time.perf_counter() - start_time) * 1000
+                yield format_sse("token", {"content": data})
+                continue
+            for node_name, update in data.items():
+                yield format_sse("update", {"node": node_name, "update": update})
+
+        snapshot = await graph.aget_state(config)
+        result = {
+            field: snapshot.values.get(field)
+            for field in RESULT_FIELDS
+            if field in snapshot.values
+        }
+        result["thread_id"] = config["configurable"]["thread_id"]
+        # TTFT: 요청 시작 → 최종 메시지 첫 토큰 (차단 등으로 composer 미실행 시 None)
+        result["metrics"] = {
+            "ttft_ms": ttft_ms,
+            "total_ms": (time.perf_counter() - start_time) * 1000,
+        }
+        yield format_sse("result", result)
+    except Exception as e:
+        yield format_sse("error", {"type": type(e).__name__, "message": str(e)})
+
+
+@router.post("/recommendations")
+async def create_recommendation(
+    user_input: UserInputTemplateState,
+    request: Request,
+    thread_id: str | None = None,
+) -> StreamingResponse:
+    """
+    보험 상품 추천을 실행하고 진행 상황을 SSE로 스트리밍합니다.
+
+    같은 thread_id로 다시 요청하면 체크포인터에 저장된 이전 상태(diseases 등)를 이어서 사용합니다.
+    """
+    graph = await get_orchestrator_graph(request)
+    config = make_config(thread_id or str(uuid.uuid4()))
+    # 요청에 명시된 필드만 전달하여 체크포인터 상태를 덮어쓰지 않도록 함
+    state = user_input.model_dump(exclude_unset=True)
+
+    return StreamingResponse(
+        stream_recommendation_events(graph, state, config),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
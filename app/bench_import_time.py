@@ -0,0 +1,115 @@
+"""모듈 cold import 시간 벤치마크 (`python -X importtime` 기반).
+
+uvicorn worker 기동과 Streamlit rerun 시 비용이 되는 진입 모듈의 import 시간을 측정한다.
+각 모듈은 새 프로세스에서 측정하므로 이전 import 캐시의 영향을 받지 않는다.
+
+실행 예시:
+    uv run python -m app.bench_import_time
+    uv run python -m app.bench_import_time --budget-ms 500 --top 15
+    uv run python -m app.bench_import_time --module app.agents.orchestrator.orchestrator_graph
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich import print as rprint
+from rich.table import Table
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULES = [
+    "app.main",
+    "app.agents.orchestrator.orchestrator_graph",
+]
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_import_time(module: str) -> list[ImportTime]:
+    """새 인터프리터에서 module을 import하고 `-X importtime` 출력을 파싱합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "0"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    records: list[ImportTime] = []
+    for line in completed.stderr.splitlines():
+        # import time:       self [us] |  cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        records.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return records
+
+
+def report(module: str, top: int) -> float:
+    records = measure_import_time(module)
+    target = next((r for r in reversed(records) if r.module == module), None)
+    total_ms = target.cumulative_us / 1000 if target else 0.0
+
+    table = Table(title=f"{module} cold import: {total_ms:.1f} ms")
+    table.add_column("module")
+    table.add_column("self (ms)", justify="right")
+    table.add_column("cumulative (ms)", justify="right")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        table.add_row(
+            record.module,
+            f"{record.self_us / 1000:.1f}",
+            f"{record.cumulative_us / 1000:.1f}",
+        )
+    rprint(table)
+    return total_ms
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark cold import time.")
+    parser.add_argument(
+        "--module",
+        action="append",
+        help=f"측정할 모듈 (반복 지정 가능, 기본값: {', '.join(DEFAULT_MODULES)})",
+    )
+    parser.add_argument("--top", type=int, default=10, help="self 시간 상위 N개 출력")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="모듈별 허용 import 시간(ms). 초과 시 exit code 1",
+    )
+    return parser
+
+
+def main() -> int:
+    args = create_arg_parser().parse_args()
+    exceeded = []
+    for module in args.module or DEFAULT_MODULES:
+        total_ms = report(module, args.top)
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            exceeded.append(f"{module} ({total_ms:.1f} ms)")
+
+    if exceeded:
+        rprint(f"❗️import time budget({args.budget_ms} ms) exceeded: {', '.join(exceeded)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
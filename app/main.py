@@ -1,19 +1,48 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from app.agents.orchestrator.orchestrator_graph import run_test_orchestration
+from app.api.recommendations import router as recommendations_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # APP_WARMUP=1 이면 첫 요청 전에 그래프 컴파일/클라이언트 초기화를 수행
+    if os.getenv("APP_WARMUP") == "1" and app.state.orchestrator_graph is None:
+        from app.agents.orchestrator.orchestrator_graph import aget_graph, warmup
+
+        await asyncio.to_thread(warmup)
+        app.state.orchestrator_graph = await aget_graph()
+    yield
+    # async 체크포인터(sqlite/postgres) 연결 정리
+    from app.agents.orchestrator.orchestrator_graph import aclose_graph
 
+    await aclose_graph()
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="Pet Insurance Recommender")
+
+def create_app(orchestrator_graph=None) -> FastAPI:
+    """
+    Args:
+        orchestrator_graph: 추천 API에서 실행할 그래프.
+            None이면 첫 요청 시 Orchestrator 그래프를 사용합니다. (부하 테스트 시 stub 그래프 주입)
+    """
+    app = FastAPI(title="Pet Insurance Recommender", lifespan=lifespan)
+    app.state.orchestrator_graph = orchestrator_graph
 
     @app.get("/health")
     def health() -> dict[str, str]:
         return {"status": "ok"}
 
-    @app.get("/test")
-    def test() -> dict[str, str]:
-        message = run_test_orchestration()
-        return {"message": message}
+    @app.get("/metrics/llm")
+    def llm_metrics() -> dict:
+        """모델별 LLM 호출 수/오류 수/동시 실행 수/지연 시간 histogram"""
+        from app.agents.llm_registry import get_llm_stats
+
+        return get_llm_stats()
+
+    app.include_router(recommendations_router)
 
     return app
 
@@ -1,7 +1,20 @@
+import argparse
+import os
+
 from app.main import app
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    parser = argparse.ArgumentParser(description="Run FastAPI server.")
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="서버 시작 시 그래프 컴파일 및 클라이언트 초기화 수행",
+    )
+    args = parser.parse_args()
+    if args.warmup:
+        os.environ["APP_WARMUP"] = "1"
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
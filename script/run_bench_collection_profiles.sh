@@ -0,0 +1,3 @@
+#!/bin/bash
+# collection 프로파일(quantization/on-disk/HNSW)별 recall@k, 검색 지연 시간, RAM 추정치 비교
+uv run python -m app.agents.document_parser.bench_collection_profiles "$@"
@@ -0,0 +1,3 @@
+#!/bin/bash
+# 진입 모듈 cold import 시간 측정 (python -X importtime)
+uv run python -m app.bench_import_time "$@"
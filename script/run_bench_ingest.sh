@@ -0,0 +1,3 @@
+#!/bin/bash
+# 적재 경로(add_documents vs batch 임베딩 동시 실행 + 병렬 upsert) 처리량/time-to-first-upsert 비교
+uv run python -m app.agents.document_parser.bench_ingest "$@"
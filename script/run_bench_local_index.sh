@@ -0,0 +1,3 @@
+#!/bin/bash
+# 로컬 벡터 검색 엔진(argsort vs argpartition, float32 vs float16, mmap, batch) 지연 시간/메모리 비교
+uv run python -m app.agents.rag_agent.bench_local_index "$@"
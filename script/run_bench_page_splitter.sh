@@ -0,0 +1,3 @@
+#!/bin/bash
+# 페이지 분리(BeautifulSoup descendants 순회 vs html.parser event 1회 순회) 처리 시간 비교 (기본: 가장 큰 약관 파일)
+uv run python -m app.agents.document_parser.bench_page_splitter "$@"
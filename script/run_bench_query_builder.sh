@@ -0,0 +1,3 @@
+#!/bin/bash
+# 질의 생성 방식(template vs llm) 지연 시간/검색 recall 비교
+uv run python -m app.agents.rag_agent.bench_query_builder "$@"
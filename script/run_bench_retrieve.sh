@@ -0,0 +1,3 @@
+#!/bin/bash
+# 검색 경로(legacy QdrantVectorStore vs native query_points REST/gRPC/async) 지연 시간/payload 크기 비교
+uv run python -m app.agents.rag_agent.bench_retrieve "$@"
@@ -0,0 +1,3 @@
+#!/bin/bash
+# POST /recommendations 부하 테스트 (stub LLM, p50/p95/p99 및 RPS 측정)
+uv run python -m app.api.load_test "$@"
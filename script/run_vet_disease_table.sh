@@ -0,0 +1,3 @@
+#!/bin/bash
+# 품종별 취약 질병 테이블 사전 계산(precompute) / hit rate 리포트(report)
+uv run python -m app.agents.vet_agent.diagnosis_table "$@"
@@ -1,10 +1,15 @@
 """반려동물 보험 추천 시스템 - Streamlit 데모 UI"""
 
+import time
 import uuid
 
 import streamlit as st
 
-from app.agents.orchestrator.orchestrator_graph import graph
+from app.agents.orchestrator.orchestrator_graph import (
+    TOKEN_STREAM_MODES,
+    get_graph,
+    to_pipeline_event,
+)
 from app.agents.user_input_template_agent.utils.cli import make_config
 from app.agents.user_input_template_agent.state.user_input_template_state import (
     Insurer,
@@ -21,6 +26,7 @@ if "pet_locked" not in st.session_state:
     st.session_state.pet_locked = False
     st.session_state.pet_info = {}
     st.session_state.last_result = None
+    st.session_state.last_metrics = None
     st.session_state.thread_id = str(uuid.uuid4())
 
 locked = st.session_state.pet_locked
@@ -63,6 +69,7 @@ if reset_btn:
     st.session_state.pet_locked = False
     st.session_state.pet_info = {}
     st.session_state.last_result = None
+    st.session_state.last_metrics = None
     st.session_state.thread_id = str(uuid.uuid4())
     st.rerun()
 
@@ -144,19 +151,43 @@ with col_result:
             "composer": "추천 메시지 작성",
         }
 
+        graph = get_graph()  # 최초 실행 시 1회 컴파일, 이후 rerun에서는 재사용
         config = make_config(thread_id=st.session_state.thread_id)
-        with st.status("파이프라인 실행 중...", expanded=True) as status:
-            for chunk in graph.stream(state_dict, config=config, stream_mode="updates"):
-                for node_name in chunk:
-                    label = NODE_LABELS.get(node_name, node_name)
-                    status.update(label=f"{label} 진행 중...")
-                    st.write(f"[완료] {label}")
-            status.update(label="실행 완료", state="complete")
+        status = st.status("파이프라인 실행 중...", expanded=True)
+        # 최종 메시지는 composer(writer)가 생성하는 토큰 단위로 바로 표시
+        message_placeholder = st.empty()
+        tokens: list[str] = []
+        start_time = time.perf_counter()
+        ttft_s = None
+        for chunk in graph.stream(
+            state_dict, config=config, stream_mode=TOKEN_STREAM_MODES, subgraphs=True
+        ):
+            event = to_pipeline_event(chunk)
+            if event is None:
+                continue
+
+            kind, data = event
+            if kind == "token":
+                if ttft_s is None:
+                    ttft_s = time.perf_counter() - start_time
+                    status.update(label="추천 메시지 작성 중...", expanded=False)
+                tokens.append(data)
+                message_placeholder.markdown("".join(tokens) + "▌")
+                continue
+            for node_name in data:
+                label = NODE_LABELS.get(node_name, node_name)
+                status.update(label=f"{label} 진행 중...")
+                status.write(f"[완료] {label}")
+        status.update(label="실행 완료", state="complete")
 
         result = graph.get_state(config).values
 
         # 결과 저장
         st.session_state.last_result = result
+        st.session_state.last_metrics = {
+            "ttft_s": ttft_s,
+            "total_s": time.perf_counter() - start_time,
+        }
 
         # 첫 실행 시 반려동물 정보 + 건강 상태 잠금
         if not locked:
@@ -209,5 +240,10 @@ with col_result:
         if final:
             st.markdown("#### 최종 추천 메시지")
             st.success(final)
+
+        metrics = st.session_state.get("last_metrics")
+        if metrics:
+            ttft = f"{metrics['ttft_s']:.2f}s" if metrics["ttft_s"] is not None else "-"
+            st.caption(f"첫 토큰까지 {ttft} · 전체 {metrics['total_s']:.2f}s")
     else:
         st.info("왼쪽에서 정보를 입력하고 '추천 실행' 버튼을 눌러주세요.")